@@ -317,6 +317,7 @@ async def generate_hypotheses(request: GenerateHypothesesRequest, _auth: bool =
 
         # Save hypotheses to database
         saved_hypotheses = []
+        hypothesis_events = []
         for rank, candidate in enumerate(candidates, 1):
             hypothesis = await Hypothesis.objects.acreate(
                 incident_id=request.incident_id,
@@ -333,22 +334,24 @@ async def generate_hypotheses(request: GenerateHypothesesRequest, _auth: bool =
                 "rank": hypothesis.rank
             })
 
-            # Publish hypothesis.generated event to WebSocket
-            try:
-                await redis_publisher.publish_hypothesis_generated(
-                    hypothesis_data={
-                        "id": str(hypothesis.id),
-                        "incident_id": request.incident_id,
-                        "claim": hypothesis.claim,
-                        "description": hypothesis.description,
-                        "confidence_score": hypothesis.confidence_score,
-                        "rank": hypothesis.rank,
-                        "supporting_evidence": hypothesis.supporting_evidence
-                    },
-                    tenant_id=str(incident.tenant_id)
-                )
-            except Exception as e:
-                logger.warning("Failed to publish hypothesis.generated event: %s", e)
+            hypothesis_events.append({
+                "id": str(hypothesis.id),
+                "incident_id": request.incident_id,
+                "claim": hypothesis.claim,
+                "description": hypothesis.description,
+                "confidence_score": hypothesis.confidence_score,
+                "rank": hypothesis.rank,
+                "supporting_evidence": hypothesis.supporting_evidence
+            })
+
+        # Publish hypothesis.generated events to WebSocket
+        try:
+            await redis_publisher.publish_hypotheses_generated(
+                hypotheses_data=hypothesis_events,
+                tenant_id=str(incident.tenant_id)
+            )
+        except Exception as e:
+            logger.warning("Failed to publish hypothesis.generated events: %s", e)
 
         # OPTIMIZATION 3: Track token usage and cost
         if not USE_MOCK:
@@ -546,6 +549,7 @@ Focus on common SRE issues: resource exhaustion, config errors, dependency failu
             hypotheses_data = incident_result.get("hypotheses", [])
 
             saved_hypotheses = []
+            hypothesis_events = []
             for rank, h in enumerate(hypotheses_data, 1):
                 hypothesis = await Hypothesis.objects.acreate(
                     incident=incident,
@@ -562,19 +566,21 @@ Focus on common SRE issues: resource exhaustion, config errors, dependency failu
                     "rank": hypothesis.rank
                 })
 
-                # Publish to WebSocket
-                await redis_publisher.publish_hypothesis_generated(
-                    hypothesis_data={
-                        "id": str(hypothesis.id),
-                        "incident_id": str(incident.id),
-                        "claim": hypothesis.claim,
-                        "description": hypothesis.description,
-                        "confidence_score": hypothesis.confidence_score,
-                        "rank": hypothesis.rank,
-                        "supporting_evidence": hypothesis.supporting_evidence
-                    },
-                    tenant_id=str(incident.tenant_id)
-                )
+                hypothesis_events.append({
+                    "id": str(hypothesis.id),
+                    "incident_id": str(incident.id),
+                    "claim": hypothesis.claim,
+                    "description": hypothesis.description,
+                    "confidence_score": hypothesis.confidence_score,
+                    "rank": hypothesis.rank,
+                    "supporting_evidence": hypothesis.supporting_evidence
+                })
+
+            # Publish to WebSocket
+            await redis_publisher.publish_hypotheses_generated(
+                hypotheses_data=hypothesis_events,
+                tenant_id=str(incident.tenant_id)
+            )
 
             results.append({
                 "incident_id": str(incident.id),
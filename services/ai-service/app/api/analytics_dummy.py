@@ -114,49 +114,6 @@ async def get_cost_summary_dummy(days: int = Query(7)):
     total_incidents = random.randint(100, 300)
     cache_hit_rate = random.uniform(75, 95)
 
-    return {
-        "time_period_days": days,
-        "overall_stats": {
-            "total_requests": total_requests,
-            "total_cost_usd": total_cost,
-            "total_tokens": random.randint(80000, 200000),
-            "avg_cost_per_request": total_cost / total_requests
-        },
-        "cache_stats": {
-            "total_incidents": total_incidents,
-            "cache_hit_rate": cache_hit_rate,
-            "potential_savings": total_cost * (cache_hit_rate / 100)
-        },
-        "most_expensive_incidents": [
-            {
-                "incident_id": f"inc-{i}",
-                "incident_title": f"High CPU on payment-service-{i}",
-                "total_cost_usd": random.uniform(0.005, 0.02),
-                "total_requests": random.randint(2, 5)
-            }
-            for i in range(1, 6)
-        ],
-        "recommendations": []
-    }
-
-    # Add recommendations based on metrics
-    if cache_hit_rate < 80:
-        return_data = {**get_cost_summary_dummy.__wrapped__(days)}
-        return_data["recommendations"].append({
-            "type": "low_cache_hit_rate",
-            "message": f"Cache hit rate ({cache_hit_rate:.1f}%) is below 80%. Consider increasing cache TTL or investigating cache invalidation patterns.",
-            "priority": "medium"
-        })
-
-    if total_cost / total_requests > 0.002:
-        if "recommendations" not in locals():
-            return_data = {**get_cost_summary_dummy.__wrapped__(days)}
-        return_data["recommendations"].append({
-            "type": "high_cost_per_request",
-            "message": f"Average cost per request (${total_cost/total_requests:.4f}) is high. Consider prompt optimization or batch processing.",
-            "priority": "high"
-        })
-
     result = {
         "time_period_days": days,
         "overall_stats": {
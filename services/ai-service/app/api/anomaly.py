@@ -3,20 +3,52 @@ Anomaly Detection endpoints - Z-score based time-series anomaly detection
 with batch support for multi-metric scanning.
 """
 import logging
-import statistics
+import math
 import uuid
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Any, Callable, Coroutine, List, Optional
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
 from pydantic import BaseModel
+from typing_extensions import TypedDict
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
 
+class ORJSONRequest(Request):
+    """Request that decodes its JSON body with orjson instead of the stdlib."""
 
-class DataPoint(BaseModel):
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """Route that hands FastAPI an ORJSONRequest, so large time-series
+    bodies are parsed by orjson before Pydantic validation."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        original_route_handler = super().get_route_handler()
+
+        async def custom_route_handler(request: Request) -> Response:
+            return await original_route_handler(ORJSONRequest(request.scope, request.receive))
+
+        return custom_route_handler
+
+
+router = APIRouter(route_class=ORJSONRoute, default_response_class=ORJSONResponse)
+
+
+class DataPoint(TypedDict):
+    """A single time-series sample.
+
+    Declared as a TypedDict so pydantic-core validates each point straight
+    into a plain dict instead of instantiating a model per point.
+    """
     timestamp: str
     value: float
 
@@ -45,30 +77,40 @@ def _detect_anomalies_zscore(
     window_size: int = 5,
 ) -> List[dict]:
     anomalies = []
-    n = len(data_points)
+    values = [p["value"] for p in data_points]
+    n = len(values)
+
+    half = window_size // 2
 
     for i in range(n):
-        half = window_size // 2
         start = max(0, i - half)
         end = min(n, i + half + 1)
-        window_values = [
-            data_points[j].value
-            for j in range(start, end)
-            if j != i and 0 <= j < n
-        ]
-        if len(window_values) < 2:
+        count = end - start - 1
+        if count < 2:
             continue
-        mean_val = statistics.mean(window_values)
-        std_val = statistics.stdev(window_values)
-        if std_val == 0:
+        # Single pass over the window (excluding i), shifted by a window
+        # sample so constant windows give exactly zero variance.
+        shift = values[start] if start != i else values[start + 1]
+        total = 0.0
+        total_sq = 0.0
+        for j in range(start, end):
+            if j == i:
+                continue
+            d = values[j] - shift
+            total += d
+            total_sq += d * d
+        variance = (total_sq - total * total / count) / (count - 1)
+        if variance <= 0:
             continue
-        value = data_points[i].value
+        mean_val = shift + total / count
+        std_val = math.sqrt(variance)
+        value = values[i]
         z_score = abs(value - mean_val) / std_val
         if z_score > sensitivity:
             deviation = value - mean_val
             severity = "critical" if z_score > sensitivity * 1.5 else "warning"
             anomalies.append({
-                "timestamp": data_points[i].timestamp,
+                "timestamp": data_points[i]["timestamp"],
                 "value": value,
                 "expected": round(mean_val, 4),
                 "deviation": round(deviation, 4),
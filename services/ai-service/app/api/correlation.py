@@ -2,6 +2,7 @@
 Incident Correlation endpoints - correlate alerts with incidents and
 find related incident clusters using heuristics.
 """
+import heapq
 import logging
 from datetime import datetime, timedelta
 from typing import List, Optional
@@ -51,6 +52,7 @@ def _correlate_incidents_list(
         ref_dt = datetime.utcnow()
 
     time_window = timedelta(minutes=TIME_PROXIMITY_MINUTES)
+    symptom_set = frozenset(symptoms)
     correlated = []
 
     for inc in incidents_db:
@@ -73,8 +75,7 @@ def _correlate_incidents_list(
             score += 0.4
             corr_types.append("same_service")
 
-        inc_symptoms = inc.get("symptoms", [])
-        matching = set(symptoms) & set(inc_symptoms)
+        matching = symptom_set.intersection(inc.get("symptoms", ()))
         if matching:
             score += min(0.5, len(matching) * 0.2)
             corr_types.append("matching_symptoms")
@@ -95,10 +96,10 @@ def _correlate_incidents_list(
                 "description": "; ".join(desc_parts),
             })
 
-    correlated.sort(key=lambda x: x["correlation_score"], reverse=True)
+    top_correlated = heapq.nlargest(10, correlated, key=lambda x: x["correlation_score"])
 
-    if correlated:
-        top = correlated[0]
+    if top_correlated:
+        top = top_correlated[0]
         if "same_service" in top["correlation_type"]:
             root_cause = f"Multiple incidents in {top['service_name']} suggest a service-level issue."
         elif "time_proximity" in top["correlation_type"]:
@@ -108,7 +109,7 @@ def _correlate_incidents_list(
     else:
         root_cause = "No strong correlations found. This may be an isolated incident."
 
-    return correlated[:10], root_cause
+    return top_correlated, root_cause
 
 
 @router.post("/analyze")
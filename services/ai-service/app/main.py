@@ -1,12 +1,19 @@
 """
 AI Service - Hypothesis generation and AI operations
 """
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+import importlib.util
 import os
 import sys
 
-# Add shared to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
+# Add shared to path only when it is not already importable (in the container
+# shared/ sits next to app/, so the extra sys.path entry is only needed when
+# running from a monorepo checkout)
+if importlib.util.find_spec("shared") is None:
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
 
 # Initialize Django
 from shared.utils.database import setup_django
@@ -15,11 +22,35 @@ setup_django()
 from app.api import ai, analytics, anomaly, correlation, dashboard_analysis
 from app.services.redis_publisher import redis_publisher
 
+# Background Redis connect handle
+_redis_connect_task = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Startup and shutdown events"""
+    global _redis_connect_task
+    print("🤖 AI Service starting up...")
+    # Connect in the background so a slow/unreachable Redis does not delay
+    # serving; publishers skip events until redis_publisher.redis is set
+    _redis_connect_task = asyncio.create_task(redis_publisher.connect())
+    yield
+    print("👋 AI Service shutting down...")
+    if _redis_connect_task and not _redis_connect_task.done():
+        _redis_connect_task.cancel()
+        try:
+            await _redis_connect_task
+        except asyncio.CancelledError:
+            pass
+    await redis_publisher.disconnect()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="SRE Copilot AI Service",
     description="AI and Hypothesis Generation Service",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Include routers
@@ -32,7 +63,12 @@ app.include_router(dashboard_analysis.router, tags=["Dashboard Analysis"])
 # Prometheus instrumentation for platform health monitoring
 try:
     from prometheus_fastapi_instrumentator import Instrumentator
-    Instrumentator().instrument(app).expose(app, endpoint="/metrics")
+    # Skip health/scrape and static listing endpoints to keep per-request
+    # middleware cost and metric cardinality down
+    Instrumentator(
+        excluded_handlers=["/health", "/metrics", "/anomaly/active", "/correlation/groups"],
+        inprogress_labels=False,
+    ).instrument(app).expose(app, endpoint="/metrics", include_in_schema=False)
 except ImportError:
     pass  # prometheus not installed, skip
 
@@ -42,16 +78,3 @@ async def health_check():
     """Health check endpoint"""
     return {"status": "healthy", "service": "ai-service"}
 
-
-@app.on_event("startup")
-async def startup_event():
-    """Startup event"""
-    print("🤖 AI Service starting up...")
-    await redis_publisher.connect()
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Shutdown event"""
-    print("👋 AI Service shutting down...")
-    await redis_publisher.disconnect()
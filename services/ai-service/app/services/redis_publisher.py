@@ -1,11 +1,19 @@
 """
 Redis Publisher for broadcasting incident and hypothesis events
 """
+import logging
+
 import redis.asyncio as aioredis
-import json
-from typing import Optional
+import orjson
+from typing import List, Optional
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+# Pre-encoded channel names so redis-py does not re-encode them per publish
+_CH_INCIDENTS = b"incidents"
+_CH_HYPOTHESES = b"hypotheses"
+
 
 class RedisPublisher:
     """Publishes events to Redis Pub/Sub for WebSocket broadcasting"""
@@ -22,9 +30,9 @@ class RedisPublisher:
                 encoding="utf-8",
                 decode_responses=True
             )
-            print("✅ Connected to Redis for publishing")
+            logger.info("Connected to Redis for publishing")
         except Exception as e:
-            print(f"❌ Failed to connect to Redis: {e}")
+            logger.error("Failed to connect to Redis: %s", e)
 
     async def disconnect(self):
         """Disconnect from Redis"""
@@ -33,40 +41,72 @@ class RedisPublisher:
 
     async def publish_incident_created(self, incident_data: dict, tenant_id: str):
         """Publish incident.created event"""
-        await self._publish("incidents", {
+        await self._publish(_CH_INCIDENTS, {
             "type": "incident.created",
             "data": incident_data,
-            "tenant_id": tenant_id
+            "tenant_id": tenant_id,
+            "timestamp": datetime.utcnow().isoformat()
         })
 
     async def publish_incident_updated(self, incident_data: dict, tenant_id: str):
         """Publish incident.updated event"""
-        await self._publish("incidents", {
+        await self._publish(_CH_INCIDENTS, {
             "type": "incident.updated",
             "data": incident_data,
-            "tenant_id": tenant_id
+            "tenant_id": tenant_id,
+            "timestamp": datetime.utcnow().isoformat()
         })
 
     async def publish_hypothesis_generated(self, hypothesis_data: dict, tenant_id: str):
         """Publish hypothesis.generated event"""
-        await self._publish("hypotheses", {
+        await self._publish(_CH_HYPOTHESES, {
             "type": "hypothesis.generated",
             "data": hypothesis_data,
-            "tenant_id": tenant_id
+            "tenant_id": tenant_id,
+            "timestamp": datetime.utcnow().isoformat()
         })
 
-    async def _publish(self, channel: str, message: dict):
-        """Publish message to Redis channel"""
+    async def publish_hypotheses_generated(self, hypotheses_data: List[dict], tenant_id: str):
+        """Publish one hypothesis.generated event per hypothesis in a single round-trip"""
+        timestamp = datetime.utcnow().isoformat()
+        await self.publish_many(_CH_HYPOTHESES, [
+            {
+                "type": "hypothesis.generated",
+                "data": hypothesis_data,
+                "tenant_id": tenant_id,
+                "timestamp": timestamp
+            }
+            for hypothesis_data in hypotheses_data
+        ])
+
+    async def _publish(self, channel: bytes, message: dict):
+        """Publish a fully built message (including timestamp) to a Redis channel"""
+        if not self.redis:
+            logger.warning("Redis not connected, skipping publish")
+            return
+
+        try:
+            await self.redis.publish(channel, orjson.dumps(message, default=str))
+            logger.debug("Published %s to channel %s", message["type"], channel)
+        except Exception as e:
+            logger.error("Failed to publish message: %s", e)
+
+    async def publish_many(self, channel: bytes, messages: List[dict]):
+        """Publish several fully built messages to a Redis channel using one pipelined round-trip"""
+        if not messages:
+            return
         if not self.redis:
-            print("⚠️  Redis not connected, skipping publish")
+            logger.warning("Redis not connected, skipping publish")
             return
 
         try:
-            message["timestamp"] = datetime.utcnow().isoformat()
-            await self.redis.publish(channel, json.dumps(message))
-            print(f"📨 Published {message['type']} to channel '{channel}'")
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for message in messages:
+                    pipe.publish(channel, orjson.dumps(message, default=str))
+                await pipe.execute()
+            logger.debug("Published %d messages to channel %s", len(messages), channel)
         except Exception as e:
-            print(f"❌ Failed to publish message: {e}")
+            logger.error("Failed to publish messages: %s", e)
 
 
 # Global publisher instance
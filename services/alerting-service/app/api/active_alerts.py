@@ -1,10 +1,12 @@
 """Active alerts API endpoints."""
 import logging
-from typing import Any, Dict, List
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
 
-from app.storage import list_active_alerts, _get_project
+from shared.models import Project
+from app.api.deps import project_dep
+from app.storage import list_active_alerts
 
 logger = logging.getLogger(__name__)
 
@@ -12,11 +14,6 @@ router = APIRouter(prefix="/active-alerts", tags=["Active Alerts"])
 
 
 @router.get("")
-async def list_active_alerts_endpoint(project_id: str) -> List[Dict[str, Any]]:
+async def list_active_alerts_endpoint(project: Project = Depends(project_dep)) -> ORJSONResponse:
     """List all currently firing active alerts for a project."""
-    try:
-        project = await _get_project(project_id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-
-    return await list_active_alerts(project_id=str(project.id))
+    return ORJSONResponse(content=await list_active_alerts(project_id=str(project.id)))
@@ -1,151 +1,178 @@
 """Alert conditions API endpoints."""
 import logging
-from typing import Any, Dict, List, Literal, Optional
+from typing import Annotated, List, Literal, Optional, Union
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
+import msgspec
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+from msgspec import UNSET, Meta, UnsetType
 
+from shared.models import Project
+from app.api.deps import _PROJECT_404, cached_list_response, msgspec_body, msgspec_openapi, project_dep, set_fields
 from app.storage import (
     create_condition,
+    create_conditions_bulk,
     list_conditions,
     get_condition,
     update_condition,
     delete_condition,
-    _get_project,
+    _get_project_or_none,
 )
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/conditions", tags=["Alert Conditions"])
 
+_CONDITION_404 = HTTPException(status_code=404, detail="Condition not found")
 
-# --- Pydantic models ---
 
+# --- Request models (msgspec) ---
 
-class CreateConditionRequest(BaseModel):
-    """Request body for creating an alert condition."""
+Name = Annotated[str, Meta(min_length=1, max_length=200)]
+Operator = Literal["gt", "lt", "eq", "gte", "lte"]
+Severity = Literal["critical", "warning", "info"]
+DurationSeconds = Annotated[int, Meta(ge=1, le=86400)]
+
+
+class ConditionFields(msgspec.Struct, kw_only=True):
+    """Alert condition fields accepted on create."""
 
-    project_id: str = Field(..., description="Project ID")
-    name: str = Field(..., min_length=1, max_length=200)
-    metric_name: str = Field(..., min_length=1, max_length=200)
-    operator: Literal["gt", "lt", "eq", "gte", "lte"] = Field(...)
-    threshold: float = Field(...)
-    duration_seconds: int = Field(..., ge=1, le=86400)
-    severity: Literal["critical", "warning", "info"] = Field(...)
-    service_name: str = Field(..., min_length=1, max_length=200)
+    name: Name
+    metric_name: Name
+    operator: Operator
+    threshold: float
+    duration_seconds: DurationSeconds
+    severity: Severity
+    service_name: Name
     enabled: bool = True
 
 
-class UpdateConditionRequest(BaseModel):
-    """Request body for updating an alert condition."""
+class CreateConditionRequest(ConditionFields, kw_only=True):
+    """Request body for creating an alert condition."""
+
+    project_id: str
+
 
-    name: Optional[str] = Field(None, min_length=1, max_length=200)
-    metric_name: Optional[str] = Field(None, min_length=1, max_length=200)
-    operator: Optional[Literal["gt", "lt", "eq", "gte", "lte"]] = None
-    threshold: Optional[float] = None
-    duration_seconds: Optional[int] = Field(None, ge=1, le=86400)
-    severity: Optional[Literal["critical", "warning", "info"]] = None
-    service_name: Optional[str] = Field(None, min_length=1, max_length=200)
-    enabled: Optional[bool] = None
+class BulkCreateConditionsRequest(msgspec.Struct, kw_only=True):
+    """Request body for creating many alert conditions in one project."""
+
+    project_id: str
+    conditions: Annotated[List[ConditionFields], Meta(min_length=1, max_length=1000)]
+
+
+class UpdateConditionRequest(msgspec.Struct, kw_only=True):
+    """Request body for updating an alert condition. Omitted fields stay UNSET."""
+
+    name: Union[Optional[Name], UnsetType] = UNSET
+    metric_name: Union[Optional[Name], UnsetType] = UNSET
+    operator: Union[Optional[Operator], UnsetType] = UNSET
+    threshold: Union[Optional[float], UnsetType] = UNSET
+    duration_seconds: Union[Optional[DurationSeconds], UnsetType] = UNSET
+    severity: Union[Optional[Severity], UnsetType] = UNSET
+    service_name: Union[Optional[Name], UnsetType] = UNSET
+    enabled: Union[Optional[bool], UnsetType] = UNSET
 
 
 # --- Endpoints ---
 
 
-@router.post("")
-async def create_condition_endpoint(request: CreateConditionRequest) -> Dict[str, Any]:
+@router.post("", openapi_extra=msgspec_openapi(CreateConditionRequest))
+async def create_condition_endpoint(
+    request: CreateConditionRequest = Depends(msgspec_body(CreateConditionRequest)),
+) -> ORJSONResponse:
     """Create a new alert condition."""
-    try:
-        project = await _get_project(request.project_id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+    project = await _get_project_or_none(request.project_id)
+    if project is None:
+        raise _PROJECT_404.with_traceback(None)
 
-    data = request.model_dump(exclude={"project_id"})
+    data = msgspec.structs.asdict(request)
+    del data["project_id"]
     condition = await create_condition(
         project_id=str(project.id),
         tenant_id=str(project.tenant_id),
         data=data,
     )
     logger.info("Created alert condition: %s", condition["condition_id"])
-    return condition
+    return ORJSONResponse(content=condition)
+
+
+@router.post("/bulk", openapi_extra=msgspec_openapi(BulkCreateConditionsRequest))
+async def bulk_create_conditions_endpoint(
+    request: BulkCreateConditionsRequest = Depends(msgspec_body(BulkCreateConditionsRequest)),
+) -> ORJSONResponse:
+    """Create many alert conditions at once."""
+    project = await _get_project_or_none(request.project_id)
+    if project is None:
+        raise _PROJECT_404.with_traceback(None)
+
+    conditions = await create_conditions_bulk(
+        project_id=str(project.id),
+        tenant_id=str(project.tenant_id),
+        items=[msgspec.structs.asdict(c) for c in request.conditions],
+    )
+    logger.info("Created %d alert conditions", len(conditions))
+    return ORJSONResponse(content=conditions)
 
 
 @router.get("")
 async def list_conditions_endpoint(
-    project_id: str,
+    request: Request,
+    project: Project = Depends(project_dep),
     service_name: Optional[str] = None,
     enabled: Optional[bool] = None,
-) -> List[Dict[str, Any]]:
+) -> Response:
     """List all alert conditions with optional filters."""
-    try:
-        project = await _get_project(project_id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-
-    return await list_conditions(
-        project_id=str(project.id),
-        service_name=service_name,
-        enabled=enabled,
+    project_id = str(project.id)
+    return await cached_list_response(
+        request,
+        project_id,
+        ("conditions", project_id, service_name, enabled),
+        lambda: list_conditions(project_id=project_id, service_name=service_name, enabled=enabled),
     )
 
 
 @router.get("/{condition_id}")
 async def get_condition_endpoint(
     condition_id: str,
-    project_id: str,
-) -> Dict[str, Any]:
+    project: Project = Depends(project_dep),
+) -> ORJSONResponse:
     """Get a single alert condition by ID."""
-    try:
-        project = await _get_project(project_id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-
     condition = await get_condition(project_id=str(project.id), condition_id=condition_id)
     if not condition:
-        raise HTTPException(status_code=404, detail="Condition not found")
-    return condition
+        raise _CONDITION_404.with_traceback(None)
+    return ORJSONResponse(content=condition)
 
 
-@router.put("/{condition_id}")
+@router.put("/{condition_id}", openapi_extra=msgspec_openapi(UpdateConditionRequest))
 async def update_condition_endpoint(
     condition_id: str,
-    request: UpdateConditionRequest,
-    project_id: str,
-) -> Dict[str, Any]:
+    project: Project = Depends(project_dep),
+    request: UpdateConditionRequest = Depends(msgspec_body(UpdateConditionRequest)),
+) -> ORJSONResponse:
     """Update an alert condition."""
-    try:
-        project = await _get_project(project_id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-
-    update_data = request.model_dump(exclude_unset=True)
+    update_data = set_fields(request)
     condition = await update_condition(
         project_id=str(project.id),
         condition_id=condition_id,
         data=update_data,
     )
     if not condition:
-        raise HTTPException(status_code=404, detail="Condition not found")
+        raise _CONDITION_404.with_traceback(None)
     logger.info("Updated alert condition: %s", condition_id)
-    return condition
+    return ORJSONResponse(content=condition)
 
 
 @router.delete("/{condition_id}")
 async def delete_condition_endpoint(
     condition_id: str,
-    project_id: str,
-) -> Dict[str, str]:
+    project: Project = Depends(project_dep),
+) -> ORJSONResponse:
     """Delete an alert condition."""
-    try:
-        project = await _get_project(project_id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-
     deleted = await delete_condition(
         project_id=str(project.id),
         condition_id=condition_id,
     )
     if not deleted:
-        raise HTTPException(status_code=404, detail="Condition not found")
+        raise _CONDITION_404.with_traceback(None)
     logger.info("Deleted alert condition: %s", condition_id)
-    return {"status": "deleted", "condition_id": condition_id}
+    return ORJSONResponse(content={"status": "deleted", "condition_id": condition_id})
@@ -1,143 +1,139 @@
 """Alert policies API endpoints."""
 import logging
-from typing import Any, Dict, List, Literal, Optional
+from typing import Annotated, List, Literal, Optional, Union
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
+import msgspec
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+from msgspec import UNSET, Meta, UnsetType
 
+from shared.models import Project
+from app.api.deps import _PROJECT_404, cached_list_response, msgspec_body, msgspec_openapi, project_dep, set_fields
 from app.storage import (
     create_policy,
     list_policies,
     get_policy,
     update_policy,
     delete_policy,
-    _get_project,
+    _get_project_or_none,
 )
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/policies", tags=["Alert Policies"])
 
+_POLICY_404 = HTTPException(status_code=404, detail="Policy not found")
 
-# --- Pydantic models ---
 
+# --- Request models (msgspec) ---
 
-class CreatePolicyRequest(BaseModel):
+Name = Annotated[str, Meta(min_length=1, max_length=200)]
+Description = Annotated[str, Meta(max_length=2000)]
+IncidentPreference = Literal["per_condition", "per_policy"]
+
+
+class CreatePolicyRequest(msgspec.Struct, kw_only=True):
     """Request body for creating an alert policy."""
 
-    project_id: str = Field(..., description="Project ID")
-    name: str = Field(..., min_length=1, max_length=200)
-    description: str = Field("", max_length=2000)
-    condition_ids: List[str] = Field(default_factory=list)
-    incident_preference: Literal["per_condition", "per_policy"] = "per_condition"
+    project_id: str
+    name: Name
+    description: Description = ""
+    condition_ids: List[str] = msgspec.field(default_factory=list)
+    incident_preference: IncidentPreference = "per_condition"
     enabled: bool = True
 
 
-class UpdatePolicyRequest(BaseModel):
-    """Request body for updating an alert policy."""
+class UpdatePolicyRequest(msgspec.Struct, kw_only=True):
+    """Request body for updating an alert policy. Omitted fields stay UNSET."""
 
-    name: Optional[str] = Field(None, min_length=1, max_length=200)
-    description: Optional[str] = Field(None, max_length=2000)
-    condition_ids: Optional[List[str]] = None
-    incident_preference: Optional[Literal["per_condition", "per_policy"]] = None
-    enabled: Optional[bool] = None
+    name: Union[Optional[Name], UnsetType] = UNSET
+    description: Union[Optional[Description], UnsetType] = UNSET
+    condition_ids: Union[Optional[List[str]], UnsetType] = UNSET
+    incident_preference: Union[Optional[IncidentPreference], UnsetType] = UNSET
+    enabled: Union[Optional[bool], UnsetType] = UNSET
 
 
 # --- Endpoints ---
 
 
-@router.post("")
-async def create_policy_endpoint(request: CreatePolicyRequest) -> Dict[str, Any]:
+@router.post("", openapi_extra=msgspec_openapi(CreatePolicyRequest))
+async def create_policy_endpoint(
+    request: CreatePolicyRequest = Depends(msgspec_body(CreatePolicyRequest)),
+) -> ORJSONResponse:
     """Create a new alert policy."""
-    try:
-        project = await _get_project(request.project_id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+    project = await _get_project_or_none(request.project_id)
+    if project is None:
+        raise _PROJECT_404.with_traceback(None)
 
-    data = request.model_dump(exclude={"project_id"})
+    data = msgspec.structs.asdict(request)
+    del data["project_id"]
     policy = await create_policy(
         project_id=str(project.id),
         tenant_id=str(project.tenant_id),
         data=data,
     )
     logger.info("Created alert policy: %s", policy["policy_id"])
-    return policy
+    return ORJSONResponse(content=policy)
 
 
 @router.get("")
 async def list_policies_endpoint(
-    project_id: str,
+    request: Request,
+    project: Project = Depends(project_dep),
     enabled: Optional[bool] = None,
-) -> List[Dict[str, Any]]:
+) -> Response:
     """List all alert policies with optional filter."""
-    try:
-        project = await _get_project(project_id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-
-    return await list_policies(
-        project_id=str(project.id),
-        enabled=enabled,
+    project_id = str(project.id)
+    return await cached_list_response(
+        request,
+        project_id,
+        ("policies", project_id, enabled),
+        lambda: list_policies(project_id=project_id, enabled=enabled),
     )
 
 
 @router.get("/{policy_id}")
 async def get_policy_endpoint(
     policy_id: str,
-    project_id: str,
-) -> Dict[str, Any]:
+    project: Project = Depends(project_dep),
+) -> ORJSONResponse:
     """Get a single alert policy by ID."""
-    try:
-        project = await _get_project(project_id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-
     policy = await get_policy(project_id=str(project.id), policy_id=policy_id)
     if not policy:
-        raise HTTPException(status_code=404, detail="Policy not found")
-    return policy
+        raise _POLICY_404.with_traceback(None)
+    return ORJSONResponse(content=policy)
 
 
-@router.put("/{policy_id}")
+@router.put("/{policy_id}", openapi_extra=msgspec_openapi(UpdatePolicyRequest))
 async def update_policy_endpoint(
     policy_id: str,
-    request: UpdatePolicyRequest,
-    project_id: str,
-) -> Dict[str, Any]:
+    project: Project = Depends(project_dep),
+    request: UpdatePolicyRequest = Depends(msgspec_body(UpdatePolicyRequest)),
+) -> ORJSONResponse:
     """Update an alert policy."""
-    try:
-        project = await _get_project(project_id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-
-    update_data = request.model_dump(exclude_unset=True)
+    update_data = set_fields(request)
     policy = await update_policy(
         project_id=str(project.id),
         policy_id=policy_id,
         data=update_data,
     )
     if not policy:
-        raise HTTPException(status_code=404, detail="Policy not found")
+        raise _POLICY_404.with_traceback(None)
     logger.info("Updated alert policy: %s", policy_id)
-    return policy
+    return ORJSONResponse(content=policy)
 
 
 @router.delete("/{policy_id}")
 async def delete_policy_endpoint(
     policy_id: str,
-    project_id: str,
-) -> Dict[str, str]:
+    project: Project = Depends(project_dep),
+) -> ORJSONResponse:
     """Delete an alert policy."""
-    try:
-        project = await _get_project(project_id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-
     deleted = await delete_policy(
         project_id=str(project.id),
         policy_id=policy_id,
     )
     if not deleted:
-        raise HTTPException(status_code=404, detail="Policy not found")
+        raise _POLICY_404.with_traceback(None)
     logger.info("Deleted alert policy: %s", policy_id)
-    return {"status": "deleted", "policy_id": policy_id}
+    return ORJSONResponse(content={"status": "deleted", "policy_id": policy_id})
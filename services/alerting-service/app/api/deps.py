@@ -0,0 +1,137 @@
+"""Shared FastAPI dependencies for alerting-service routers."""
+from typing import Any, Awaitable, Callable, Coroutine, Dict, List, Tuple, Type, TypeVar
+
+import msgspec
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+
+from shared.models import Project
+from app.storage import _get_project_or_none, get_project_version
+
+T = TypeVar("T", bound=msgspec.Struct)
+
+# Not-found errors carry no per-request state, so routers share prebuilt
+# instances. Raise them as ``raise _X_404.with_traceback(None)`` so tracebacks
+# don't pile up across requests.
+_PROJECT_404 = HTTPException(status_code=404, detail="Project not found")
+
+# Serialized list responses: (resource, project_id, *filters) -> (version, body)
+LIST_CACHE_MAX_SIZE = 1024
+_list_cache: Dict[Tuple[Any, ...], Tuple[int, bytes]] = {}
+
+# Schemas of msgspec request bodies, added to the app's OpenAPI components by
+# install_msgspec_openapi(): component name -> JSON schema
+_OPENAPI_REF_TEMPLATE = "#/components/schemas/{name}"
+_openapi_components: Dict[str, Any] = {}
+
+
+async def project_dep(project_id: str) -> Project:
+    """
+    Resolve the ``project_id`` query parameter to a Project (404 if missing).
+
+    Backed by the TTL-cached ``_get_project_or_none``, and FastAPI resolves
+    each dependency once per request.
+    """
+    project = await _get_project_or_none(project_id)
+    if project is None:
+        raise _PROJECT_404.with_traceback(None)
+    return project
+
+
+def msgspec_body(model: Type[T]) -> Callable[[Request], Coroutine[Any, Any, T]]:
+    """
+    Build a dependency that decodes the raw request body straight into *model*.
+
+    The body is parsed and validated by msgspec in one C pass instead of going
+    through FastAPI's JSON parse + Pydantic validation.  Errors are re-raised as
+    ``RequestValidationError`` so the service's installed handler still returns
+    the standard 400 error envelope.
+
+    Usage::
+
+        request: CreateConditionRequest = Depends(msgspec_body(CreateConditionRequest))
+    """
+    # strict=False mirrors Pydantic's lax mode (e.g. "5" -> 5.0 for floats)
+    decoder = msgspec.json.Decoder(model, strict=False)
+
+    async def _decode(request: Request) -> T:
+        try:
+            return decoder.decode(await request.body())
+        except msgspec.DecodeError as e:
+            raise RequestValidationError([{"loc": ("body",), "msg": str(e), "type": "value_error"}])
+
+    return _decode
+
+
+def msgspec_openapi(model: Type[msgspec.Struct]) -> Dict[str, Any]:
+    """
+    Build the ``openapi_extra`` documenting a ``msgspec_body(model)`` request body.
+
+    FastAPI can't see the body behind the dependency, so routes pass this to
+    their decorator instead::
+
+        @router.post("", openapi_extra=msgspec_openapi(CreateConditionRequest))
+    """
+    (schema,), components = msgspec.json.schema_components([model], ref_template=_OPENAPI_REF_TEMPLATE)
+    _openapi_components.update(components)
+    return {"requestBody": {"content": {"application/json": {"schema": schema}}, "required": True}}
+
+
+def install_msgspec_openapi(app: FastAPI) -> None:
+    """Add the schemas referenced by msgspec_openapi() request bodies to the app's OpenAPI components."""
+    build_openapi = app.openapi
+
+    def openapi() -> Dict[str, Any]:
+        if app.openapi_schema is None:
+            schema = build_openapi()
+            schema.setdefault("components", {}).setdefault("schemas", {}).update(_openapi_components)
+        return app.openapi_schema
+
+    app.openapi = openapi
+
+
+def set_fields(struct: msgspec.Struct) -> Dict[str, Any]:
+    """
+    Return only the fields the client actually sent (i.e. not ``UNSET``).
+
+    Values are taken as-is with one attribute read per field, so nested
+    payloads such as ``config`` dicts are not re-walked or copied.
+    """
+    return {
+        name: value
+        for name in struct.__struct_fields__
+        if (value := getattr(struct, name)) is not msgspec.UNSET
+    }
+
+
+async def cached_list_response(
+    request: Request,
+    project_id: str,
+    key: Tuple[Any, ...],
+    load: Callable[[], Awaitable[List[Dict[str, Any]]]],
+) -> Response:
+    """
+    Serve a list endpoint from the per-project write-version cache.
+
+    The body is only re-queried and re-serialized after a create/update/delete
+    in the project. The version doubles as the ETag, so a dashboard polling with
+    ``If-None-Match`` gets an empty 304 until something changes.
+    """
+    # Read the version before loading so a concurrent write can't be masked
+    version = get_project_version(project_id)
+    etag = f'"{version}"'
+    headers = {"ETag": etag}
+    if etag in (tag.strip() for tag in request.headers.get("if-none-match", "").split(",")):
+        return Response(status_code=304, headers=headers)
+
+    cached = _list_cache.get(key)
+    if cached and cached[0] == version:
+        body = cached[1]
+    else:
+        body = orjson.dumps(await load())
+        if key not in _list_cache and len(_list_cache) >= LIST_CACHE_MAX_SIZE:
+            # Drop the oldest entry (dicts keep insertion order)
+            del _list_cache[next(iter(_list_cache))]
+        _list_cache[key] = (version, body)
+    return Response(content=body, media_type="application/json", headers=headers)
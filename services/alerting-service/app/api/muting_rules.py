@@ -1,30 +1,36 @@
 """Muting rules API endpoints."""
 import logging
-from typing import Any, Dict, List, Literal, Optional
+from typing import Annotated, Any, Dict, List, Literal, Optional
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
+import msgspec
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+from msgspec import Meta
 
+from shared.models import Project
+from app.api.deps import _PROJECT_404, cached_list_response, msgspec_body, msgspec_openapi, project_dep
 from app.storage import (
     create_muting_rule,
     list_muting_rules,
     delete_muting_rule,
-    _get_project,
+    _get_project_or_none,
 )
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/muting-rules", tags=["Muting Rules"])
 
+_MUTING_RULE_404 = HTTPException(status_code=404, detail="Muting rule not found")
 
-# --- Pydantic models ---
 
-class CreateMutingRuleRequest(BaseModel):
-    project_id: str = Field(..., description="Project ID")
-    name: str = Field(..., max_length=200)
+# --- Request models (msgspec) ---
+
+class CreateMutingRuleRequest(msgspec.Struct, kw_only=True):
+    project_id: str
+    name: Annotated[str, Meta(max_length=200)]
     description: str = ""
-    condition_ids: List[str] = Field(default_factory=list)
-    match_criteria: Dict[str, Any] = Field(default_factory=dict)
+    condition_ids: List[str] = msgspec.field(default_factory=list)
+    match_criteria: Dict[str, Any] = msgspec.field(default_factory=dict)
     start_time: str = ""
     end_time: str = ""
     repeat: Literal["none", "daily", "weekly"] = "none"
@@ -33,50 +39,51 @@ class CreateMutingRuleRequest(BaseModel):
 
 # --- Endpoints ---
 
-@router.post("")
-async def create_muting_rule_endpoint(request: CreateMutingRuleRequest) -> dict:
+@router.post("", openapi_extra=msgspec_openapi(CreateMutingRuleRequest))
+async def create_muting_rule_endpoint(
+    request: CreateMutingRuleRequest = Depends(msgspec_body(CreateMutingRuleRequest)),
+) -> ORJSONResponse:
     """Create a new muting rule."""
-    try:
-        project = await _get_project(request.project_id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+    project = await _get_project_or_none(request.project_id)
+    if project is None:
+        raise _PROJECT_404.with_traceback(None)
 
-    data = request.model_dump(exclude={"project_id"})
+    data = msgspec.structs.asdict(request)
+    del data["project_id"]
     rule = await create_muting_rule(
         project_id=str(project.id),
         tenant_id=str(project.tenant_id),
         data=data,
     )
     logger.info("Created muting rule: %s", rule["rule_id"])
-    return rule
+    return ORJSONResponse(content=rule)
 
 
 @router.get("")
-async def list_muting_rules_endpoint(project_id: str) -> List[dict]:
+async def list_muting_rules_endpoint(
+    request: Request,
+    project: Project = Depends(project_dep),
+) -> Response:
     """List all muting rules for a project."""
-    try:
-        project = await _get_project(project_id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-
-    return await list_muting_rules(project_id=str(project.id))
+    project_id = str(project.id)
+    return await cached_list_response(
+        request,
+        project_id,
+        ("muting_rules", project_id),
+        lambda: list_muting_rules(project_id=project_id),
+    )
 
 
 @router.delete("/{rule_id}")
 async def delete_muting_rule_endpoint(
     rule_id: str,
-    project_id: str,
-) -> dict:
+    project: Project = Depends(project_dep),
+) -> ORJSONResponse:
     """Delete a muting rule."""
-    try:
-        project = await _get_project(project_id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-
     deleted = await delete_muting_rule(
         project_id=str(project.id),
         rule_id=rule_id,
     )
     if not deleted:
-        raise HTTPException(status_code=404, detail="Muting rule not found")
-    return {"status": "deleted", "rule_id": rule_id}
+        raise _MUTING_RULE_404.with_traceback(None)
+    return ORJSONResponse(content={"status": "deleted", "rule_id": rule_id})
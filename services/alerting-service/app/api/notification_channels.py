@@ -1,151 +1,176 @@
 """Notification channels API endpoints."""
 import logging
-from typing import Any, Dict, List, Literal, Optional
+from typing import Annotated, Any, Dict, List, Literal, Optional, Union
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
+import msgspec
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+from msgspec import UNSET, Meta, UnsetType
 
+from shared.models import Project
+from app.api.deps import _PROJECT_404, cached_list_response, msgspec_body, msgspec_openapi, project_dep, set_fields
 from app.storage import (
     create_channel,
+    create_channels_bulk,
     list_channels,
     get_channel,
     update_channel,
     delete_channel,
-    _get_project,
+    get_channel_model,
+    _get_project_or_none,
 )
+from app.services.notifier import send_test_notification
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/channels", tags=["Notification Channels"])
 
+_CHANNEL_404 = HTTPException(status_code=404, detail="Channel not found")
 
-# --- Pydantic models ---
 
-class CreateChannelRequest(BaseModel):
-    project_id: str = Field(..., description="Project ID")
-    name: str = Field(..., max_length=200)
-    type: Literal["email", "slack", "pagerduty", "webhook", "msteams"] = "webhook"
-    config: Dict[str, Any] = Field(default_factory=dict)
+# --- Request models (msgspec) ---
+
+ChannelType = Literal["email", "slack", "pagerduty", "webhook", "msteams"]
+
+
+class ChannelFields(msgspec.Struct, kw_only=True):
+    name: Annotated[str, Meta(max_length=200)]
+    type: ChannelType = "webhook"
+    config: Dict[str, Any] = msgspec.field(default_factory=dict)
     enabled: bool = True
 
 
-class UpdateChannelRequest(BaseModel):
-    name: Optional[str] = None
-    type: Optional[Literal["email", "slack", "pagerduty", "webhook", "msteams"]] = None
-    config: Optional[Dict[str, Any]] = None
-    enabled: Optional[bool] = None
+class CreateChannelRequest(ChannelFields, kw_only=True):
+    project_id: str
+
+
+class BulkCreateChannelsRequest(msgspec.Struct, kw_only=True):
+    project_id: str
+    channels: Annotated[List[ChannelFields], Meta(min_length=1, max_length=1000)]
+
+
+class UpdateChannelRequest(msgspec.Struct, kw_only=True):
+    name: Union[Optional[str], UnsetType] = UNSET
+    type: Union[Optional[ChannelType], UnsetType] = UNSET
+    config: Union[Optional[Dict[str, Any]], UnsetType] = UNSET
+    enabled: Union[Optional[bool], UnsetType] = UNSET
 
 
 # --- Endpoints ---
 
-@router.post("")
-async def create_channel_endpoint(request: CreateChannelRequest) -> dict:
+@router.post("", openapi_extra=msgspec_openapi(CreateChannelRequest))
+async def create_channel_endpoint(
+    request: CreateChannelRequest = Depends(msgspec_body(CreateChannelRequest)),
+) -> ORJSONResponse:
     """Create a new notification channel."""
-    try:
-        project = await _get_project(request.project_id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+    project = await _get_project_or_none(request.project_id)
+    if project is None:
+        raise _PROJECT_404.with_traceback(None)
 
-    data = request.model_dump(exclude={"project_id"})
+    data = msgspec.structs.asdict(request)
+    del data["project_id"]
     channel = await create_channel(
         project_id=str(project.id),
         tenant_id=str(project.tenant_id),
         data=data,
     )
     logger.info("Created notification channel: %s", channel["channel_id"])
-    return channel
+    return ORJSONResponse(content=channel)
+
+
+@router.post("/bulk", openapi_extra=msgspec_openapi(BulkCreateChannelsRequest))
+async def bulk_create_channels_endpoint(
+    request: BulkCreateChannelsRequest = Depends(msgspec_body(BulkCreateChannelsRequest)),
+) -> ORJSONResponse:
+    """Create many notification channels at once."""
+    project = await _get_project_or_none(request.project_id)
+    if project is None:
+        raise _PROJECT_404.with_traceback(None)
+
+    channels = await create_channels_bulk(
+        project_id=str(project.id),
+        tenant_id=str(project.tenant_id),
+        items=[msgspec.structs.asdict(c) for c in request.channels],
+    )
+    logger.info("Created %d notification channels", len(channels))
+    return ORJSONResponse(content=channels)
 
 
 @router.get("")
-async def list_channels_endpoint(project_id: str) -> List[dict]:
+async def list_channels_endpoint(
+    request: Request,
+    project: Project = Depends(project_dep),
+) -> Response:
     """List all notification channels for a project."""
-    try:
-        project = await _get_project(project_id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-
-    return await list_channels(project_id=str(project.id))
+    project_id = str(project.id)
+    return await cached_list_response(
+        request,
+        project_id,
+        ("channels", project_id),
+        lambda: list_channels(project_id=project_id),
+    )
 
 
 @router.get("/{channel_id}")
 async def get_channel_endpoint(
     channel_id: str,
-    project_id: str,
-) -> dict:
+    project: Project = Depends(project_dep),
+) -> ORJSONResponse:
     """Get a single notification channel by ID."""
-    try:
-        project = await _get_project(project_id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-
     channel = await get_channel(
         project_id=str(project.id),
         channel_id=channel_id,
     )
     if not channel:
-        raise HTTPException(status_code=404, detail="Channel not found")
-    return channel
+        raise _CHANNEL_404.with_traceback(None)
+    return ORJSONResponse(content=channel)
 
 
-@router.put("/{channel_id}")
+@router.put("/{channel_id}", openapi_extra=msgspec_openapi(UpdateChannelRequest))
 async def update_channel_endpoint(
     channel_id: str,
-    request: UpdateChannelRequest,
-    project_id: str,
-) -> dict:
+    project: Project = Depends(project_dep),
+    request: UpdateChannelRequest = Depends(msgspec_body(UpdateChannelRequest)),
+) -> ORJSONResponse:
     """Update a notification channel."""
-    try:
-        project = await _get_project(project_id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-
-    update_data = request.model_dump(exclude_unset=True)
+    update_data = set_fields(request)
     channel = await update_channel(
         project_id=str(project.id),
         channel_id=channel_id,
         data=update_data,
     )
     if not channel:
-        raise HTTPException(status_code=404, detail="Channel not found")
-    return channel
+        raise _CHANNEL_404.with_traceback(None)
+    return ORJSONResponse(content=channel)
 
 
 @router.delete("/{channel_id}")
 async def delete_channel_endpoint(
     channel_id: str,
-    project_id: str,
-) -> dict:
+    project: Project = Depends(project_dep),
+) -> ORJSONResponse:
     """Delete a notification channel."""
-    try:
-        project = await _get_project(project_id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-
     deleted = await delete_channel(
         project_id=str(project.id),
         channel_id=channel_id,
     )
     if not deleted:
-        raise HTTPException(status_code=404, detail="Channel not found")
-    return {"status": "deleted", "channel_id": channel_id}
+        raise _CHANNEL_404.with_traceback(None)
+    return ORJSONResponse(content={"status": "deleted", "channel_id": channel_id})
 
 
 @router.post("/{channel_id}/test")
 async def test_channel_endpoint(
     channel_id: str,
-    project_id: str,
-) -> dict:
-    """Send a test notification to a channel."""
-    try:
-        project = await _get_project(project_id)
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
-
-    channel = await get_channel(
+    background_tasks: BackgroundTasks,
+    project: Project = Depends(project_dep),
+) -> ORJSONResponse:
+    """Queue a test notification to a channel; it is delivered after the response is sent."""
+    channel = await get_channel_model(
         project_id=str(project.id),
         channel_id=channel_id,
     )
     if not channel:
-        raise HTTPException(status_code=404, detail="Channel not found")
-    logger.info("Test notification sent to channel: %s (%s)", channel["name"], channel["type"])
-    return {"status": "success", "message": f"Test notification sent to {channel['name']}"}
+        raise _CHANNEL_404.with_traceback(None)
+    background_tasks.add_task(send_test_notification, channel)
+    return ORJSONResponse(content={"status": "queued", "message": f"Test notification queued for {channel.name}"})
@@ -2,6 +2,7 @@
 import asyncio
 import logging
 import os
+import random
 import sys
 
 # Add workspace root to path (contains shared/)
@@ -16,10 +17,13 @@ from shared.utils.database import setup_django
 setup_django()
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from shared.utils.responses import install_validation_handler
 from app.api import alert_conditions, alert_policies, notification_channels, muting_rules, active_alerts
+from app.api.deps import install_msgspec_openapi
 from app.services.evaluator import evaluate_all_conditions
+from app.services.notifier import close_http
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +31,7 @@ app = FastAPI(
     title="SRE Copilot Alerting Service",
     description="Advanced alerting for APM metrics - conditions, policies, channels, muting",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Include routers
@@ -36,6 +41,9 @@ app.include_router(notification_channels.router)
 app.include_router(muting_rules.router)
 app.include_router(active_alerts.router)
 
+# Document the msgspec-decoded request bodies, which FastAPI can't introspect
+install_msgspec_openapi(app)
+
 # Install centralized 422->400 validation error handler
 install_validation_handler(app)
 
@@ -53,18 +61,37 @@ async def health_check() -> dict:
     return {"status": "healthy", "service": "alerting-service"}
 
 
+# Evaluation cadence; each sleep is jittered so restarted/replicated evaluators
+# drift apart instead of hitting Postgres on the same second every minute
+EVALUATION_INTERVAL_SECONDS = 60
+EVALUATION_JITTER_SECONDS = 5
+
+
 async def alert_evaluation_loop():
-    """Background loop that evaluates alert conditions every 60 seconds."""
+    """Background loop that evaluates alert conditions every ~60 seconds."""
     while True:
         try:
             await evaluate_all_conditions()
         except Exception as e:
             logger.error("Alert evaluation error: %s", e)
-        await asyncio.sleep(60)
+        await asyncio.sleep(
+            EVALUATION_INTERVAL_SECONDS + random.uniform(-EVALUATION_JITTER_SECONDS, EVALUATION_JITTER_SECONDS)
+        )
 
 
 @app.on_event("startup")
 async def startup_event() -> None:
     """Startup event."""
     logger.info("SRE Copilot Alerting Service starting up...")
+    # Python 3.12+: run new tasks eagerly until their first real suspension, so
+    # the evaluator's per-condition fan-out skips a loop round trip when a
+    # condition returns early
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
     asyncio.create_task(alert_evaluation_loop())
+
+
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    """Shutdown event."""
+    await close_http()
@@ -1 +0,0 @@
-"""Demo data - emptied after migration to PostgreSQL."""
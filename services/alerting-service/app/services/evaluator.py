@@ -5,10 +5,16 @@ fires alerts when conditions are met, resolves when conditions clear.
 """
 import asyncio
 import logging
+import time
+from collections import defaultdict
 from datetime import timedelta
+from functools import lru_cache
+from operator import eq, ge, gt, le, lt, ne
+from typing import List, Optional, Set, Tuple
 
 from asgiref.sync import sync_to_async
-from django.db.models import Avg
+from django.db import IntegrityError
+from django.db.models import Avg, Count, Q
 from django.utils import timezone
 
 from shared.models.observability import (
@@ -19,53 +25,84 @@ from shared.models.observability import (
     HostMetric,
 )
 from app.services.notifier import send_notifications
+from app.storage import get_config_version
 
 logger = logging.getLogger(__name__)
 
+# Enabled conditions change rarely, so evaluation passes reuse the last fetch
+# (config_version, expires_at monotonic seconds, conditions). Every condition
+# write goes through app.storage and bumps the config version; the TTL is only
+# a backstop.
+CONDITIONS_CACHE_TTL_SECONDS = 300
+_conditions_cache: Optional[Tuple[int, float, List[AlertCondition]]] = None
+
+# In-flight notification sends; the event loop only keeps weak references to tasks
+_notification_tasks: Set[asyncio.Task] = set()
+
+
+async def get_enabled_conditions():
+    """Get all enabled alert conditions, cached until the next config write"""
+    global _conditions_cache
+    version = get_config_version()
+    now = time.monotonic()
+    if _conditions_cache and _conditions_cache[0] == version and _conditions_cache[1] > now:
+        return _conditions_cache[2]
+
+    conditions = [
+        condition
+        async for condition in AlertCondition.objects.filter(is_enabled=True).select_related("project", "tenant")
+    ]
+    _conditions_cache = (version, now + CONDITIONS_CACHE_TTL_SECONDS, conditions)
+    return conditions
+
 
 async def evaluate_all_conditions():
     """Evaluate all enabled alert conditions across all projects"""
-    conditions = await sync_to_async(list)(
-        AlertCondition.objects.filter(is_enabled=True).select_related("project", "tenant")
+    conditions = await get_enabled_conditions()
+    if not conditions:
+        return
+
+    # All grouped metric queries run in a single thread hop
+    current_values = await sync_to_async(collect_metric_values)(conditions, timezone.now())
+
+    results = await asyncio.gather(
+        *(evaluate_condition(condition, current_values.get(condition.id)) for condition in conditions),
+        return_exceptions=True,
     )
+    for condition, result in zip(conditions, results):
+        if isinstance(result, Exception):
+            logger.error("Error evaluating condition %s: %s", condition.id, result)
 
-    for condition in conditions:
-        try:
-            await evaluate_condition(condition)
-        except Exception as e:
-            logger.error("Error evaluating condition %s: %s", condition.id, e)
 
+async def evaluate_condition(condition, current_value):
+    """Evaluate a single alert condition against its current metric value"""
+    if current_value is None:
+        return  # No data to evaluate
 
-async def evaluate_condition(condition):
-    """Evaluate a single alert condition against recent metrics"""
     project_id = condition.project_id
     metric_name = condition.metric_name
     service_name = condition.service_name
     threshold = condition.threshold
     operator = condition.operator
-    duration_minutes = condition.duration_minutes
-
-    # Get recent metric values based on the condition type
-    since = timezone.now() - timedelta(minutes=duration_minutes)
-
-    current_value = await get_metric_value(project_id, metric_name, service_name, since)
 
-    if current_value is None:
-        return  # No data to evaluate
-
-    is_breached = check_threshold(current_value, operator, threshold)
-
-    # Check if there's already an active alert for this condition
-    existing_alert = await sync_to_async(
-        lambda: ActiveAlert.objects.filter(
+    if not check_threshold(current_value, operator, threshold):
+        # Resolve any firing alert in one UPDATE (no-op when nothing is firing)
+        resolved = await ActiveAlert.objects.filter(
             condition=condition,
             status="firing",
-        ).first()
-    )()
+        ).aupdate(status="resolved", resolved_at=timezone.now())
+        if resolved:
+            logger.info("Alert resolved: Alert: %s", condition.name)
+        return
 
-    if is_breached and not existing_alert:
-        # Fire new alert
-        alert = await sync_to_async(ActiveAlert.objects.create)(
+    # Check if there's already an active alert for this condition
+    if await ActiveAlert.objects.filter(condition=condition, status="firing").aexists():
+        return
+
+    # Fire new alert; the partial unique constraint on firing alerts makes a
+    # concurrent evaluator's insert for the same condition fail instead of duplicating
+    try:
+        alert = await ActiveAlert.objects.acreate(
             project=condition.project,
             tenant=condition.tenant,
             condition=condition,
@@ -76,100 +113,163 @@ async def evaluate_condition(condition):
             service_name=service_name,
             metric_value=current_value,
         )
-        logger.info("Alert fired: %s for project %s", alert.title, project_id)
-
-        # Send notifications
-        await send_notifications(condition, alert)
-
-    elif not is_breached and existing_alert:
-        # Resolve alert
-        existing_alert.status = "resolved"
-        existing_alert.resolved_at = timezone.now()
-        await sync_to_async(existing_alert.save)()
-        logger.info("Alert resolved: %s", existing_alert.title)
+    except IntegrityError:
+        logger.debug("Alert for condition %s already fired by another evaluator", condition.id)
+        return
+    logger.info("Alert fired: %s for project %s", alert.title, project_id)
 
+    # Send notifications without holding up the rest of the evaluation pass
+    task = asyncio.create_task(send_notifications(condition, alert))
+    _notification_tasks.add(task)
+    task.add_done_callback(_notification_done)
 
-async def get_metric_value(project_id, metric_name, service_name, since):
-    """Get the current value for a metric"""
-    # Try MetricDataPoint first
-    queryset = MetricDataPoint.objects.filter(
-        project_id=project_id,
-        metric_name=metric_name,
-        timestamp__gte=since,
-    )
-    if service_name:
-        queryset = queryset.filter(service_name=service_name)
 
-    avg = await sync_to_async(lambda: queryset.aggregate(avg_val=Avg("value")))()
-    if avg["avg_val"] is not None:
-        return avg["avg_val"]
-
-    # Try derived metrics (error_rate, response_time, cpu, memory)
-    if "error_rate" in metric_name:
-        return await get_error_rate(project_id, service_name, since)
-    elif "response_time" in metric_name or "latency" in metric_name:
-        return await get_avg_response_time(project_id, service_name, since)
-    elif "cpu" in metric_name:
-        return await get_host_metric(project_id, "cpu_percent", since)
-    elif "memory" in metric_name:
-        return await get_host_metric(project_id, "memory_percent", since)
-
-    return None
+def _notification_done(task):
+    """Drop the finished send from _notification_tasks and log any failure"""
+    _notification_tasks.discard(task)
+    if not task.cancelled() and task.exception():
+        logger.error("Failed to send notifications: %s", task.exception())
 
 
-async def get_error_rate(project_id, service_name, since):
-    """Derive error rate from transactions: (error_count / total) * 100"""
-    def _compute():
-        qs = Transaction.objects.filter(project_id=project_id, timestamp__gte=since)
-        if service_name:
-            qs = qs.filter(service_name=service_name)
-        total = qs.count()
-        if total == 0:
-            return None
-        errors = qs.filter(error=True).count()
-        return (errors / total) * 100.0
-
-    return await sync_to_async(_compute)()
+def collect_metric_values(conditions, now):
+    """
+    Get the current value of every condition: {condition_id: value or None}.
 
+    Conditions are grouped by evaluation window, and each window issues one
+    GROUP BY query per source table (raw datapoints, then transactions and
+    host metrics for derived metrics) instead of one query per condition.
+    """
+    windows = defaultdict(list)
+    for condition in conditions:
+        windows[condition.duration_minutes].append(condition)
 
-async def get_avg_response_time(project_id, service_name, since):
-    """Derive average response time from transactions"""
-    def _compute():
-        qs = Transaction.objects.filter(project_id=project_id, timestamp__gte=since)
-        if service_name:
-            qs = qs.filter(service_name=service_name)
-        result = qs.aggregate(avg_val=Avg("duration_ms"))
-        return result["avg_val"]
+    values = {}
+    for duration_minutes, window_conditions in windows.items():
+        since = now - timedelta(minutes=duration_minutes)
+        values.update(_collect_window_values(window_conditions, since))
+    return values
 
-    return await sync_to_async(_compute)()
 
+def _collect_window_values(conditions, since):
+    """Current values for conditions sharing one evaluation window"""
+    project_ids = {c.project_id for c in conditions}
+    values = {}
 
-async def get_host_metric(project_id, field_name, since):
-    """Get average host metric (cpu_percent, memory_percent) across hosts"""
-    def _compute():
-        qs = HostMetric.objects.filter(
-            project_id=project_id,
+    # Try MetricDataPoint first
+    points = _grouped(
+        MetricDataPoint.objects.filter(
+            project_id__in=project_ids,
+            metric_name__in={c.metric_name for c in conditions},
             timestamp__gte=since,
+        ),
+        conditions,
+        ("project_id", "metric_name"),
+        avg_val=Avg("value"),
+    )
+    derived = []
+    for condition in conditions:
+        row = points.get(_group_key(condition, condition.metric_name))
+        if row is not None:
+            values[condition.id] = row["avg_val"]
+        else:
+            source = _derived_source(condition.metric_name)
+            if source:
+                derived.append((condition, source))
+    if not derived:
+        return values
+
+    # Derived metrics (error_rate, response_time, cpu, memory)
+    transaction_conditions = [c for c, source in derived if source in ("error_rate", "response_time")]
+    transactions = {}
+    if transaction_conditions:
+        transactions = _grouped(
+            Transaction.objects.filter(
+                project_id__in={c.project_id for c in transaction_conditions},
+                timestamp__gte=since,
+            ),
+            transaction_conditions,
+            ("project_id",),
+            total=Count("id"),
+            errors=Count("id", filter=Q(error=True)),
+            avg_duration=Avg("duration_ms"),
         )
-        result = qs.aggregate(avg_val=Avg(field_name))
-        return result["avg_val"]
+    hosts = {}
+    if any(source in ("cpu_percent", "memory_percent") for _, source in derived):
+        # Host metrics are averaged across all hosts of the project
+        hosts = {
+            row["project_id"]: row
+            for row in HostMetric.objects.filter(project_id__in=project_ids, timestamp__gte=since)
+            .order_by()
+            .values("project_id")
+            .annotate(cpu_percent=Avg("cpu_percent"), memory_percent=Avg("memory_percent"))
+        }
+
+    for condition, source in derived:
+        if source in ("cpu_percent", "memory_percent"):
+            row = hosts.get(condition.project_id)
+            values[condition.id] = row[source] if row else None
+            continue
+        row = transactions.get(_group_key(condition))
+        if not row:
+            values[condition.id] = None
+        elif source == "error_rate":
+            # (error_count / total) * 100
+            values[condition.id] = (row["errors"] / row["total"]) * 100.0
+        else:
+            values[condition.id] = row["avg_duration"]
+    return values
+
+
+def _grouped(queryset, conditions, fields, **aggregates):
+    """
+    Aggregate *queryset* grouped by *fields*, keyed like _group_key.
+
+    Conditions scoped to a service are grouped per service_name; unscoped ones
+    need a project-wide aggregate, so each level only runs if a condition uses it.
+    """
+    queryset = queryset.order_by()
+    rows = {}
+    service_names = {c.service_name for c in conditions if c.service_name}
+    if service_names:
+        for row in (
+            queryset.filter(service_name__in=service_names)
+            .values(*fields, "service_name")
+            .annotate(**aggregates)
+        ):
+            rows[tuple(row[f] for f in fields) + (row["service_name"],)] = row
+    if not all(c.service_name for c in conditions):
+        for row in queryset.values(*fields).annotate(**aggregates):
+            rows[tuple(row[f] for f in fields) + (None,)] = row
+    return rows
+
+
+def _group_key(condition, *fields):
+    """Lookup key into _grouped rows: (project_id, *fields, service_name or None)"""
+    return (condition.project_id, *fields, condition.service_name or None)
+
+
+@lru_cache(maxsize=1024)
+def _derived_source(metric_name):
+    """Pick the derived metric used when a metric has no raw datapoints (memoized per name)"""
+    if "error_rate" in metric_name:
+        return "error_rate"
+    if "response_time" in metric_name or "latency" in metric_name:
+        return "response_time"
+    if "cpu" in metric_name:
+        return "cpu_percent"
+    if "memory" in metric_name:
+        return "memory_percent"
+    return None
+
 
-    return await sync_to_async(_compute)()
+# Condition operator -> comparison, shared by every evaluation
+_OPERATORS = {">": gt, "<": lt, ">=": ge, "<=": le, "==": eq, "!=": ne}
 
 
 def check_threshold(value, operator, threshold):
     """Check if value satisfies the threshold condition"""
-    if operator == ">":
-        return value > threshold
-    if operator == "<":
-        return value < threshold
-    if operator == ">=":
-        return value >= threshold
-    if operator == "<=":
-        return value <= threshold
-    if operator == "==":
-        return value == threshold
-    if operator == "!=":
-        return value != threshold
-    logger.warning("Unknown operator %s, defaulting to >", operator)
-    return value > threshold
+    compare = _OPERATORS.get(operator)
+    if compare is None:
+        logger.warning("Unknown operator %s, defaulting to >", operator)
+        compare = gt
+    return compare(value, threshold)
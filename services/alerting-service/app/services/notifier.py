@@ -1,55 +1,134 @@
 """Notification delivery to configured channels"""
+import asyncio
 import logging
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-import smtplib
+import time
+import uuid
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
 
+import aiosmtplib
 import httpx
-from asgiref.sync import sync_to_async
+import orjson
+from django.utils import timezone
+
+from shared.models import NotificationChannel
+from app.storage import get_config_version
 
 logger = logging.getLogger(__name__)
 
+# One client for all webhook/API deliveries so keep-alive connections (and TLS
+# sessions) are reused across notifications; closed on service shutdown
+_http: Optional[httpx.AsyncClient] = None
+
+
+def get_http() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use"""
+    global _http
+    if _http is None:
+        _http = httpx.AsyncClient(
+            timeout=10,
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+        )
+    return _http
+
+
+async def close_http():
+    """Close the shared HTTP client"""
+    global _http
+    if _http is not None:
+        await _http.aclose()
+        _http = None
+
+
+# Enabled channels per policy: policy_id -> (config_version, expires_at, channels).
+# Invalidated by any alerting config write (see app.storage).
+CHANNELS_CACHE_TTL_SECONDS = 300
+_channels_cache: Dict[Any, Tuple[int, float, List[NotificationChannel]]] = {}
+
+
+async def get_policy_channels(policy_id):
+    """Get the enabled notification channels of a policy, cached until the next config write"""
+    version = get_config_version()
+    now = time.monotonic()
+    cached = _channels_cache.get(policy_id)
+    if cached and cached[0] == version and cached[1] > now:
+        return cached[2]
+
+    channels = [
+        channel
+        async for channel in NotificationChannel.objects.filter(policies__id=policy_id, is_enabled=True)
+    ]
+    _channels_cache[policy_id] = (version, now + CHANNELS_CACHE_TTL_SECONDS, channels)
+    return channels
+
 
 async def send_notifications(condition, alert):
     """Send alert notification to all channels in the condition's policy"""
-    if not condition.policy:
+    if not condition.policy_id:
         return
 
-    def _get_channels():
-        return list(
-            condition.policy.notification_channels.filter(is_enabled=True)
-        )
+    channels = await get_policy_channels(condition.policy_id)
 
-    channels = await sync_to_async(_get_channels)()
+    # Channels are independent, so a slow one must not hold up the rest
+    # Encoded request bodies are shared by every channel of the same type
+    payloads: Dict[str, bytes] = {}
+    results = await asyncio.gather(
+        *(send_to_channel(channel, alert, payloads) for channel in channels),
+        return_exceptions=True,
+    )
+    for channel, result in zip(channels, results):
+        if isinstance(result, Exception):
+            logger.error("Failed to notify channel %s: %s", channel.name, result)
 
-    for channel in channels:
-        try:
-            await send_to_channel(channel, alert)
-        except Exception as e:
-            logger.error("Failed to notify channel %s: %s", channel.name, e)
 
+async def send_test_notification(channel):
+    """Send a sample alert to one channel (runs after the test endpoint has responded)"""
+    alert = SimpleNamespace(
+        id=uuid.uuid4(),
+        title="Test notification",
+        description=f"Test notification from SRE Copilot for channel '{channel.name}'",
+        severity="info",
+        service_name="sre-copilot",
+        metric_value=None,
+        status="firing",
+        fired_at=timezone.now(),
+    )
+    try:
+        await send_to_channel(channel, alert)
+    except Exception as e:
+        logger.error("Failed to send test notification to channel %s: %s", channel.name, e)
+        return
+    logger.info("Test notification sent to channel: %s (%s)", channel.name, channel.channel_type)
 
-async def send_to_channel(channel, alert):
-    """Send to a specific channel type"""
-    if channel.channel_type == "slack":
-        await send_slack(channel.config, alert)
-    elif channel.channel_type == "email":
-        await send_email(channel.config, alert)
-    elif channel.channel_type == "pagerduty":
-        await send_pagerduty(channel.config, alert)
-    elif channel.channel_type == "teams":
-        await send_teams(channel.config, alert)
-    elif channel.channel_type == "webhook":
-        await send_webhook(channel.config, alert)
 
+async def send_to_channel(channel, alert, payloads=None):
+    """Send to a specific channel type (*payloads* memoizes encoded bodies per type)"""
+    handler = _HANDLERS.get(channel.channel_type)
+    if handler:
+        await handler(channel.config, alert, {} if payloads is None else payloads)
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _encoded_payload(payloads, channel_type, build, alert):
+    """Build and encode a channel type's payload once per alert"""
+    body = payloads.get(channel_type)
+    if body is None:
+        body = payloads[channel_type] = orjson.dumps(build(alert))
+    return body
+
+
+async def _post_json(url, body):
+    """POST a pre-encoded JSON body with the shared client"""
+    await get_http().post(url, content=body, headers=_JSON_HEADERS)
 
-async def send_slack(config, alert):
-    """Send Slack notification via webhook"""
-    webhook_url = config.get("webhook_url")
-    if not webhook_url:
-        return
 
-    payload = {
+def _slack_payload(alert):
+    """Slack incoming-webhook message"""
+    return {
         "text": (
             f"🚨 *{alert.title}*\n"
             f"{alert.description}\n"
@@ -57,11 +136,18 @@ async def send_slack(config, alert):
             f"Service: {alert.service_name}"
         )
     }
-    async with httpx.AsyncClient() as client:
-        await client.post(webhook_url, json=payload)
 
 
-async def send_email(config, alert):
+async def send_slack(config, alert, payloads):
+    """Send Slack notification via webhook"""
+    webhook_url = config.get("webhook_url")
+    if not webhook_url:
+        return
+
+    await _post_json(webhook_url, _encoded_payload(payloads, "slack", _slack_payload, alert))
+
+
+async def send_email(config, alert, payloads):
     """Send email notification via SMTP"""
     smtp_host = config.get("smtp_host")
     smtp_port = config.get("smtp_port", 587)
@@ -74,38 +160,31 @@ async def send_email(config, alert):
         logger.warning("Email config incomplete: missing smtp_host, from_email, or to_emails")
         return
 
-    def _send():
-        msg = MIMEMultipart("alternative")
-        msg["Subject"] = f"[{alert.severity}] {alert.title}"
-        msg["From"] = from_email
-        msg["To"] = ", ".join(to_emails)
-
-        body = (
-            f"{alert.title}\n\n"
-            f"{alert.description}\n\n"
-            f"Severity: {alert.severity}\n"
-            f"Service: {alert.service_name or 'N/A'}\n"
-        )
-        if alert.metric_value is not None:
-            body += f"Metric Value: {alert.metric_value}\n"
-        msg.attach(MIMEText(body, "plain"))
-
-        with smtplib.SMTP(smtp_host, smtp_port) as server:
-            server.starttls()
-            if smtp_user and smtp_password:
-                server.login(smtp_user, smtp_password)
-            server.sendmail(from_email, to_emails, msg.as_string())
+    msg = MIMEMultipart("alternative")
+    msg["Subject"] = f"[{alert.severity}] {alert.title}"
+    msg["From"] = from_email
+    msg["To"] = ", ".join(to_emails)
 
-    await sync_to_async(_send)()
+    body = (
+        f"{alert.title}\n\n"
+        f"{alert.description}\n\n"
+        f"Severity: {alert.severity}\n"
+        f"Service: {alert.service_name or 'N/A'}\n"
+    )
+    if alert.metric_value is not None:
+        body += f"Metric Value: {alert.metric_value}\n"
+    msg.attach(MIMEText(body, "plain"))
 
+    # Native async SMTP: no executor thread is held for the whole exchange
+    async with aiosmtplib.SMTP(hostname=smtp_host, port=smtp_port, start_tls=True) as server:
+        if smtp_user and smtp_password:
+            await server.login(smtp_user, smtp_password)
+        await server.send_message(msg, sender=from_email, recipients=to_emails)
 
-async def send_pagerduty(config, alert):
-    """Send PagerDuty notification via Events API v2"""
-    routing_key = config.get("routing_key") or config.get("integration_key")
-    if not routing_key:
-        return
 
-    payload = {
+def _pagerduty_payload(alert, routing_key):
+    """PagerDuty Events API v2 trigger event"""
+    return {
         "routing_key": routing_key,
         "event_action": "trigger",
         "dedup_key": str(alert.id),
@@ -121,20 +200,24 @@ async def send_pagerduty(config, alert):
             },
         },
     }
-    async with httpx.AsyncClient() as client:
-        await client.post(
-            "https://events.pagerduty.com/v2/enqueue",
-            json=payload,
-        )
 
 
-async def send_teams(config, alert):
-    """Send Microsoft Teams notification via webhook"""
-    webhook_url = config.get("webhook_url")
-    if not webhook_url:
+async def send_pagerduty(config, alert, payloads):
+    """Send PagerDuty notification via Events API v2"""
+    routing_key = config.get("routing_key") or config.get("integration_key")
+    if not routing_key:
         return
 
-    payload = {
+    # The routing key is per channel, so PagerDuty bodies are not shared
+    await _post_json(
+        "https://events.pagerduty.com/v2/enqueue",
+        orjson.dumps(_pagerduty_payload(alert, routing_key)),
+    )
+
+
+def _teams_payload(alert):
+    """Teams MessageCard"""
+    return {
         "@type": "MessageCard",
         "@context": "https://schema.org/extensions",
         "summary": alert.title,
@@ -146,17 +229,20 @@ async def send_teams(config, alert):
             f"**Service:** {alert.service_name or 'N/A'}"
         ),
     }
-    async with httpx.AsyncClient() as client:
-        await client.post(webhook_url, json=payload)
 
 
-async def send_webhook(config, alert):
-    """Send to generic webhook URL"""
-    webhook_url = config.get("webhook_url") or config.get("url")
+async def send_teams(config, alert, payloads):
+    """Send Microsoft Teams notification via webhook"""
+    webhook_url = config.get("webhook_url")
     if not webhook_url:
         return
 
-    payload = {
+    await _post_json(webhook_url, _encoded_payload(payloads, "teams", _teams_payload, alert))
+
+
+def _webhook_payload(alert):
+    """Generic webhook body"""
+    return {
         "title": alert.title,
         "description": alert.description,
         "severity": alert.severity,
@@ -165,5 +251,22 @@ async def send_webhook(config, alert):
         "status": alert.status,
         "fired_at": alert.fired_at.isoformat() if alert.fired_at else None,
     }
-    async with httpx.AsyncClient() as client:
-        await client.post(webhook_url, json=payload)
+
+
+async def send_webhook(config, alert, payloads):
+    """Send to generic webhook URL"""
+    webhook_url = config.get("webhook_url") or config.get("url")
+    if not webhook_url:
+        return
+
+    await _post_json(webhook_url, _encoded_payload(payloads, "webhook", _webhook_payload, alert))
+
+
+# channel_type -> sender, looked up by send_to_channel
+_HANDLERS = {
+    "slack": send_slack,
+    "email": send_email,
+    "pagerduty": send_pagerduty,
+    "teams": send_teams,
+    "webhook": send_webhook,
+}
@@ -0,0 +1,89 @@
+"""
+Asynchronous micro-batching of single-row inserts.
+
+Concurrent create requests each hand their unsaved model instance to a
+WriteBatcher, which waits a few milliseconds for more rows and then writes
+the whole batch with one bulk INSERT instead of one round-trip per request.
+"""
+import asyncio
+import logging
+from typing import List, Optional, Tuple, Type
+
+from django.db import models
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_WAIT_SECONDS = 0.005
+
+
+class WriteBatcher:
+    """Coalesce concurrent inserts of one model into ``abulk_create`` calls."""
+
+    def __init__(
+        self,
+        model: Type[models.Model],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_seconds: float = DEFAULT_MAX_WAIT_SECONDS,
+    ):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def submit(self, obj: models.Model) -> models.Model:
+        """Queue *obj* for insertion and wait until its batch is written."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._task is None or self._task.done():
+            # (Re)start the drain task on the current loop
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._task = loop.create_task(self._run())
+
+        future: asyncio.Future = loop.create_future()
+        self._queue.put_nowait((obj, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Drain the queue in batches of up to max_batch_size / max_wait_seconds."""
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_wait_seconds
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[Tuple[models.Model, asyncio.Future]]) -> None:
+        """Write a batch; fall back to per-row inserts so one bad row cannot fail the rest."""
+        objs = [obj for obj, _ in batch]
+        try:
+            await self.model.objects.abulk_create(objs)
+        except Exception as e:
+            logger.warning(
+                "Bulk insert of %d %s rows failed (%s), retrying individually",
+                len(objs), self.model.__name__, e,
+            )
+            for obj, future in batch:
+                try:
+                    await obj.asave(force_insert=True)
+                except Exception as row_error:
+                    if not future.done():
+                        future.set_exception(row_error)
+                else:
+                    if not future.done():
+                        future.set_result(obj)
+            return
+
+        for obj, future in batch:
+            if not future.done():
+                future.set_result(obj)
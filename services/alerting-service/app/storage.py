@@ -1,50 +1,132 @@
 """Django ORM-backed storage for alerting-service."""
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import time
+from datetime import datetime, timezone as dt_timezone
+from typing import Any, Dict, List, Optional, Tuple
 
+from django.db.models import Prefetch
 from django.utils import timezone
 
 from shared.models import AlertCondition, AlertPolicy, NotificationChannel, ActiveAlert, MutingRule, Project
 from shared.utils.responses import validate_project_id
+from app.services.write_batcher import WriteBatcher
 
 
 # Operator mapping: API format -> Django model format
 OPERATOR_MAP = {"gt": ">", "lt": "<", "eq": "==", "gte": ">=", "lte": "<="}
 OPERATOR_REVERSE = {v: k for k, v in OPERATOR_MAP.items()}
 
+# Concurrent creates are coalesced into bulk INSERTs per model
+_condition_writer = WriteBatcher(AlertCondition)
+_policy_writer = WriteBatcher(AlertPolicy)
+_channel_writer = WriteBatcher(NotificationChannel)
+_muting_rule_writer = WriteBatcher(MutingRule)
+
+# Rows per INSERT statement for explicit bulk uploads
+BULK_CREATE_BATCH_SIZE = 500
+
+
+def _isoformat_z(dt: Optional[datetime]) -> str:
+    """
+    Format a model timestamp as RFC 3339 UTC with a ``Z`` suffix ("" when unset).
+
+    Stored timestamps are already UTC; only values echoed back from client
+    input may carry another offset and need converting.
+    """
+    if not dt:
+        return ""
+    if dt.utcoffset():
+        dt = dt.astimezone(dt_timezone.utc)
+    return f"{dt:%Y-%m-%dT%H:%M:%S.%f}Z"
+
+
+# Projects change rarely, so lookups are cached per process for a short TTL
+# (project_id -> (project, expires_at monotonic seconds)). Projects are owned
+# by auth-service, so expiry is the only invalidation.
+PROJECT_CACHE_TTL_SECONDS = 30
+PROJECT_CACHE_MAX_SIZE = 1024
+_project_cache: Dict[str, Tuple[Project, float]] = {}
+
+
+async def _get_project_or_none(project_id: str) -> Optional[Project]:
+    """Get project by ID, raises 400 if empty/invalid, returns None if not found."""
+    project_id = validate_project_id(project_id, source="query")
+    now = time.monotonic()
+    cached = _project_cache.get(project_id)
+    if cached and cached[1] > now:
+        return cached[0]
 
-async def _get_project(project_id: str) -> Project:
-    """Get project by ID, raises 400 if empty/invalid, ValueError if not found."""
-    validate_project_id(project_id, source="query")
     project = await Project.objects.filter(id=project_id).afirst()
     if not project:
-        raise ValueError("Project not found")
+        _project_cache.pop(project_id, None)
+        return None
+
+    if project_id not in _project_cache and len(_project_cache) >= PROJECT_CACHE_MAX_SIZE:
+        # Drop the oldest entry (dicts keep insertion order)
+        del _project_cache[next(iter(_project_cache))]
+    _project_cache[project_id] = (project, now + PROJECT_CACHE_TTL_SECONDS)
     return project
 
 
-def _condition_to_dict(obj: AlertCondition) -> Dict[str, Any]:
-    """Convert AlertCondition model to API response shape."""
+# Per-project write version (time.time_ns() of the last create/update/delete).
+# List endpoints cache their serialized responses per version and use it as the
+# ETag. Seeded on first read so a restart never reissues an old ETag.
+_project_versions: Dict[str, int] = {}
+# Bumped on any write in any project; the evaluator's caches key off it
+_config_version = 0
+
+
+def get_project_version(project_id: str) -> int:
+    """Return the current write version of a project's alerting config."""
+    return _project_versions.setdefault(project_id, time.time_ns())
+
+
+def get_config_version() -> int:
+    """Return a counter that changes on every alerting config write."""
+    return _config_version
+
+
+def _touch_project(project_id: str) -> None:
+    """Record a write so cached list responses for the project go stale."""
+    global _config_version
+    _project_versions[project_id] = time.time_ns()
+    _config_version += 1
+
+
+_CONDITION_VALUES = (
+    "id", "name", "metric_name", "operator", "threshold", "duration_minutes",
+    "severity", "service_name", "is_enabled", "created_at",
+)
+
+
+def _condition_to_dict(row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert an AlertCondition row to API response shape.
+
+    *row* is a ``values(*_CONDITION_VALUES)`` row, or a saved instance's
+    ``__dict__`` (same attribute names), so list endpoints skip model
+    instantiation.
+    """
+    operator = row["operator"]
     return {
-        "condition_id": str(obj.id),
-        "name": obj.name,
-        "metric_name": obj.metric_name,
-        "operator": OPERATOR_REVERSE.get(obj.operator, obj.operator),
-        "threshold": obj.threshold,
-        "duration_seconds": obj.duration_minutes * 60,
-        "severity": obj.severity,
-        "service_name": obj.service_name or "",
-        "enabled": obj.is_enabled,
-        "created_at": obj.created_at.isoformat() + "Z" if obj.created_at else "",
+        "condition_id": str(row["id"]),
+        "name": row["name"],
+        "metric_name": row["metric_name"],
+        "operator": OPERATOR_REVERSE.get(operator, operator),
+        "threshold": row["threshold"],
+        "duration_seconds": row["duration_minutes"] * 60,
+        "severity": row["severity"],
+        "service_name": row["service_name"] or "",
+        "enabled": row["is_enabled"],
+        "created_at": _isoformat_z(row["created_at"]),
     }
 
 
-async def create_condition(project_id: str, tenant_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
-    """Create an alert condition."""
+def _new_condition(project_id: str, tenant_id: str, data: Dict[str, Any]) -> AlertCondition:
+    """Build an unsaved AlertCondition from API create data."""
     operator = OPERATOR_MAP.get(data.get("operator", "gt"), ">")
     duration_seconds = data.get("duration_seconds", 300)
     duration_minutes = max(1, duration_seconds // 60)
-
-    obj = await AlertCondition.objects.acreate(
+    return AlertCondition(
         project_id=project_id,
         tenant_id=tenant_id,
         name=data["name"],
@@ -57,7 +139,23 @@ async def create_condition(project_id: str, tenant_id: str, data: Dict[str, Any]
         severity=data.get("severity", "warning"),
         is_enabled=data.get("enabled", True),
     )
-    return _condition_to_dict(obj)
+
+
+async def create_condition(project_id: str, tenant_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Create an alert condition."""
+    obj = await _condition_writer.submit(_new_condition(project_id, tenant_id, data))
+    _touch_project(project_id)
+    return _condition_to_dict(obj.__dict__)
+
+
+async def create_conditions_bulk(
+    project_id: str, tenant_id: str, items: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Create many alert conditions with batched INSERTs."""
+    objs = [_new_condition(project_id, tenant_id, data) for data in items]
+    await AlertCondition.objects.abulk_create(objs, batch_size=BULK_CREATE_BATCH_SIZE)
+    _touch_project(project_id)
+    return [_condition_to_dict(obj.__dict__) for obj in objs]
 
 
 async def list_conditions(
@@ -71,61 +169,48 @@ async def list_conditions(
         qs = qs.filter(service_name=service_name)
     if enabled is not None:
         qs = qs.filter(is_enabled=enabled)
-    qs = qs.order_by("-created_at")
-
-    result = []
-    async for obj in qs:
-        result.append(_condition_to_dict(obj))
-    return result
+    qs = qs.order_by("-created_at").values(*_CONDITION_VALUES)
+    return [_condition_to_dict(row) async for row in qs]
 
 
 async def get_condition(project_id: str, condition_id: str) -> Optional[Dict[str, Any]]:
     """Get a single alert condition by ID."""
-    obj = await AlertCondition.objects.filter(
+    row = await AlertCondition.objects.filter(
         project_id=project_id, id=condition_id
-    ).afirst()
-    return _condition_to_dict(obj) if obj else None
+    ).values(*_CONDITION_VALUES).afirst()
+    return _condition_to_dict(row) if row else None
+
+
+# API field -> model field for condition attributes copied verbatim on update
+_CONDITION_UPDATE_FIELDS = {
+    "name": "name",
+    "metric_name": "metric_name",
+    "threshold": "threshold",
+    "severity": "severity",
+    "service_name": "service_name",
+    "enabled": "is_enabled",
+}
 
 
 async def update_condition(
     project_id: str, condition_id: str, data: Dict[str, Any]
 ) -> Optional[Dict[str, Any]]:
-    """Update an alert condition."""
-    obj = await AlertCondition.objects.filter(
-        project_id=project_id, id=condition_id
-    ).afirst()
-    if not obj:
-        return None
-
-    update_fields = []
-    if "name" in data:
-        obj.name = data["name"]
-        update_fields.append("name")
-    if "metric_name" in data:
-        obj.metric_name = data["metric_name"]
-        update_fields.append("metric_name")
+    """Update an alert condition (one UPDATE, then one values() read of the result)."""
+    updates = {
+        model_field: data[api_field]
+        for api_field, model_field in _CONDITION_UPDATE_FIELDS.items()
+        if api_field in data
+    }
     if "operator" in data:
-        obj.operator = OPERATOR_MAP.get(data["operator"], data["operator"])
-        update_fields.append("operator")
-    if "threshold" in data:
-        obj.threshold = data["threshold"]
-        update_fields.append("threshold")
+        updates["operator"] = OPERATOR_MAP.get(data["operator"], data["operator"])
     if "duration_seconds" in data:
-        obj.duration_minutes = max(1, data["duration_seconds"] // 60)
-        update_fields.append("duration_minutes")
-    if "severity" in data:
-        obj.severity = data["severity"]
-        update_fields.append("severity")
-    if "service_name" in data:
-        obj.service_name = data["service_name"]
-        update_fields.append("service_name")
-    if "enabled" in data:
-        obj.is_enabled = data["enabled"]
-        update_fields.append("is_enabled")
+        updates["duration_minutes"] = max(1, data["duration_seconds"] // 60)
 
-    if update_fields:
-        await obj.asave(update_fields=update_fields)
-    return _condition_to_dict(obj)
+    qs = AlertCondition.objects.filter(project_id=project_id, id=condition_id)
+    if updates and await qs.aupdate(**updates):
+        _touch_project(project_id)
+    row = await qs.values(*_CONDITION_VALUES).afirst()
+    return _condition_to_dict(row) if row else None
 
 
 async def delete_condition(project_id: str, condition_id: str) -> bool:
@@ -133,6 +218,8 @@ async def delete_condition(project_id: str, condition_id: str) -> bool:
     deleted, _ = await AlertCondition.objects.filter(
         project_id=project_id, id=condition_id
     ).adelete()
+    if deleted:
+        _touch_project(project_id)
     return deleted > 0
 
 
@@ -145,58 +232,57 @@ def _policy_to_dict(obj: AlertPolicy, condition_ids: Optional[List[str]] = None)
         "condition_ids": condition_ids or [],
         "incident_preference": "per_condition",
         "enabled": obj.is_enabled,
-        "created_at": obj.created_at.isoformat() + "Z" if obj.created_at else "",
+        "created_at": _isoformat_z(obj.created_at),
     }
 
 
 async def create_policy(project_id: str, tenant_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
     """Create an alert policy."""
-    obj = await AlertPolicy.objects.acreate(
+    obj = await _policy_writer.submit(AlertPolicy(
         project_id=project_id,
         tenant_id=tenant_id,
         name=data["name"],
         description=data.get("description", ""),
         is_enabled=data.get("enabled", True),
-    )
+    ))
+    _touch_project(project_id)
     return _policy_to_dict(obj, data.get("condition_ids", []))
 
 
+def _policies_with_condition_ids(**filters):
+    """Policy queryset that loads every policy's condition ids in one extra query."""
+    return AlertPolicy.objects.filter(**filters).prefetch_related(
+        Prefetch("conditions", queryset=AlertCondition.objects.only("id", "policy"))
+    )
+
+
+def _condition_ids(obj: AlertPolicy) -> List[str]:
+    """Condition ids of a policy from its prefetched conditions (no query)."""
+    return [str(c.id) for c in obj.conditions.all()]
+
+
 async def list_policies(project_id: str, enabled: Optional[bool] = None) -> List[Dict[str, Any]]:
     """List alert policies for a project."""
-    qs = AlertPolicy.objects.filter(project_id=project_id)
+    qs = _policies_with_condition_ids(project_id=project_id)
     if enabled is not None:
         qs = qs.filter(is_enabled=enabled)
     qs = qs.order_by("-created_at")
-
-    result = []
-    async for obj in qs:
-        condition_ids = []
-        async for c in obj.conditions.all():
-            condition_ids.append(str(c.id))
-        result.append(_policy_to_dict(obj, condition_ids))
-    return result
+    return [_policy_to_dict(obj, _condition_ids(obj)) async for obj in qs]
 
 
 async def get_policy(project_id: str, policy_id: str) -> Optional[Dict[str, Any]]:
     """Get a single alert policy by ID."""
-    obj = await AlertPolicy.objects.filter(
-        project_id=project_id, id=policy_id
-    ).afirst()
+    obj = await _policies_with_condition_ids(project_id=project_id, id=policy_id).afirst()
     if not obj:
         return None
-    condition_ids = []
-    async for c in obj.conditions.all():
-        condition_ids.append(str(c.id))
-    return _policy_to_dict(obj, condition_ids)
+    return _policy_to_dict(obj, _condition_ids(obj))
 
 
 async def update_policy(
     project_id: str, policy_id: str, data: Dict[str, Any]
 ) -> Optional[Dict[str, Any]]:
     """Update an alert policy."""
-    obj = await AlertPolicy.objects.filter(
-        project_id=project_id, id=policy_id
-    ).afirst()
+    obj = await _policies_with_condition_ids(project_id=project_id, id=policy_id).afirst()
     if not obj:
         return None
 
@@ -213,11 +299,8 @@ async def update_policy(
 
     if update_fields:
         await obj.asave(update_fields=update_fields)
-
-    condition_ids = []
-    async for c in obj.conditions.all():
-        condition_ids.append(str(c.id))
-    return _policy_to_dict(obj, condition_ids)
+        _touch_project(project_id)
+    return _policy_to_dict(obj, _condition_ids(obj))
 
 
 async def delete_policy(project_id: str, policy_id: str) -> bool:
@@ -225,30 +308,35 @@ async def delete_policy(project_id: str, policy_id: str) -> bool:
     deleted, _ = await AlertPolicy.objects.filter(
         project_id=project_id, id=policy_id
     ).adelete()
+    if deleted:
+        _touch_project(project_id)
     return deleted > 0
 
 
-def _channel_to_dict(obj: NotificationChannel) -> Dict[str, Any]:
-    """Convert NotificationChannel model to API response shape."""
-    channel_type = obj.channel_type
+_CHANNEL_VALUES = ("id", "name", "channel_type", "config", "is_enabled", "created_at")
+
+
+def _channel_to_dict(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a NotificationChannel row (values() or instance __dict__) to API response shape."""
+    channel_type = row["channel_type"]
     if channel_type == "teams":
         channel_type = "msteams"  # API uses msteams
     return {
-        "channel_id": str(obj.id),
-        "name": obj.name,
+        "channel_id": str(row["id"]),
+        "name": row["name"],
         "type": channel_type,
-        "config": obj.config or {},
-        "enabled": obj.is_enabled,
-        "created_at": obj.created_at.isoformat() + "Z" if obj.created_at else "",
+        "config": row["config"] or {},
+        "enabled": row["is_enabled"],
+        "created_at": _isoformat_z(row["created_at"]),
     }
 
 
-async def create_channel(project_id: str, tenant_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
-    """Create a notification channel."""
+def _new_channel(project_id: str, tenant_id: str, data: Dict[str, Any]) -> NotificationChannel:
+    """Build an unsaved NotificationChannel from API create data."""
     channel_type = data.get("type", "webhook")
     if channel_type == "msteams":
         channel_type = "teams"  # Django model uses "teams"
-    obj = await NotificationChannel.objects.acreate(
+    return NotificationChannel(
         project_id=project_id,
         tenant_id=tenant_id,
         name=data["name"],
@@ -256,54 +344,69 @@ async def create_channel(project_id: str, tenant_id: str, data: Dict[str, Any])
         config=data.get("config", {}),
         is_enabled=data.get("enabled", True),
     )
-    return _channel_to_dict(obj)
+
+
+async def create_channel(project_id: str, tenant_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Create a notification channel."""
+    obj = await _channel_writer.submit(_new_channel(project_id, tenant_id, data))
+    _touch_project(project_id)
+    return _channel_to_dict(obj.__dict__)
+
+
+async def create_channels_bulk(
+    project_id: str, tenant_id: str, items: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Create many notification channels with batched INSERTs."""
+    objs = [_new_channel(project_id, tenant_id, data) for data in items]
+    await NotificationChannel.objects.abulk_create(objs, batch_size=BULK_CREATE_BATCH_SIZE)
+    _touch_project(project_id)
+    return [_channel_to_dict(obj.__dict__) for obj in objs]
 
 
 async def list_channels(project_id: str) -> List[Dict[str, Any]]:
     """List notification channels for a project."""
-    result = []
-    async for obj in NotificationChannel.objects.filter(
+    qs = NotificationChannel.objects.filter(
         project_id=project_id
-    ).order_by("-created_at"):
-        result.append(_channel_to_dict(obj))
-    return result
+    ).order_by("-created_at").values(*_CHANNEL_VALUES)
+    return [_channel_to_dict(row) async for row in qs]
 
 
 async def get_channel(project_id: str, channel_id: str) -> Optional[Dict[str, Any]]:
     """Get a single notification channel by ID."""
-    obj = await NotificationChannel.objects.filter(
+    row = await NotificationChannel.objects.filter(
+        project_id=project_id, id=channel_id
+    ).values(*_CHANNEL_VALUES).afirst()
+    return _channel_to_dict(row) if row else None
+
+
+async def get_channel_model(project_id: str, channel_id: str) -> Optional[NotificationChannel]:
+    """Get a notification channel model instance (for delivery)."""
+    return await NotificationChannel.objects.filter(
         project_id=project_id, id=channel_id
     ).afirst()
-    return _channel_to_dict(obj) if obj else None
+
+
+# API field -> model field for channel attributes copied verbatim on update
+_CHANNEL_UPDATE_FIELDS = {"name": "name", "config": "config", "enabled": "is_enabled"}
 
 
 async def update_channel(
     project_id: str, channel_id: str, data: Dict[str, Any]
 ) -> Optional[Dict[str, Any]]:
-    """Update a notification channel."""
-    obj = await NotificationChannel.objects.filter(
-        project_id=project_id, id=channel_id
-    ).afirst()
-    if not obj:
-        return None
-
-    update_fields = []
-    if "name" in data:
-        obj.name = data["name"]
-        update_fields.append("name")
+    """Update a notification channel (one UPDATE, then one values() read of the result)."""
+    updates = {
+        model_field: data[api_field]
+        for api_field, model_field in _CHANNEL_UPDATE_FIELDS.items()
+        if api_field in data
+    }
     if "type" in data:
-        obj.channel_type = "teams" if data["type"] == "msteams" else data["type"]
-        update_fields.append("channel_type")
-    if "config" in data:
-        obj.config = data["config"]
-        update_fields.append("config")
-    if "enabled" in data:
-        obj.is_enabled = data["enabled"]
-        update_fields.append("is_enabled")
+        updates["channel_type"] = "teams" if data["type"] == "msteams" else data["type"]
 
-    if update_fields:
-        await obj.asave(update_fields=update_fields)
-    return _channel_to_dict(obj)
+    qs = NotificationChannel.objects.filter(project_id=project_id, id=channel_id)
+    if updates and await qs.aupdate(**updates):
+        _touch_project(project_id)
+    row = await qs.values(*_CHANNEL_VALUES).afirst()
+    return _channel_to_dict(row) if row else None
 
 
 async def delete_channel(project_id: str, channel_id: str) -> bool:
@@ -311,22 +414,29 @@ async def delete_channel(project_id: str, channel_id: str) -> bool:
     deleted, _ = await NotificationChannel.objects.filter(
         project_id=project_id, id=channel_id
     ).adelete()
+    if deleted:
+        _touch_project(project_id)
     return deleted > 0
 
 
-def _muting_rule_to_dict(obj: MutingRule) -> Dict[str, Any]:
-    """Convert MutingRule model to API response shape."""
+_MUTING_RULE_VALUES = (
+    "id", "name", "description", "matchers", "starts_at", "ends_at", "is_active", "created_at",
+)
+
+
+def _muting_rule_to_dict(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a MutingRule row (values() or instance __dict__) to API response shape."""
     return {
-        "rule_id": str(obj.id),
-        "name": obj.name,
-        "description": obj.description or "",
+        "rule_id": str(row["id"]),
+        "name": row["name"],
+        "description": row["description"] or "",
         "condition_ids": [],
-        "match_criteria": obj.matchers or {},
-        "start_time": obj.starts_at.isoformat() + "Z" if obj.starts_at else "",
-        "end_time": obj.ends_at.isoformat() + "Z" if obj.ends_at else "",
+        "match_criteria": row["matchers"] or {},
+        "start_time": _isoformat_z(row["starts_at"]),
+        "end_time": _isoformat_z(row["ends_at"]),
         "repeat": "none",
-        "enabled": obj.is_active,
-        "created_at": obj.created_at.isoformat() + "Z" if obj.created_at else "",
+        "enabled": row["is_active"],
+        "created_at": _isoformat_z(row["created_at"]),
     }
 
 
@@ -334,19 +444,14 @@ async def create_muting_rule(
     project_id: str, tenant_id: str, data: Dict[str, Any]
 ) -> Dict[str, Any]:
     """Create a muting rule."""
-    now = timezone.now()
     start_str = data.get("start_time") or ""
     end_str = data.get("end_time") or ""
-    if not start_str:
-        start_time = now
-    else:
-        start_time = datetime.fromisoformat(start_str.replace("Z", "+00:00"))
-    if not end_str:
-        end_time = now
-    else:
-        end_time = datetime.fromisoformat(end_str.replace("Z", "+00:00"))
-
-    obj = await MutingRule.objects.acreate(
+    # Missing bounds default to now; fromisoformat accepts a trailing "Z" (3.11+)
+    now = None if start_str and end_str else timezone.now()
+    start_time = datetime.fromisoformat(start_str) if start_str else now
+    end_time = datetime.fromisoformat(end_str) if end_str else now
+
+    obj = await _muting_rule_writer.submit(MutingRule(
         project_id=project_id,
         tenant_id=tenant_id,
         name=data["name"],
@@ -356,18 +461,17 @@ async def create_muting_rule(
         ends_at=end_time,
         is_active=data.get("enabled", True),
         created_by=data.get("created_by", ""),
-    )
-    return _muting_rule_to_dict(obj)
+    ))
+    _touch_project(project_id)
+    return _muting_rule_to_dict(obj.__dict__)
 
 
 async def list_muting_rules(project_id: str) -> List[Dict[str, Any]]:
     """List muting rules for a project."""
-    result = []
-    async for obj in MutingRule.objects.filter(
+    qs = MutingRule.objects.filter(
         project_id=project_id
-    ).order_by("-created_at"):
-        result.append(_muting_rule_to_dict(obj))
-    return result
+    ).order_by("-created_at").values(*_MUTING_RULE_VALUES)
+    return [_muting_rule_to_dict(row) async for row in qs]
 
 
 async def delete_muting_rule(project_id: str, rule_id: str) -> bool:
@@ -375,32 +479,41 @@ async def delete_muting_rule(project_id: str, rule_id: str) -> bool:
     deleted, _ = await MutingRule.objects.filter(
         project_id=project_id, id=rule_id
     ).adelete()
+    if deleted:
+        _touch_project(project_id)
     return deleted > 0
 
 
-def _active_alert_to_dict(obj: ActiveAlert, condition_name: str = "") -> Dict[str, Any]:
-    """Convert ActiveAlert model to API response shape."""
+_ACTIVE_ALERT_VALUES = (
+    "id", "condition_id", "condition__name", "fired_at", "severity", "description",
+    "title", "metric_value", "status", "acknowledged_at", "service_name",
+)
+
+
+def _active_alert_to_dict(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a ``values(*_ACTIVE_ALERT_VALUES)`` ActiveAlert row to API response shape."""
     return {
-        "alert_id": str(obj.id),
-        "condition_id": str(obj.condition_id) if obj.condition_id else "",
-        "condition_name": condition_name,
-        "fired_at": obj.fired_at.isoformat() + "Z" if obj.fired_at else "",
-        "severity": obj.severity,
-        "message": obj.description or obj.title,
-        "current_value": obj.metric_value,
+        "alert_id": str(row["id"]),
+        "condition_id": str(row["condition_id"]) if row["condition_id"] else "",
+        "condition_name": row["condition__name"] if row["condition_id"] else "Unknown",
+        "fired_at": _isoformat_z(row["fired_at"]),
+        "severity": row["severity"],
+        "message": row["description"] or row["title"],
+        "current_value": row["metric_value"],
         "threshold": None,
-        "status": obj.status,
-        "acknowledged": obj.acknowledged_at is not None,
-        "service_name": obj.service_name or "",
+        "status": row["status"],
+        "acknowledged": row["acknowledged_at"] is not None,
+        "service_name": row["service_name"] or "",
     }
 
 
 async def list_active_alerts(project_id: str) -> List[Dict[str, Any]]:
-    """List active alerts for a project."""
-    result = []
-    async for obj in ActiveAlert.objects.filter(
+    """List active alerts for a project.
+
+    Condition names come from the same joined query (condition__name), so
+    neither alerts nor conditions are instantiated as models.
+    """
+    qs = ActiveAlert.objects.filter(
         project_id=project_id
-    ).select_related("condition").order_by("-fired_at"):
-        cond_name = obj.condition.name if obj.condition else "Unknown"
-        result.append(_active_alert_to_dict(obj, cond_name))
-    return result
+    ).order_by("-fired_at").values(*_ACTIVE_ALERT_VALUES)
+    return [_active_alert_to_dict(row) async for row in qs]
@@ -15,8 +15,9 @@ from fastapi import APIRouter, Depends, Header, HTTPException, Request, Query
 from fastapi.responses import Response
 from pydantic import BaseModel
 
-from app.api.proxy import get_current_user_from_token, get_internal_headers
+from app.api.proxy import get_current_user_from_token
 from app.core.config import settings
+from app.core.http_client import get_http
 
 logger = logging.getLogger(__name__)
 
@@ -702,14 +703,14 @@ async def analyze_dashboard(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            ai_resp = await client.post(
-                f"{settings.AI_SERVICE_URL}/analyze-dashboard",
-                json=ai_payload,
-            )
-            if ai_resp.status_code == 200:
-                return ai_resp.json()
-            logger.warning("AI service returned %s: %s", ai_resp.status_code, ai_resp.text[:200])
+        ai_resp = await get_http().post(
+            f"{settings.AI_SERVICE_URL}/analyze-dashboard",
+            json=ai_payload,
+            timeout=30,
+        )
+        if ai_resp.status_code == 200:
+            return ai_resp.json()
+        logger.warning("AI service returned %s: %s", ai_resp.status_code, ai_resp.text[:200])
     except Exception as e:
         logger.warning("AI service unreachable: %s", e)
 
@@ -1110,26 +1111,26 @@ async def create_incident_from_grafana(
 
     # Try AI-enhanced title/description
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
-            ai_resp = await client.post(
-                f"{settings.AI_SERVICE_URL}/generate-incident-from-anomaly",
-                json={
-                    "metric_name": body.metric_name,
-                    "panel_title": body.panel_title,
-                    "latest_value": body.latest_value,
-                    "expected_value": body.expected_value,
-                    "expr": body.expr[:200],
-                    "service_name": body.service_name,
-                },
-            )
-            if ai_resp.status_code == 200:
-                ai_data = ai_resp.json()
-                title = ai_data.get("title", title)
-                description = ai_data.get("description", description)
-                if ai_data.get("severity"):
-                    body.severity = ai_data["severity"]
-                if ai_data.get("service_name"):
-                    body.service_name = ai_data["service_name"]
+        ai_resp = await get_http().post(
+            f"{settings.AI_SERVICE_URL}/generate-incident-from-anomaly",
+            json={
+                "metric_name": body.metric_name,
+                "panel_title": body.panel_title,
+                "latest_value": body.latest_value,
+                "expected_value": body.expected_value,
+                "expr": body.expr[:200],
+                "service_name": body.service_name,
+            },
+            timeout=15,
+        )
+        if ai_resp.status_code == 200:
+            ai_data = ai_resp.json()
+            title = ai_data.get("title", title)
+            description = ai_data.get("description", description)
+            if ai_data.get("severity"):
+                body.severity = ai_data["severity"]
+            if ai_data.get("service_name"):
+                body.service_name = ai_data["service_name"]
     except Exception as e:
         logger.info("AI incident generation unavailable, using defaults: %s", e)
 
@@ -1142,24 +1143,23 @@ async def create_incident_from_grafana(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
-            resp = await client.post(
-                f"{settings.INCIDENT_SERVICE_URL}/incidents",
-                json=incident_payload,
-                headers=get_internal_headers(),
-            )
-            if resp.status_code in (200, 201):
-                return {
-                    "success": True,
-                    "incident": resp.json(),
-                    "grafana_context": {
-                        "dashboard_uid": body.dashboard_uid,
-                        "panel_id": body.panel_id,
-                        "metric_name": body.metric_name,
-                    },
-                }
-            else:
-                raise HTTPException(status_code=resp.status_code, detail=resp.text[:300])
+        resp = await get_http().post(
+            f"{settings.INCIDENT_SERVICE_URL}/incidents",
+            json=incident_payload,
+            timeout=15,
+        )
+        if resp.status_code in (200, 201):
+            return {
+                "success": True,
+                "incident": resp.json(),
+                "grafana_context": {
+                    "dashboard_uid": body.dashboard_uid,
+                    "panel_id": body.panel_id,
+                    "metric_name": body.metric_name,
+                },
+            }
+        else:
+            raise HTTPException(status_code=resp.status_code, detail=resp.text[:300])
     except httpx.ConnectError:
         raise HTTPException(status_code=502, detail="Cannot reach incident service")
 
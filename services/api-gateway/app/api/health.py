@@ -1,11 +1,13 @@
 """
 Health check endpoints
 """
+import asyncio
+
 from fastapi import APIRouter, HTTPException
 from datetime import datetime
-import httpx
 
 from app.core.config import settings
+from app.core.http_client import get_http
 
 router = APIRouter()
 
@@ -30,27 +32,29 @@ async def services_health():
         "integration": settings.INTEGRATION_SERVICE_URL
     }
 
-    health_status = {}
-
-    async with httpx.AsyncClient(timeout=5.0) as client:
-        for service_name, service_url in services.items():
-            try:
-                response = await client.get(f"{service_url}/health")
-                if response.status_code == 200:
-                    health_status[service_name] = {
-                        "status": "healthy",
-                        "response_time_ms": int(response.elapsed.total_seconds() * 1000)
-                    }
-                else:
-                    health_status[service_name] = {
-                        "status": "unhealthy",
-                        "error": f"Status code: {response.status_code}"
-                    }
-            except Exception as e:
-                health_status[service_name] = {
-                    "status": "unreachable",
-                    "error": str(e)
+    async def probe(service_name, service_url):
+        try:
+            response = await get_http().get(f"{service_url}/health", timeout=5.0)
+            if response.status_code == 200:
+                return service_name, {
+                    "status": "healthy",
+                    "response_time_ms": int(response.elapsed.total_seconds() * 1000)
                 }
+            return service_name, {
+                "status": "unhealthy",
+                "error": f"Status code: {response.status_code}"
+            }
+        except Exception as e:
+            return service_name, {
+                "status": "unreachable",
+                "error": str(e)
+            }
+
+    # Probe all services concurrently: total latency is the slowest probe, not the sum
+    results = await asyncio.gather(
+        *(probe(name, url) for name, url in services.items())
+    )
+    health_status = dict(results)
 
     # Determine overall health
     all_healthy = all(s.get("status") == "healthy" for s in health_status.values())
@@ -4,14 +4,19 @@ These are public routes that external agents/SDKs call to send telemetry data.
 Each request is authenticated by API key, which resolves to a project_id/tenant_id.
 The project_id is injected into the payload before forwarding to internal services.
 """
+import asyncio
 import hashlib
 import logging
-from typing import Optional
+import random
+import time
+from typing import Dict, Optional, Tuple
 
 from fastapi import APIRouter, Request, HTTPException, Header
 import httpx
+import orjson
 
 from app.core.config import settings
+from app.core.http_client import get_http, trace_headers
 from shared.utils.responses import validate_project_id, MISSING_REQUIRED_FIELD, error_response
 
 logger = logging.getLogger(__name__)
@@ -41,6 +46,44 @@ async def get_redis():
     return _redis_client
 
 
+# ---- In-process cache for API key lookups ----
+# Hot keys are served from process memory for a short TTL before falling back
+# to Redis (shared across gateway processes) and then auth-service.
+# key_hash -> (api context, expires_at monotonic seconds)
+
+API_KEY_LOCAL_CACHE_TTL_SECONDS = 30
+API_KEY_LOCAL_CACHE_MAX_SIZE = 10_000
+_local_api_key_cache: Dict[str, Tuple[dict, float]] = {}
+
+# Recently rejected keys are tracked separately (key_hash -> expires_at) so a
+# flood of bad keys is refused without network I/O and cannot evict valid
+# keys from the cache above.
+BAD_API_KEY_CACHE_TTL_SECONDS = 30
+BAD_API_KEY_CACHE_MAX_SIZE = 50_000
+_bad_api_keys: Dict[str, float] = {}
+
+
+def _cache_api_key_locally(key_hash: str, data: dict) -> None:
+    """Remember an API key lookup result in process memory"""
+    if not data.get("valid"):
+        _remember_bad_api_key(key_hash)
+        return
+    # A key that validates again is no longer bad
+    _bad_api_keys.pop(key_hash, None)
+    if key_hash not in _local_api_key_cache and len(_local_api_key_cache) >= API_KEY_LOCAL_CACHE_MAX_SIZE:
+        # Drop the oldest entry (dicts keep insertion order)
+        del _local_api_key_cache[next(iter(_local_api_key_cache))]
+    _local_api_key_cache[key_hash] = (data, time.monotonic() + API_KEY_LOCAL_CACHE_TTL_SECONDS)
+
+
+def _remember_bad_api_key(key_hash: str) -> None:
+    """Remember a rejected API key so repeats are refused locally"""
+    _local_api_key_cache.pop(key_hash, None)
+    if key_hash not in _bad_api_keys and len(_bad_api_keys) >= BAD_API_KEY_CACHE_MAX_SIZE:
+        del _bad_api_keys[next(iter(_bad_api_keys))]
+    _bad_api_keys[key_hash] = time.monotonic() + BAD_API_KEY_CACHE_TTL_SECONDS
+
+
 # ---- API Key Authentication ----
 
 async def validate_api_key(x_api_key: Optional[str] = Header(None)) -> dict:
@@ -54,14 +97,23 @@ async def validate_api_key(x_api_key: Optional[str] = Header(None)) -> dict:
 
     key_hash = hashlib.sha256(x_api_key.encode()).hexdigest()
 
-    # Try Redis cache first
+    # Try the in-process caches first
+    now = time.monotonic()
+    local = _local_api_key_cache.get(key_hash)
+    if local and local[1] > now:
+        return local[0]
+    bad_until = _bad_api_keys.get(key_hash)
+    if bad_until and bad_until > now:
+        raise HTTPException(status_code=401, detail="Invalid or inactive API key")
+
+    # Then Redis
     redis = await get_redis()
     if redis:
         try:
-            import json
             cached = await redis.get(f"apikey:{key_hash}")
             if cached:
-                data = json.loads(cached)
+                data = orjson.loads(cached)
+                _cache_api_key_locally(key_hash, data)
                 if data.get("valid"):
                     return data
                 else:
@@ -73,31 +125,33 @@ async def validate_api_key(x_api_key: Optional[str] = Header(None)) -> dict:
 
     # DB lookup via auth-service
     try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            response = await client.post(
-                f"{settings.AUTH_SERVICE_URL}/internal/validate-api-key",
-                json={"key_hash": key_hash},
-                headers={"X-Internal-Service-Key": settings.INTERNAL_SERVICE_KEY} if settings.INTERNAL_SERVICE_KEY else {}
-            )
-            if response.status_code == 200:
-                data = response.json()
-                # Cache the result in Redis (TTL 5 minutes)
-                if redis:
-                    try:
-                        import json
-                        await redis.setex(f"apikey:{key_hash}", 300, json.dumps(data))
-                    except Exception:
-                        pass
-                return data
-            else:
-                # Cache negative result briefly (30s)
-                if redis:
-                    try:
-                        import json
-                        await redis.setex(f"apikey:{key_hash}", 30, json.dumps({"valid": False}))
-                    except Exception:
-                        pass
-                raise HTTPException(status_code=401, detail="Invalid or inactive API key")
+        response = await get_http().post(
+            f"{settings.AUTH_SERVICE_URL}/internal/validate-api-key",
+            json={"key_hash": key_hash},
+            timeout=10
+        )
+        if response.status_code == 200:
+            data = response.json()
+            _cache_api_key_locally(key_hash, data)
+            # Cache the result in Redis (TTL 5 minutes)
+            if redis:
+                try:
+                    await redis.setex(f"apikey:{key_hash}", 300, orjson.dumps(data))
+                except Exception:
+                    pass
+            return data
+        elif response.status_code >= 500:
+            # auth-service failure says nothing about the key; don't cache it
+            raise HTTPException(status_code=503, detail="Authentication service unavailable")
+        else:
+            # Cache negative result briefly (30s)
+            _remember_bad_api_key(key_hash)
+            if redis:
+                try:
+                    await redis.setex(f"apikey:{key_hash}", 30, orjson.dumps({"valid": False}))
+                except Exception:
+                    pass
+            raise HTTPException(status_code=401, detail="Invalid or inactive API key")
     except HTTPException:
         raise
     except Exception as e:
@@ -105,16 +159,36 @@ async def validate_api_key(x_api_key: Optional[str] = Header(None)) -> dict:
         raise HTTPException(status_code=503, detail="Authentication service unavailable")
 
 
-def get_internal_headers() -> dict:
-    """Internal service headers"""
-    headers = {}
-    if settings.INTERNAL_SERVICE_KEY:
-        headers["X-Internal-Service-Key"] = settings.INTERNAL_SERVICE_KEY
-    return headers
+# The shared client already carries the internal service headers
+_INGEST_HEADERS = {"Content-Type": "application/json"}
 
 
 # ---- Ingest Endpoints ----
 
+# Upstream statuses that mean the request was not processed (service
+# restarting or overloaded), so resending cannot duplicate telemetry.
+# 504 is excluded: the upstream may have accepted the batch before timing out.
+INGEST_RETRY_STATUSES = (502, 503)
+INGEST_MAX_ATTEMPTS = 3
+INGEST_ERROR_DETAIL_MAX_BYTES = 2048
+
+
+async def _post_with_retry(url: str, body: bytes, headers: Dict[str, str]) -> httpx.Response:
+    """POST an ingest body upstream, retrying transient 502/503s with jittered backoff"""
+    for attempt in range(INGEST_MAX_ATTEMPTS):
+        response = await get_http().post(url, content=body, headers=headers)
+        if response.status_code not in INGEST_RETRY_STATUSES or attempt == INGEST_MAX_ATTEMPTS - 1:
+            return response
+        await asyncio.sleep(2 ** attempt * random.uniform(0.05, 0.2))
+
+
+async def _ingest_body(request: Request, pid: str, tid: str) -> bytes:
+    """Parse the ingest payload, inject project context and re-encode it (orjson both ways)"""
+    body = orjson.loads(await request.body())
+    body["project_id"] = pid
+    body["tenant_id"] = tid
+    return orjson.dumps(body)
+
 
 def _validate_context(api_context: dict) -> tuple[str, str]:
     """Validate that API key context has valid project_id and tenant_id."""
@@ -126,149 +200,58 @@ def _validate_context(api_context: dict) -> tuple[str, str]:
     return pid, tid
 
 
-@router.post("/metrics")
-async def ingest_metrics(request: Request, x_api_key: Optional[str] = Header(None)):
-    """Ingest metrics from user's Python SDK or custom integration"""
+async def _proxy_ingest(upstream_url: str, request: Request, x_api_key: Optional[str]):
+    """Authenticate an ingest request, inject its project context and forward it upstream"""
     api_context = await validate_api_key(x_api_key)
     pid, tid = _validate_context(api_context)
-    body = await request.json()
+    body = await _ingest_body(request, pid, tid)
 
-    # Inject project context
-    body["project_id"] = pid
-    body["tenant_id"] = tid
+    headers = {**_INGEST_HEADERS, **trace_headers(request.headers)}
+    response = await _post_with_retry(upstream_url, body, headers)
+    if response.status_code >= 400:
+        # Forward a bounded prefix of the error body; no need to decode all of it
+        detail = response.content[:INGEST_ERROR_DETAIL_MAX_BYTES].decode("utf-8", errors="replace")
+        raise HTTPException(status_code=response.status_code, detail=detail)
+    return response.json()
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.METRICS_COLLECTOR_URL}/metrics/ingest",
-            json=body,
-            headers=get_internal_headers()
-        )
-        if response.status_code >= 400:
-            raise HTTPException(status_code=response.status_code, detail=response.text)
-        return response.json()
+
+@router.post("/metrics")
+async def ingest_metrics(request: Request, x_api_key: Optional[str] = Header(None)):
+    """Ingest metrics from user's Python SDK or custom integration"""
+    return await _proxy_ingest(f"{settings.METRICS_COLLECTOR_URL}/metrics/ingest", request, x_api_key)
 
 
 @router.post("/traces")
 async def ingest_traces(request: Request, x_api_key: Optional[str] = Header(None)):
     """Ingest distributed traces from user's instrumented services"""
-    api_context = await validate_api_key(x_api_key)
-    pid, tid = _validate_context(api_context)
-    body = await request.json()
-
-    body["project_id"] = pid
-    body["tenant_id"] = tid
-
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.METRICS_COLLECTOR_URL}/traces/ingest",
-            json=body,
-            headers=get_internal_headers()
-        )
-        if response.status_code >= 400:
-            raise HTTPException(status_code=response.status_code, detail=response.text)
-        return response.json()
+    return await _proxy_ingest(f"{settings.METRICS_COLLECTOR_URL}/traces/ingest", request, x_api_key)
 
 
 @router.post("/errors")
 async def ingest_errors(request: Request, x_api_key: Optional[str] = Header(None)):
     """Ingest error events from user's applications"""
-    api_context = await validate_api_key(x_api_key)
-    pid, tid = _validate_context(api_context)
-    body = await request.json()
-
-    body["project_id"] = pid
-    body["tenant_id"] = tid
-
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.METRICS_COLLECTOR_URL}/errors/ingest",
-            json=body,
-            headers=get_internal_headers()
-        )
-        if response.status_code >= 400:
-            raise HTTPException(status_code=response.status_code, detail=response.text)
-        return response.json()
+    return await _proxy_ingest(f"{settings.METRICS_COLLECTOR_URL}/errors/ingest", request, x_api_key)
 
 
 @router.post("/logs")
 async def ingest_logs(request: Request, x_api_key: Optional[str] = Header(None)):
     """Ingest log entries from user's applications"""
-    api_context = await validate_api_key(x_api_key)
-    pid, tid = _validate_context(api_context)
-    body = await request.json()
-
-    body["project_id"] = pid
-    body["tenant_id"] = tid
-
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.LOG_SERVICE_URL}/logs/ingest",
-            json=body,
-            headers=get_internal_headers()
-        )
-        if response.status_code >= 400:
-            raise HTTPException(status_code=response.status_code, detail=response.text)
-        return response.json()
+    return await _proxy_ingest(f"{settings.LOG_SERVICE_URL}/logs/ingest", request, x_api_key)
 
 
 @router.post("/infrastructure")
 async def ingest_infrastructure(request: Request, x_api_key: Optional[str] = Header(None)):
     """Ingest host/infrastructure metrics from user's infra agent"""
-    api_context = await validate_api_key(x_api_key)
-    pid, tid = _validate_context(api_context)
-    body = await request.json()
-
-    body["project_id"] = pid
-    body["tenant_id"] = tid
-
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.METRICS_COLLECTOR_URL}/infrastructure/ingest",
-            json=body,
-            headers=get_internal_headers()
-        )
-        if response.status_code >= 400:
-            raise HTTPException(status_code=response.status_code, detail=response.text)
-        return response.json()
+    return await _proxy_ingest(f"{settings.METRICS_COLLECTOR_URL}/infrastructure/ingest", request, x_api_key)
 
 
 @router.post("/browser")
 async def ingest_browser(request: Request, x_api_key: Optional[str] = Header(None)):
     """Ingest browser/RUM data from user's browser SDK"""
-    api_context = await validate_api_key(x_api_key)
-    pid, tid = _validate_context(api_context)
-    body = await request.json()
-
-    body["project_id"] = pid
-    body["tenant_id"] = tid
-
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.METRICS_COLLECTOR_URL}/browser/ingest",
-            json=body,
-            headers=get_internal_headers()
-        )
-        if response.status_code >= 400:
-            raise HTTPException(status_code=response.status_code, detail=response.text)
-        return response.json()
+    return await _proxy_ingest(f"{settings.METRICS_COLLECTOR_URL}/browser/ingest", request, x_api_key)
 
 
 @router.post("/vulnerabilities")
 async def ingest_vulnerabilities(request: Request, x_api_key: Optional[str] = Header(None)):
     """Ingest vulnerability scan results from user's security scanning"""
-    api_context = await validate_api_key(x_api_key)
-    pid, tid = _validate_context(api_context)
-    body = await request.json()
-
-    body["project_id"] = pid
-    body["tenant_id"] = tid
-
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.SECURITY_SERVICE_URL}/vulnerabilities/ingest",
-            json=body,
-            headers=get_internal_headers()
-        )
-        if response.status_code >= 400:
-            raise HTTPException(status_code=response.status_code, detail=response.text)
-        return response.json()
+    return await _proxy_ingest(f"{settings.SECURITY_SERVICE_URL}/vulnerabilities/ingest", request, x_api_key)
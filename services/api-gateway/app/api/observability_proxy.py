@@ -1,1278 +1,584 @@
 """
 Observability proxy endpoints - routes to metrics, logs, traces, alerts, synthetics, security, and AI services
 """
-from fastapi import APIRouter, Request, HTTPException, Depends
-from fastapi.responses import JSONResponse
+import asyncio
+import time
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from urllib.parse import quote, unquote
+
+from fastapi import APIRouter, Request, Response, HTTPException, Depends
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field
+from starlette.routing import compile_path
 import httpx
+import orjson
 
 from app.core.config import settings
-from app.api.proxy import get_internal_headers, get_error_message, get_current_user_from_token
+from app.core.http_client import get_http, trace_headers
+from app.core.metrics import RESPONSE_CACHE_HITS, RESPONSE_CACHE_MISSES, UPSTREAM_LATENCY
+from app.api.proxy import get_error_message, require_user
 from shared.utils.responses import validate_project_id
 
 router = APIRouter()
 
 
-def get_project_params(user: dict, extra_params: dict = None) -> dict:
-    """Build params dict with project_id from user, merged with any extra query params.
+@lru_cache(maxsize=4096)
+def _validated_project_id(pid: str) -> str:
+    """validate_project_id for a user's project, memoized since every request from a user repeats it"""
+    return validate_project_id(pid, source="user context")
+
+
+def get_project_params(user: dict, extra_params: Iterable[Tuple[str, str]] = ()) -> List[Tuple[str, str]]:
+    """Build query params with project_id from user, appended to any extra (key, value) pairs.
+
+    Repeated keys such as ``?tag=a&tag=b`` are kept. A client-supplied
+    project_id is dropped so the user's project always wins.
 
     Raises HTTPException 400 if project_id is missing or empty.
     """
-    params = dict(extra_params) if extra_params else {}
-    pid = user.get("project_id", "")
-    validate_project_id(pid, source="user context")
-    params["project_id"] = pid
+    pid = _validated_project_id(user.get("project_id", ""))
+    params = [item for item in extra_params if item[0] != "project_id"]
+    params.append(("project_id", pid))
     return params
 
 
-# Services registry (for onboarding verify step)
-@router.get("/services/registry")
-async def get_services_registry(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to metrics-collector - services registry for project"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    params = get_project_params(user, dict(request.query_params))
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.METRICS_COLLECTOR_URL}/services/registry",
-            params=params,
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-# Metrics/APM routes (proxy to metrics-collector-service)
-@router.get("/metrics/services")
-async def list_metrics_services(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to metrics-collector - list services"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.METRICS_COLLECTOR_URL}/metrics/services",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-# Metrics services-overview route (must be before /metrics/services/{service_name}/overview)
-@router.get("/metrics/services-overview")
-async def list_metrics_services_overview(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to metrics-collector - list services with overview"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.METRICS_COLLECTOR_URL}/metrics/services-overview",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/metrics/services/{service_name}/overview")
-async def get_service_overview(service_name: str, request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to metrics-collector - get service overview"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.METRICS_COLLECTOR_URL}/metrics/services/{service_name}/overview",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/metrics/services/{service_name}/transactions")
-async def get_service_transactions(service_name: str, request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to metrics-collector - get service transactions"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.METRICS_COLLECTOR_URL}/metrics/services/{service_name}/transactions",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/metrics/services/{service_name}/slow-transactions")
-async def get_slow_transactions(service_name: str, request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to metrics-collector - get slow transactions"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.METRICS_COLLECTOR_URL}/metrics/services/{service_name}/slow-transactions",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/metrics/services/{service_name}/database-queries")
-async def get_database_queries(service_name: str, request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to metrics-collector - get database queries"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.METRICS_COLLECTOR_URL}/metrics/services/{service_name}/database-queries",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/metrics/services/{service_name}/external-services")
-async def get_external_services(service_name: str, request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to metrics-collector - get external services"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.METRICS_COLLECTOR_URL}/metrics/services/{service_name}/external-services",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-# Traces routes
-@router.get("/traces")
-async def list_traces(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to metrics-collector - list traces"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.METRICS_COLLECTOR_URL}/traces",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/traces/services/dependency-map")
-async def get_traces_dependency_map(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to metrics-collector - get traces dependency map"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.METRICS_COLLECTOR_URL}/traces/services/dependency-map",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/traces/{trace_id}")
-async def get_trace(trace_id: str, request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to metrics-collector - get trace by ID"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.METRICS_COLLECTOR_URL}/traces/{trace_id}",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-# Errors routes
-@router.get("/errors/groups")
-async def list_error_groups(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to metrics-collector - list error groups"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.METRICS_COLLECTOR_URL}/errors/groups",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/errors/groups/{fingerprint}")
-async def get_error_group(fingerprint: str, request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to metrics-collector - get error group"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.METRICS_COLLECTOR_URL}/errors/groups/{fingerprint}",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.patch("/errors/groups/{fingerprint}/triage")
-async def triage_error_group(fingerprint: str, request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to metrics-collector - triage error group"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    body = await request.json()
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.patch(
-            f"{settings.METRICS_COLLECTOR_URL}/errors/groups/{fingerprint}/triage",
-            json=body,
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-# Infrastructure routes
-@router.get("/infrastructure/hosts")
-async def list_infrastructure_hosts(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to metrics-collector - list infrastructure hosts"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.METRICS_COLLECTOR_URL}/infrastructure/hosts",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/infrastructure/hosts/{hostname}")
-async def get_infrastructure_host(hostname: str, request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to metrics-collector - get infrastructure host"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.METRICS_COLLECTOR_URL}/infrastructure/hosts/{hostname}",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/infrastructure/hosts/{hostname}/processes")
-async def get_host_processes(hostname: str, request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to metrics-collector - get host processes"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.METRICS_COLLECTOR_URL}/infrastructure/hosts/{hostname}/processes",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/infrastructure/hosts/{hostname}/containers")
-async def get_host_containers(hostname: str, request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to metrics-collector - get host containers"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.METRICS_COLLECTOR_URL}/infrastructure/hosts/{hostname}/containers",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-# Deployments routes
-@router.post("/deployments")
-async def create_deployment(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to metrics-collector - create deployment"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    body = await request.json()
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.METRICS_COLLECTOR_URL}/deployments",
-            json=body,
-            headers=get_internal_headers()
-        )
-        if response.status_code not in (200, 201):
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/deployments")
-async def list_deployments(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to metrics-collector - list deployments"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.METRICS_COLLECTOR_URL}/deployments",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/deployments/{deployment_id}")
-async def get_deployment(deployment_id: str, request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to metrics-collector - get deployment"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.METRICS_COLLECTOR_URL}/deployments/{deployment_id}",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-# SLOs routes
-@router.post("/slos")
-async def create_slo(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to metrics-collector - create SLO"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    body = await request.json()
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.METRICS_COLLECTOR_URL}/slos",
-            json=body,
-            headers=get_internal_headers()
-        )
-        if response.status_code not in (200, 201):
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/slos")
-async def list_slos(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to metrics-collector - list SLOs"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.METRICS_COLLECTOR_URL}/slos",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/slos/{slo_id}")
-async def get_slo(slo_id: str, request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to metrics-collector - get SLO"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.METRICS_COLLECTOR_URL}/slos/{slo_id}",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.put("/slos/{slo_id}")
-async def update_slo(slo_id: str, request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to metrics-collector - update SLO"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    body = await request.json()
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.put(
-            f"{settings.METRICS_COLLECTOR_URL}/slos/{slo_id}",
-            json=body,
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.delete("/slos/{slo_id}")
-async def delete_slo(slo_id: str, user=Depends(get_current_user_from_token)):
-    """Proxy to metrics-collector - delete SLO"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.delete(
-            f"{settings.METRICS_COLLECTOR_URL}/slos/{slo_id}",
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-# Log routes (proxy to log-service)
-@router.get("/logs/search")
-async def search_logs(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to log-service - search logs (forward query params)"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.LOG_SERVICE_URL}/logs/search",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/logs/services")
-async def list_log_services(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to log-service - list log services"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.LOG_SERVICE_URL}/logs/services",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/logs/stats")
-async def get_log_stats(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to log-service - get log stats"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.LOG_SERVICE_URL}/logs/stats",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/logs/patterns")
-async def get_log_patterns(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to log-service - get log patterns"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.LOG_SERVICE_URL}/logs/patterns",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-# Alert routes (proxy to alerting-service)
-@router.post("/alerts/conditions")
-async def create_alert_condition(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to alerting-service - create alert condition"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    body = await request.json()
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.ALERTING_SERVICE_URL}/conditions",
-            json=body,
-            headers=get_internal_headers()
-        )
-        if response.status_code not in (200, 201):
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/alerts/conditions")
-async def list_alert_conditions(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to alerting-service - list alert conditions"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.ALERTING_SERVICE_URL}/conditions",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/alerts/policies")
-async def list_alert_policies(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to alerting-service - list alert policies"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.ALERTING_SERVICE_URL}/policies",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/alerts/channels")
-async def list_alert_channels(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to alerting-service - list alert channels"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.ALERTING_SERVICE_URL}/channels",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/alerts/active-alerts")
-async def list_active_alerts(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to alerting-service - list active (firing) alerts"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.ALERTING_SERVICE_URL}/active-alerts",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/alerts/muting-rules")
-async def list_alert_muting_rules(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to alerting-service - list muting rules"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.ALERTING_SERVICE_URL}/muting-rules",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-# Synthetic routes (proxy to synthetic-service)
-@router.post("/synthetics/monitors")
-async def create_synthetic_monitor(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to synthetic-service - create monitor"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    body = await request.json()
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.SYNTHETIC_SERVICE_URL}/monitors",
-            json=body,
-            headers=get_internal_headers()
-        )
-        if response.status_code not in (200, 201):
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/synthetics/monitors")
-async def list_synthetic_monitors(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to synthetic-service - list monitors"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.SYNTHETIC_SERVICE_URL}/monitors",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/synthetics/monitors/{monitor_id}")
-async def get_synthetic_monitor(monitor_id: str, request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to synthetic-service - get monitor"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.SYNTHETIC_SERVICE_URL}/monitors/{monitor_id}",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/synthetics/monitors/{monitor_id}/results")
-async def get_synthetic_monitor_results(monitor_id: str, request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to synthetic-service - get monitor results"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.SYNTHETIC_SERVICE_URL}/monitors/{monitor_id}/results",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-# Security routes (proxy to security-service)
-@router.get("/security/vulnerabilities")
-async def list_security_vulnerabilities(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to security-service - list vulnerabilities"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.SECURITY_SERVICE_URL}/vulnerabilities",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/security/vulnerabilities/overview")
-async def get_vulnerabilities_overview(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to security-service - get vulnerabilities overview"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.SECURITY_SERVICE_URL}/vulnerabilities/overview",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.patch("/security/vulnerabilities/{vuln_id}")
-async def update_vulnerability(vuln_id: str, request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to security-service - update vulnerability"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    body = await request.json()
-    query_params = dict(request.query_params)
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.patch(
-            f"{settings.SECURITY_SERVICE_URL}/vulnerabilities/{vuln_id}",
-            json=body,
-            params=query_params,
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-# AI/Anomaly routes (proxy to ai-service)
-@router.get("/anomaly/active")
-async def get_active_anomalies(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to ai-service - get active anomalies"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.AI_SERVICE_URL}/anomaly/active",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.post("/anomaly/detect")
-async def detect_anomaly(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to ai-service - detect anomaly"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    body = await request.json()
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.AI_SERVICE_URL}/anomaly/detect",
-            json=body,
-            params=get_project_params(user),
-            headers=get_internal_headers()
-        )
-        if response.status_code not in (200, 201):
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/correlation/groups")
-async def get_correlation_groups(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to ai-service - get correlation groups"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.AI_SERVICE_URL}/correlation/groups",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-# Dashboard routes (proxy to metrics-collector-service)
-@router.post("/dashboards")
-async def create_dashboard(request: Request, user=Depends(get_current_user_from_token)):
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    body = await request.json()
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.METRICS_COLLECTOR_URL}/dashboards",
-            json=body, headers=get_internal_headers()
-        )
-        if response.status_code not in (200, 201):
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/dashboards")
-async def list_dashboards(request: Request, user=Depends(get_current_user_from_token)):
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.METRICS_COLLECTOR_URL}/dashboards",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/dashboards/{dashboard_id}")
-async def get_dashboard(dashboard_id: str, request: Request, user=Depends(get_current_user_from_token)):
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.METRICS_COLLECTOR_URL}/dashboards/{dashboard_id}",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.put("/dashboards/{dashboard_id}")
-async def update_dashboard(dashboard_id: str, request: Request, user=Depends(get_current_user_from_token)):
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    body = await request.json()
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.put(
-            f"{settings.METRICS_COLLECTOR_URL}/dashboards/{dashboard_id}",
-            json=body, headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.delete("/dashboards/{dashboard_id}")
-async def delete_dashboard(dashboard_id: str, user=Depends(get_current_user_from_token)):
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.delete(
-            f"{settings.METRICS_COLLECTOR_URL}/dashboards/{dashboard_id}",
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-# Browser monitoring routes (proxy to metrics-collector-service)
-@router.get("/browser/overview")
-async def get_browser_overview(request: Request, user=Depends(get_current_user_from_token)):
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.METRICS_COLLECTOR_URL}/browser/overview",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/browser/page-loads")
-async def get_browser_page_loads(request: Request, user=Depends(get_current_user_from_token)):
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.METRICS_COLLECTOR_URL}/browser/page-loads",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/browser/errors")
-async def get_browser_errors(request: Request, user=Depends(get_current_user_from_token)):
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.METRICS_COLLECTOR_URL}/browser/errors",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/browser/ajax")
-async def get_browser_ajax(request: Request, user=Depends(get_current_user_from_token)):
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.METRICS_COLLECTOR_URL}/browser/ajax",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-# ---- Cloud Connections Proxy (cloud-connector-service) ----
-
-@router.post("/connections")
-async def create_cloud_connection(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to cloud-connector-service - create cloud connection"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    body = await request.json()
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.CLOUD_CONNECTOR_URL}/connections",
-            json=body,
-            params=get_project_params(user),
-            headers=get_internal_headers()
-        )
-        if response.status_code not in (200, 201):
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/connections")
-async def list_cloud_connections(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to cloud-connector-service - list cloud connections"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.CLOUD_CONNECTOR_URL}/connections",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.post("/connections/test")
-async def test_cloud_connection(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to cloud-connector-service - test connection without saving"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    body = await request.json()
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.CLOUD_CONNECTOR_URL}/connections/test",
-            json=body,
-            params=get_project_params(user),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/connections/{connection_id}")
-async def get_cloud_connection(connection_id: str, request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to cloud-connector-service - get cloud connection"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.CLOUD_CONNECTOR_URL}/connections/{connection_id}",
-            params=get_project_params(user, dict(request.query_params)),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.patch("/connections/{connection_id}")
-async def update_cloud_connection(connection_id: str, request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to cloud-connector-service - update cloud connection"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    body = await request.json()
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.patch(
-            f"{settings.CLOUD_CONNECTOR_URL}/connections/{connection_id}",
-            json=body,
-            params=get_project_params(user),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.delete("/connections/{connection_id}")
-async def delete_cloud_connection(connection_id: str, user=Depends(get_current_user_from_token)):
-    """Proxy to cloud-connector-service - delete cloud connection"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.delete(
-            f"{settings.CLOUD_CONNECTOR_URL}/connections/{connection_id}",
-            params=get_project_params(user),
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
+def _passthrough(response: httpx.Response) -> Response:
+    """Relay an upstream JSON response as-is instead of decoding and re-encoding it"""
+    return Response(content=response.content, status_code=response.status_code, media_type="application/json")
+
+
+# Upstream error headers the client needs to act on (back off, re-auth, report)
+_FORWARDED_ERROR_HEADERS = ("retry-after", "www-authenticate", "x-request-id")
+
+
+def _error_passthrough(response: httpx.Response) -> Response:
+    """
+    Relay an upstream error response.
+
+    JSON error bodies (the backends' ``{"detail": ...}``) are forwarded as-is;
+    anything else is wrapped as ``{"detail": <text>}`` like an HTTPException.
+    """
+    headers = {
+        name: value for name in _FORWARDED_ERROR_HEADERS if (value := response.headers.get(name)) is not None
+    }
+    if response.headers.get("content-type", "").startswith("application/json"):
+        return Response(
+            content=response.content, status_code=response.status_code, media_type="application/json", headers=headers
+        )
+    return ORJSONResponse(
+        {"detail": get_error_message(response, "Request failed")}, status_code=response.status_code, headers=headers
+    )
+
+
+# ---- Pass-through proxy routes (JWT-authenticated) ----
+# Each row: (method, gateway path, settings attribute of the upstream base URL,
+# upstream path, query params to send, forward JSON body, accepted statuses).
+# Path params are substituted into the upstream path by name.
+
+_QUERY = "query"              # client query params + project_id
+_PROJECT = "project"          # project_id only
+_PASSTHROUGH = "passthrough"  # client query params only
+_CLIENT_QUERY_MODES = (_QUERY, _PASSTHROUGH)
+
+_OK = (200,)
+_CREATED = (200, 201)
+
+PROXY_ROUTES = [
+    # Services registry (for onboarding verify step)
+    ("GET", "/services/registry", "METRICS_COLLECTOR_URL", "/services/registry", _QUERY, False, _OK),
+
+    # Metrics/APM (metrics-collector-service)
+    ("GET", "/metrics/services", "METRICS_COLLECTOR_URL", "/metrics/services", _QUERY, False, _OK),
+    ("GET", "/metrics/services-overview", "METRICS_COLLECTOR_URL", "/metrics/services-overview", _QUERY, False, _OK),
+    ("GET", "/metrics/services/{service_name}/overview", "METRICS_COLLECTOR_URL", "/metrics/services/{service_name}/overview", _QUERY, False, _OK),
+    ("GET", "/metrics/services/{service_name}/transactions", "METRICS_COLLECTOR_URL", "/metrics/services/{service_name}/transactions", _QUERY, False, _OK),
+    ("GET", "/metrics/services/{service_name}/slow-transactions", "METRICS_COLLECTOR_URL", "/metrics/services/{service_name}/slow-transactions", _QUERY, False, _OK),
+    ("GET", "/metrics/services/{service_name}/database-queries", "METRICS_COLLECTOR_URL", "/metrics/services/{service_name}/database-queries", _QUERY, False, _OK),
+    ("GET", "/metrics/services/{service_name}/external-services", "METRICS_COLLECTOR_URL", "/metrics/services/{service_name}/external-services", _QUERY, False, _OK),
+
+    # Traces
+    ("GET", "/traces", "METRICS_COLLECTOR_URL", "/traces", _QUERY, False, _OK),
+    ("GET", "/traces/services/dependency-map", "METRICS_COLLECTOR_URL", "/traces/services/dependency-map", _QUERY, False, _OK),
+    ("GET", "/traces/{trace_id}", "METRICS_COLLECTOR_URL", "/traces/{trace_id}", _QUERY, False, _OK),
+
+    # Errors
+    ("GET", "/errors/groups", "METRICS_COLLECTOR_URL", "/errors/groups", _QUERY, False, _OK),
+    ("GET", "/errors/groups/{fingerprint}", "METRICS_COLLECTOR_URL", "/errors/groups/{fingerprint}", _QUERY, False, _OK),
+    ("PATCH", "/errors/groups/{fingerprint}/triage", "METRICS_COLLECTOR_URL", "/errors/groups/{fingerprint}/triage", None, True, _OK),
+
+    # Infrastructure
+    ("GET", "/infrastructure/hosts", "METRICS_COLLECTOR_URL", "/infrastructure/hosts", _QUERY, False, _OK),
+    ("GET", "/infrastructure/hosts/{hostname}", "METRICS_COLLECTOR_URL", "/infrastructure/hosts/{hostname}", _QUERY, False, _OK),
+    ("GET", "/infrastructure/hosts/{hostname}/processes", "METRICS_COLLECTOR_URL", "/infrastructure/hosts/{hostname}/processes", _QUERY, False, _OK),
+    ("GET", "/infrastructure/hosts/{hostname}/containers", "METRICS_COLLECTOR_URL", "/infrastructure/hosts/{hostname}/containers", _QUERY, False, _OK),
+
+    # Deployments
+    ("POST", "/deployments", "METRICS_COLLECTOR_URL", "/deployments", None, True, _CREATED),
+    ("GET", "/deployments", "METRICS_COLLECTOR_URL", "/deployments", _QUERY, False, _OK),
+    ("GET", "/deployments/{deployment_id}", "METRICS_COLLECTOR_URL", "/deployments/{deployment_id}", _QUERY, False, _OK),
+
+    # SLOs
+    ("POST", "/slos", "METRICS_COLLECTOR_URL", "/slos", None, True, _CREATED),
+    ("GET", "/slos", "METRICS_COLLECTOR_URL", "/slos", _QUERY, False, _OK),
+    ("GET", "/slos/{slo_id}", "METRICS_COLLECTOR_URL", "/slos/{slo_id}", _QUERY, False, _OK),
+    ("PUT", "/slos/{slo_id}", "METRICS_COLLECTOR_URL", "/slos/{slo_id}", None, True, _OK),
+    ("DELETE", "/slos/{slo_id}", "METRICS_COLLECTOR_URL", "/slos/{slo_id}", None, False, _OK),
+
+    # Logs (log-service)
+    ("GET", "/logs/search", "LOG_SERVICE_URL", "/logs/search", _QUERY, False, _OK),
+    ("GET", "/logs/services", "LOG_SERVICE_URL", "/logs/services", _QUERY, False, _OK),
+    ("GET", "/logs/stats", "LOG_SERVICE_URL", "/logs/stats", _QUERY, False, _OK),
+    ("GET", "/logs/patterns", "LOG_SERVICE_URL", "/logs/patterns", _QUERY, False, _OK),
+
+    # Alerts (alerting-service)
+    ("POST", "/alerts/conditions", "ALERTING_SERVICE_URL", "/conditions", None, True, _CREATED),
+    ("GET", "/alerts/conditions", "ALERTING_SERVICE_URL", "/conditions", _QUERY, False, _OK),
+    ("GET", "/alerts/policies", "ALERTING_SERVICE_URL", "/policies", _QUERY, False, _OK),
+    ("GET", "/alerts/channels", "ALERTING_SERVICE_URL", "/channels", _QUERY, False, _OK),
+    ("GET", "/alerts/active-alerts", "ALERTING_SERVICE_URL", "/active-alerts", _QUERY, False, _OK),
+    ("GET", "/alerts/muting-rules", "ALERTING_SERVICE_URL", "/muting-rules", _QUERY, False, _OK),
+
+    # Synthetics (synthetic-service)
+    ("POST", "/synthetics/monitors", "SYNTHETIC_SERVICE_URL", "/monitors", None, True, _CREATED),
+    ("GET", "/synthetics/monitors", "SYNTHETIC_SERVICE_URL", "/monitors", _QUERY, False, _OK),
+    ("GET", "/synthetics/monitors/{monitor_id}", "SYNTHETIC_SERVICE_URL", "/monitors/{monitor_id}", _QUERY, False, _OK),
+    ("GET", "/synthetics/monitors/{monitor_id}/results", "SYNTHETIC_SERVICE_URL", "/monitors/{monitor_id}/results", _QUERY, False, _OK),
+
+    # Security (security-service)
+    ("GET", "/security/vulnerabilities", "SECURITY_SERVICE_URL", "/vulnerabilities", _QUERY, False, _OK),
+    ("GET", "/security/vulnerabilities/overview", "SECURITY_SERVICE_URL", "/vulnerabilities/overview", _QUERY, False, _OK),
+    ("PATCH", "/security/vulnerabilities/{vuln_id}", "SECURITY_SERVICE_URL", "/vulnerabilities/{vuln_id}", _PASSTHROUGH, True, _OK),
+
+    # AI/Anomaly (ai-service)
+    ("GET", "/anomaly/active", "AI_SERVICE_URL", "/anomaly/active", _QUERY, False, _OK),
+    ("POST", "/anomaly/detect", "AI_SERVICE_URL", "/anomaly/detect", _PROJECT, True, _CREATED),
+    ("GET", "/correlation/groups", "AI_SERVICE_URL", "/correlation/groups", _QUERY, False, _OK),
+
+    # Dashboards (metrics-collector-service)
+    ("POST", "/dashboards", "METRICS_COLLECTOR_URL", "/dashboards", None, True, _CREATED),
+    ("GET", "/dashboards", "METRICS_COLLECTOR_URL", "/dashboards", _QUERY, False, _OK),
+    ("GET", "/dashboards/{dashboard_id}", "METRICS_COLLECTOR_URL", "/dashboards/{dashboard_id}", _QUERY, False, _OK),
+    ("PUT", "/dashboards/{dashboard_id}", "METRICS_COLLECTOR_URL", "/dashboards/{dashboard_id}", None, True, _OK),
+    ("DELETE", "/dashboards/{dashboard_id}", "METRICS_COLLECTOR_URL", "/dashboards/{dashboard_id}", None, False, _OK),
+
+    # Browser monitoring (metrics-collector-service)
+    ("GET", "/browser/overview", "METRICS_COLLECTOR_URL", "/browser/overview", _QUERY, False, _OK),
+    ("GET", "/browser/page-loads", "METRICS_COLLECTOR_URL", "/browser/page-loads", _QUERY, False, _OK),
+    ("GET", "/browser/errors", "METRICS_COLLECTOR_URL", "/browser/errors", _QUERY, False, _OK),
+    ("GET", "/browser/ajax", "METRICS_COLLECTOR_URL", "/browser/ajax", _QUERY, False, _OK),
+
+    # Cloud connections (cloud-connector-service)
+    ("POST", "/connections", "CLOUD_CONNECTOR_URL", "/connections", _PROJECT, True, _CREATED),
+    ("GET", "/connections", "CLOUD_CONNECTOR_URL", "/connections", _QUERY, False, _OK),
+    ("POST", "/connections/test", "CLOUD_CONNECTOR_URL", "/connections/test", _PROJECT, True, _OK),
+    ("GET", "/connections/{connection_id}", "CLOUD_CONNECTOR_URL", "/connections/{connection_id}", _QUERY, False, _OK),
+    ("PATCH", "/connections/{connection_id}", "CLOUD_CONNECTOR_URL", "/connections/{connection_id}", _PROJECT, True, _OK),
+    ("DELETE", "/connections/{connection_id}", "CLOUD_CONNECTOR_URL", "/connections/{connection_id}", _PROJECT, False, _OK),
+
+    # CI/CD connections (cicd-connector-service)
+    ("POST", "/cicd/connections", "CICD_CONNECTOR_URL", "/connections", _PROJECT, True, _CREATED),
+    ("GET", "/cicd/connections", "CICD_CONNECTOR_URL", "/connections", _QUERY, False, _OK),
+    ("GET", "/cicd/connections/{connection_id}", "CICD_CONNECTOR_URL", "/connections/{connection_id}", _QUERY, False, _OK),
+    ("PATCH", "/cicd/connections/{connection_id}", "CICD_CONNECTOR_URL", "/connections/{connection_id}", _PROJECT, True, _OK),
+    ("DELETE", "/cicd/connections/{connection_id}", "CICD_CONNECTOR_URL", "/connections/{connection_id}", _PROJECT, False, _OK),
+    ("POST", "/cicd/connections/test", "CICD_CONNECTOR_URL", "/connections/test", _PROJECT, True, _OK),
+    ("GET", "/cicd/connections/{connection_id}/pipelines", "CICD_CONNECTOR_URL", "/connections/{connection_id}/pipelines", _QUERY, False, _OK),
+    ("GET", "/cicd/connections/{connection_id}/runs", "CICD_CONNECTOR_URL", "/connections/{connection_id}/runs", _QUERY, False, _OK),
+    ("POST", "/cicd/connections/{connection_id}/sync", "CICD_CONNECTOR_URL", "/connections/{connection_id}/sync", _PROJECT, False, _OK),
+]
+
+
+def _route_params(query, user: dict, query_items: Iterable[Tuple[str, str]]):
+    """Query params to send upstream for one PROXY_ROUTES query mode"""
+    if query == _QUERY:
+        return get_project_params(user, query_items)
+    if query == _PROJECT:
+        return get_project_params(user)
+    if query == _PASSTHROUGH:
+        return query_items
+    return None
+
+
+# ---- Short-lived response cache for slowly-changing GET routes ----
+# Dashboards poll these constantly while the data changes rarely. Entries are
+# keyed by (project_id, upstream URL, sorted query params) and dropped for the
+# whole project whenever a write through PROXY_ROUTES succeeds. Clients can
+# force a refresh with ``Cache-Control: no-cache``.
+#
+# Service lists, maps and log services change through /ingest/*, which never
+# invalidates, so their cached bodies lag new telemetry by up to the TTL.
+# /services/registry isn't cached at all: onboarding polls it every 5s to see
+# a newly instrumented service appear.
+
+# gateway path -> TTL seconds
+CACHED_ROUTE_TTLS = {
+    "/metrics/services": 5,
+    "/metrics/services-overview": 5,
+    "/traces/services/dependency-map": 30,
+    "/logs/services": 30,
+    "/alerts/channels": 5,
+    "/alerts/policies": 5,
+    "/slos": 5,
+}
+RESPONSE_CACHE_MAX_SIZE = 4096
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+# cache key -> (status, body, expires_at monotonic seconds)
+_response_cache: Dict[Tuple[Any, ...], Tuple[int, bytes, float]] = {}
+# cache key -> in-flight upstream call, so concurrent misses share one request
+_response_fetches: Dict[Tuple[Any, ...], asyncio.Task] = {}
+# project_id -> write generation, bumped by every invalidation so a fetch that
+# was already in flight during a write doesn't cache its pre-write body
+_project_generations: Dict[Any, int] = {}
+
+
+def _cache_response(key: Tuple[Any, ...], response: httpx.Response, ttl: float) -> None:
+    """Remember an upstream response body for ttl seconds"""
+    if key not in _response_cache and len(_response_cache) >= RESPONSE_CACHE_MAX_SIZE:
+        # Drop the oldest entry (dicts keep insertion order)
+        del _response_cache[next(iter(_response_cache))]
+    _response_cache[key] = (response.status_code, response.content, time.monotonic() + ttl)
+
+
+def _invalidate_project_responses(project_id: str) -> None:
+    """Drop every cached response and in-flight fetch for a project after a write"""
+    _project_generations[project_id] = _project_generations.get(project_id, 0) + 1
+    for key in [key for key in _response_cache if key[0] == project_id]:
+        del _response_cache[key]
+    # Reads after the write must not join a fetch that started before it
+    for key in [key for key in _response_fetches if key[0] == project_id]:
+        del _response_fetches[key]
+
+
+def _forget_fetch(key: Tuple[Any, ...], task: asyncio.Task) -> None:
+    """Done callback of an in-flight fetch; a newer fetch for the key is left alone"""
+    if _response_fetches.get(key) is task:
+        del _response_fetches[key]
+
+
+def _upstream_url_template(upstream: str, upstream_path: str) -> str:
+    """Upstream URL for a PROXY_ROUTES row, built once with {path_param} placeholders left in"""
+    return f"{getattr(settings, upstream)}{upstream_path}"
+
+
+# httpx resolves these as relative segments, which would step outside the route's upstream path
+_DOT_SEGMENTS = (".", "..")
+
+
+def _upstream_url(url_template: str, path_params: Mapping[str, str]) -> Optional[str]:
+    """
+    Substitute decoded path params into an upstream URL template.
+
+    Each value is percent-encoded so it stays a single path segment upstream
+    (``checkout api`` -> ``checkout%20api``). Returns None for ``.`` or ``..``.
+    """
+    if not path_params:
+        return url_template
+    if any(value in _DOT_SEGMENTS for value in path_params.values()):
+        return None
+    return url_template.format_map({name: quote(value, safe="") for name, value in path_params.items()})
+
+
+async def _upstream_request(upstream: str, path: str, method: str, url: str, **kwargs) -> httpx.Response:
+    """
+    Send a route-table request on the shared client, timing it per upstream service and route.
+
+    ``upstream`` is the PROXY_ROUTES settings attribute and ``path`` the gateway
+    path template, so the histogram has one series per route, not per URL.
+    """
+    start = time.perf_counter()
+    status = "error"
+    try:
+        response = await get_http().request(method, url, **kwargs)
+        status = str(response.status_code)
+        return response
+    finally:
+        if UPSTREAM_LATENCY:
+            UPSTREAM_LATENCY.labels(upstream, path, method, status).observe(time.perf_counter() - start)
+
+
+def _make_proxy_endpoint(
+    method: str, path: str, upstream: str, upstream_path: str, query, forward_body: bool, ok_statuses,
+    cache_ttl: Optional[float] = None,
+):
+    """Build the endpoint coroutine for one PROXY_ROUTES row"""
+    url_template = _upstream_url_template(upstream, upstream_path)
+
+    async def proxy_endpoint(request: Request, user=Depends(require_user)):
+        url = _upstream_url(url_template, request.path_params)
+        if url is None:
+            raise HTTPException(status_code=404, detail="Not Found")
+        # Only routes that forward client query params need them parsed
+        query_items = request.query_params.multi_items() if query in _CLIENT_QUERY_MODES else ()
+        params = _route_params(query, user, query_items)
+        headers = trace_headers(request.headers)
+
+        if cache_ttl is None:
+            body = None
+            if forward_body:
+                # Relay the client's JSON bytes; the backend validates them
+                body = await request.body()
+                headers["Content-Type"] = request.headers.get("content-type", "application/json")
+            response = await _upstream_request(upstream, path, method, url, params=params, content=body, headers=headers)
+            if method != "GET" and response.status_code in ok_statuses:
+                _invalidate_project_responses(user.get("project_id"))
+        else:
+            response = await _cached_get(
+                user, upstream, path, url, params, headers, ok_statuses, cache_ttl,
+                refresh="no-cache" in request.headers.get("cache-control", ""),
+            )
+
+        if response.status_code not in ok_statuses:
+            return _error_passthrough(response)
+        return _passthrough(response)
+
+    return proxy_endpoint
+
+
+async def _cached_get(
+    user: dict, upstream: str, path: str, url: str, params, headers: Dict[str, str], ok_statuses, ttl: float,
+    refresh: bool = False, **kwargs,
+) -> httpx.Response:
+    """
+    GET a cacheable route through the response cache.
+
+    A fresh cached body is returned without going upstream, and concurrent
+    misses for the same key share one upstream call. ``refresh`` skips the
+    lookup but still caches the new body. Extra kwargs go to the upstream call.
+    """
+    key = (user.get("project_id"), url, tuple(sorted(params or ())))
+    if not refresh:
+        cached = _response_cache.get(key)
+        if cached and cached[2] > time.monotonic():
+            if RESPONSE_CACHE_HITS:
+                RESPONSE_CACHE_HITS.labels(path).inc()
+            return httpx.Response(cached[0], content=cached[1], headers=_JSON_HEADERS)
+    if RESPONSE_CACHE_MISSES:
+        RESPONSE_CACHE_MISSES.labels(path).inc()
+
+    task = _response_fetches.get(key)
+    if task is None:
+        task = asyncio.ensure_future(
+            _fetch_cacheable(key, upstream, path, url, params, headers, ok_statuses, ttl, **kwargs)
+        )
+        _response_fetches[key] = task
+        task.add_done_callback(lambda done: _forget_fetch(key, done))
+    # Shielded so one cancelled request doesn't fail the others waiting on it
+    return await asyncio.shield(task)
+
+
+async def _fetch_cacheable(
+    key, upstream: str, path: str, url: str, params, headers: Dict[str, str], ok_statuses, ttl: float, **kwargs,
+) -> httpx.Response:
+    """
+    GET a cacheable route upstream and cache the body if the status is accepted.
+
+    Nothing is cached if the project was written to while the call was in flight.
+    """
+    generation = _project_generations.get(key[0], 0)
+    response = await _upstream_request(upstream, path, "GET", url, params=params, headers=headers, **kwargs)
+    if response.status_code in ok_statuses and _project_generations.get(key[0], 0) == generation:
+        _cache_response(key, response, ttl)
+    return response
+
+
+for _method, _path, _upstream, _upstream_path, _query, _forward_body, _ok_statuses in PROXY_ROUTES:
+    router.add_api_route(
+        _path,
+        _make_proxy_endpoint(
+            _method, _path, _upstream, _upstream_path, _query, _forward_body, _ok_statuses,
+            cache_ttl=CACHED_ROUTE_TTLS.get(_path) if _method == "GET" else None,
+        ),
+        methods=[_method],
+        # Endpoints return upstream bytes directly; nothing for FastAPI to validate or encode
+        response_model=None,
+        response_class=Response,
+    )
+
+
+# ---- Batch proxy (JWT-authenticated) ----
+# Dashboards load several panels at once; one batch request fans the reads
+# out concurrently instead of paying a client round-trip (and an auth check)
+# per panel. Only the GET routes of PROXY_ROUTES can be batched, and cacheable
+# routes are served through the response cache like direct requests.
+
+# A batch counts as one request against the rate limit, so keep it small
+BATCH_MAX_REQUESTS = 20
+BATCH_ENTRY_TIMEOUT_SECONDS = 10.0
+
+# (compiled gateway path, upstream URL template, PROXY_ROUTES row) for every batchable route
+_BATCH_ROUTES = [
+    (compile_path(row[1])[0], _upstream_url_template(row[2], row[3]), row)
+    for row in PROXY_ROUTES if row[0] == "GET"
+]
+
+
+class BatchEntry(BaseModel):
+    id: str
+    method: str = "GET"
+    path: str  # gateway path without the /api/v1 prefix, e.g. "/slos"
+    query: Dict[str, Union[str, List[str]]] = {}
+
+
+class BatchRequest(BaseModel):
+    requests: List[BatchEntry] = Field(..., min_length=1, max_length=BATCH_MAX_REQUESTS)
+
+
+def _match_batch_route(entry: BatchEntry):
+    """Find the PROXY_ROUTES row and upstream URL for a batch entry, or (None, None)"""
+    if entry.method.upper() != "GET":
+        return None, None
+    for regex, url_template, row in _BATCH_ROUTES:
+        match = regex.match(entry.path)
+        if match:
+            # Batch paths arrive as the client wrote them, still percent-encoded
+            url = _upstream_url(url_template, {name: unquote(value) for name, value in match.groupdict().items()})
+            return (row, url) if url is not None else (None, None)
+    return None, None
+
+
+async def _run_batch_entry(entry: BatchEntry, user: dict, headers: Dict[str, str], refresh: bool = False) -> dict:
+    """Proxy one batch entry and describe the outcome as {"id", "status", "body"}"""
+    row, url = _match_batch_route(entry)
+    if row is None:
+        return {"id": entry.id, "status": 404, "body": {"detail": "Not Found"}}
+    path, upstream, query, ok_statuses = row[1], row[2], row[4], row[6]
+    cache_ttl = CACHED_ROUTE_TTLS.get(path)
+
+    query_items = [
+        (key, value)
+        for key, values in entry.query.items()
+        for value in (values if isinstance(values, list) else (values,))
+    ]
+    try:
+        params = _route_params(query, user, query_items)
+        if cache_ttl is None:
+            response = await _upstream_request(
+                upstream, path, "GET", url, params=params, headers=headers, timeout=BATCH_ENTRY_TIMEOUT_SECONDS,
+            )
+        else:
+            response = await _cached_get(
+                user, upstream, path, url, params, headers, ok_statuses, cache_ttl,
+                refresh=refresh, timeout=BATCH_ENTRY_TIMEOUT_SECONDS,
+            )
+    except HTTPException as e:
+        return {"id": entry.id, "status": e.status_code, "body": {"detail": e.detail}}
+    except httpx.TimeoutException:
+        return {"id": entry.id, "status": 504, "body": {"detail": "Upstream timed out"}}
+    except httpx.HTTPError:
+        return {"id": entry.id, "status": 502, "body": {"detail": "Upstream unavailable"}}
+
+    if response.status_code not in ok_statuses:
+        return {
+            "id": entry.id,
+            "status": response.status_code,
+            "body": {"detail": get_error_message(response, "Request failed")},
+        }
+    try:
+        body = orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        body = response.text
+    return {"id": entry.id, "status": response.status_code, "body": body}
+
+
+@router.post("/observability/batch")
+async def observability_batch(batch: BatchRequest, request: Request, user=Depends(require_user)):
+    """
+    Run several read-only observability proxy calls in one request.
+
+    Entries are fetched concurrently and reported in request order; a failing
+    entry gets its own status and ``{"detail": ...}`` body without failing the
+    rest of the batch.
+    """
+    headers = trace_headers(request.headers)
+    refresh = "no-cache" in request.headers.get("cache-control", "")
+    responses = await asyncio.gather(*[_run_batch_entry(entry, user, headers, refresh) for entry in batch.requests])
+    return {"responses": responses}
 
 
 # ---- API Key Management Proxy (JWT-authenticated) ----
 
 @router.post("/projects/{project_id}/api-keys")
-async def create_api_key(project_id: str, request: Request, user=Depends(get_current_user_from_token)):
+async def create_api_key(project_id: str, request: Request, user=Depends(require_user)):
     """Proxy to auth service - create API key"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    body = await request.json()
+    body = await request.body()
     token = request.headers.get("authorization", "")
     if not token:
         token = f"Bearer {request.cookies.get('access_token', '')}"
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/api-keys",
-            json=body,
-            headers={"Authorization": token}
-        )
-        if response.status_code >= 400:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
+    client = get_http()
+    response = await client.post(
+        f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/api-keys",
+        content=body,
+        headers={"Authorization": token, "Content-Type": request.headers.get("content-type", "application/json")}
+    )
+    if response.status_code >= 400:
+        return _error_passthrough(response)
+    return _passthrough(response)
 
 
 @router.get("/projects/{project_id}/api-keys")
-async def list_api_keys(project_id: str, request: Request, user=Depends(get_current_user_from_token)):
+async def list_api_keys(project_id: str, request: Request, user=Depends(require_user)):
     """Proxy to auth service - list API keys"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
     token = request.headers.get("authorization", "")
     if not token:
         token = f"Bearer {request.cookies.get('access_token', '')}"
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/api-keys",
-            headers={"Authorization": token}
-        )
-        if response.status_code >= 400:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
+    client = get_http()
+    response = await client.get(
+        f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/api-keys",
+        headers={"Authorization": token}
+    )
+    if response.status_code >= 400:
+        return _error_passthrough(response)
+    return _passthrough(response)
 
 
 @router.patch("/projects/{project_id}/api-keys/{key_id}")
-async def update_api_key(project_id: str, key_id: str, request: Request, user=Depends(get_current_user_from_token)):
+async def update_api_key(project_id: str, key_id: str, request: Request, user=Depends(require_user)):
     """Proxy to auth service - update API key"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    body = await request.json()
+    body = await request.body()
     token = request.headers.get("authorization", "")
     if not token:
         token = f"Bearer {request.cookies.get('access_token', '')}"
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.patch(
-            f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/api-keys/{key_id}",
-            json=body,
-            headers={"Authorization": token}
-        )
-        if response.status_code >= 400:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
+    client = get_http()
+    response = await client.patch(
+        f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/api-keys/{key_id}",
+        content=body,
+        headers={"Authorization": token, "Content-Type": request.headers.get("content-type", "application/json")}
+    )
+    if response.status_code >= 400:
+        return _error_passthrough(response)
+    return _passthrough(response)
 
 
 @router.delete("/projects/{project_id}/api-keys/{key_id}")
-async def revoke_api_key(project_id: str, key_id: str, request: Request, user=Depends(get_current_user_from_token)):
+async def revoke_api_key(project_id: str, key_id: str, request: Request, user=Depends(require_user)):
     """Proxy to auth service - revoke API key"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
     token = request.headers.get("authorization", "")
     if not token:
         token = f"Bearer {request.cookies.get('access_token', '')}"
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.delete(
-            f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/api-keys/{key_id}",
-            headers={"Authorization": token}
-        )
-        if response.status_code >= 400:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return {"status": "deleted"}
-
-
-# ---- CI/CD Connector Proxy (cicd-connector-service) ----
-# CRUD, test, pipelines, runs - JWT auth required
-
-@router.post("/cicd/connections")
-async def create_cicd_connection(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to cicd-connector-service - create CI/CD connection"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    body = await request.json()
-    params = get_project_params(user)
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.CICD_CONNECTOR_URL}/connections",
-            json=body,
-            params=params,
-            headers=get_internal_headers()
-        )
-        if response.status_code not in (200, 201):
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/cicd/connections")
-async def list_cicd_connections(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to cicd-connector-service - list CI/CD connections"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    params = get_project_params(user, dict(request.query_params))
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.CICD_CONNECTOR_URL}/connections",
-            params=params,
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/cicd/connections/{connection_id}")
-async def get_cicd_connection(connection_id: str, request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to cicd-connector-service - get CI/CD connection"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    params = get_project_params(user, dict(request.query_params))
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.CICD_CONNECTOR_URL}/connections/{connection_id}",
-            params=params,
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.patch("/cicd/connections/{connection_id}")
-async def update_cicd_connection(connection_id: str, request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to cicd-connector-service - update CI/CD connection"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    body = await request.json()
-    params = get_project_params(user)
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.patch(
-            f"{settings.CICD_CONNECTOR_URL}/connections/{connection_id}",
-            json=body,
-            params=params,
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.delete("/cicd/connections/{connection_id}")
-async def delete_cicd_connection(connection_id: str, user=Depends(get_current_user_from_token)):
-    """Proxy to cicd-connector-service - delete CI/CD connection"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    params = get_project_params(user)
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.delete(
-            f"{settings.CICD_CONNECTOR_URL}/connections/{connection_id}",
-            params=params,
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.post("/cicd/connections/test")
-async def test_cicd_connection(request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to cicd-connector-service - test connection without saving"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    body = await request.json()
-    params = get_project_params(user)
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.CICD_CONNECTOR_URL}/connections/test",
-            json=body,
-            params=params,
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/cicd/connections/{connection_id}/pipelines")
-async def list_cicd_pipelines(connection_id: str, request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to cicd-connector-service - list pipelines/repos"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    params = get_project_params(user, dict(request.query_params))
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.CICD_CONNECTOR_URL}/connections/{connection_id}/pipelines",
-            params=params,
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.get("/cicd/connections/{connection_id}/runs")
-async def list_cicd_runs(connection_id: str, request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to cicd-connector-service - list pipelines/workflow runs"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    params = get_project_params(user, dict(request.query_params))
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.CICD_CONNECTOR_URL}/connections/{connection_id}/runs",
-            params=params,
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
-
-
-@router.post("/cicd/connections/{connection_id}/sync")
-async def sync_cicd_connection(connection_id: str, request: Request, user=Depends(get_current_user_from_token)):
-    """Proxy to cicd-connector-service - sync connection (validate + fetch counts)"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    params = get_project_params(user)
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.CICD_CONNECTOR_URL}/connections/{connection_id}/sync",
-            params=params,
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=get_error_message(response, "Request failed"))
-        return response.json()
+    client = get_http()
+    response = await client.delete(
+        f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/api-keys/{key_id}",
+        headers={"Authorization": token}
+    )
+    if response.status_code >= 400:
+        return _error_passthrough(response)
+    return {"status": "deleted"}
 
 
 # ---- CI/CD Webhooks (NO JWT auth - use webhook_secret) ----
 
+_NOT_FORWARDED_HEADERS = ("host", "content-length", "transfer-encoding", "connection")
+
 def _webhook_response(response: httpx.Response):
     """Build JSON response from upstream webhook response."""
     try:
-        content = response.json()
+        content = orjson.loads(response.content)
     except Exception:
         content = {"detail": response.text or f"HTTP {response.status_code}"}
-    return JSONResponse(status_code=response.status_code, content=content)
+    return ORJSONResponse(status_code=response.status_code, content=content)
 
 
 @router.post("/cicd/webhooks/{connection_id}/github")
@@ -1280,37 +586,38 @@ async def cicd_webhook_github(connection_id: str, request: Request):
     """Proxy to cicd-connector-service - GitHub webhook. No JWT; validated by webhook_secret."""
     body = await request.body()
     headers = dict(request.headers)
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.CICD_CONNECTOR_URL}/webhooks/{connection_id}/github",
-            content=body,
-            headers={k: v for k, v in headers.items() if k.lower() in ("x-hub-signature-256", "x-github-event", "content-type")},
-        )
-        return _webhook_response(response)
+    client = get_http()
+    response = await client.post(
+        f"{settings.CICD_CONNECTOR_URL}/webhooks/{connection_id}/github",
+        content=body,
+        headers={k: v for k, v in headers.items() if k.lower() in ("x-hub-signature-256", "x-github-event", "content-type")},
+    )
+    return _webhook_response(response)
 
 
 @router.post("/cicd/webhooks/{connection_id}/azure-devops")
 async def cicd_webhook_azure_devops(connection_id: str, request: Request):
     """Proxy to cicd-connector-service - Azure DevOps webhook. No JWT; validated by webhook_secret."""
-    body = await request.json()
+    body = await request.body()
     headers = dict(request.headers)
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.CICD_CONNECTOR_URL}/webhooks/{connection_id}/azure-devops",
-            json=body,
-            headers={k: v for k, v in headers.items() if k.lower() in ("x-webhook-secret", "content-type")},
-        )
-        return _webhook_response(response)
+    client = get_http()
+    response = await client.post(
+        f"{settings.CICD_CONNECTOR_URL}/webhooks/{connection_id}/azure-devops",
+        content=body,
+        headers={k: v for k, v in headers.items() if k.lower() in ("x-webhook-secret", "content-type")},
+    )
+    return _webhook_response(response)
 
 
 @router.post("/cicd/webhooks/generic/{project_id}")
 async def cicd_webhook_generic(project_id: str, request: Request):
     """Proxy to cicd-connector-service - Generic webhook. No JWT; optional X-Webhook-Secret."""
-    body = await request.json()
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.CICD_CONNECTOR_URL}/webhooks/generic/{project_id}",
-            json=body,
-            headers=dict(request.headers),
-        )
-        return _webhook_response(response)
+    body = await request.body()
+    client = get_http()
+    response = await client.post(
+        f"{settings.CICD_CONNECTOR_URL}/webhooks/generic/{project_id}",
+        content=body,
+        # httpx sets Host and Content-Length for the forwarded body itself
+        headers={k: v for k, v in request.headers.items() if k.lower() not in _NOT_FORWARDED_HEADERS},
+    )
+    return _webhook_response(response)
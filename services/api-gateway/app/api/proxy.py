@@ -2,20 +2,25 @@
 Proxy endpoints to route requests to microservices
 """
 from fastapi import APIRouter, Request, HTTPException, Depends, Header, Response
-from typing import Optional
+from typing import Dict, Optional, Tuple
+import asyncio
+import hashlib
+import time
 import httpx
+import orjson
 
 from app.core.config import settings
+from app.core.http_client import get_http
 
 router = APIRouter()
 
-
-def get_internal_headers() -> dict:
-    """Get headers for internal service-to-service requests"""
-    headers = {}
-    if settings.INTERNAL_SERVICE_KEY:
-        headers["X-Internal-Service-Key"] = settings.INTERNAL_SERVICE_KEY
-    return headers
+# ---- In-process cache for JWT verification ----
+# token sha256 -> (user payload, expires_at monotonic seconds)
+TOKEN_CACHE_MAX_SIZE = 10_000
+_token_cache: Dict[str, Tuple[dict, float]] = {}
+# token sha256 -> in-flight auth-service call, so concurrent cold requests
+# with the same token share one verification
+_token_verifications: Dict[str, asyncio.Task] = {}
 
 
 def forward_response_cookies(source_response: httpx.Response, target_response: Response):
@@ -28,7 +33,7 @@ def forward_response_cookies(source_response: httpx.Response, target_response: R
 def get_error_message(backend_response: httpx.Response, default: str = "Request failed") -> str:
     """Safely extract error message from backend response"""
     try:
-        error_data = backend_response.json()
+        error_data = orjson.loads(backend_response.content)
         if isinstance(error_data, dict):
             return error_data.get('detail', default)
         return str(error_data)
@@ -56,35 +61,80 @@ async def get_current_user_from_token(
     if not token:
         return None
 
+    if settings.TOKEN_CACHE_TTL_SECONDS <= 0:
+        return await _verify_token(token)
+
+    token_hash = hashlib.sha256(token.encode()).hexdigest()
+    cached = _token_cache.get(token_hash)
+    if cached:
+        if cached[1] > time.monotonic():
+            return cached[0]
+        del _token_cache[token_hash]
+
+    task = _token_verifications.get(token_hash)
+    if task is None:
+        task = asyncio.ensure_future(_verify_token(token))
+        _token_verifications[token_hash] = task
+        task.add_done_callback(lambda _: _token_verifications.pop(token_hash, None))
+    # Shielded so one cancelled request doesn't fail the others waiting on it
+    user = await asyncio.shield(task)
+    if user:
+        _cache_token(token_hash, user)
+    return user
+
+
+async def _verify_token(token: str) -> Optional[dict]:
+    """Ask auth-service to verify a JWT; the token payload, or None if rejected"""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{settings.AUTH_SERVICE_URL}/verify",
-                headers={"Authorization": f"Bearer {token}"}
-            )
-            if response.status_code == 200:
-                return response.json()
-            return None
+        response = await get_http().get(
+            f"{settings.AUTH_SERVICE_URL}/verify",
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=10,
+        )
+        if response.status_code == 200:
+            return orjson.loads(response.content)
+        return None
     except Exception:
         return None
 
 
+def _cache_token(token_hash: str, user: dict) -> None:
+    """Remember a verified token until the cache TTL or the token's expiry, whichever is first"""
+    ttl = settings.TOKEN_CACHE_TTL_SECONDS
+    exp = user.get("exp")
+    if isinstance(exp, (int, float)):
+        ttl = min(ttl, exp - time.time())
+        if ttl <= 0:
+            return
+    if token_hash not in _token_cache and len(_token_cache) >= TOKEN_CACHE_MAX_SIZE:
+        # Drop the oldest entry (dicts keep insertion order)
+        del _token_cache[next(iter(_token_cache))]
+    _token_cache[token_hash] = (user, time.monotonic() + ttl)
+
+
+async def require_user(user=Depends(get_current_user_from_token)) -> dict:
+    """Dependency: the authenticated user, or 401 if the request carries no valid token"""
+    if not user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    return user
+
+
 # Auth endpoints
 @router.post("/auth/register")
 async def register(request: Request, response: Response):
     """Proxy to auth service - register"""
     body = await request.json()
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        backend_response = await client.post(
-            f"{settings.AUTH_SERVICE_URL}/register",
-            json=body
-        )
+    client = get_http()
+    backend_response = await client.post(
+        f"{settings.AUTH_SERVICE_URL}/register",
+        json=body
+    )
 
-        # Forward cookies from auth service to client
-        forward_response_cookies(backend_response, response)
+    # Forward cookies from auth service to client
+    forward_response_cookies(backend_response, response)
 
-        return backend_response.json()
+    return backend_response.json()
 
 
 @router.post("/auth/login")
@@ -92,19 +142,19 @@ async def login(request: Request, response: Response):
     """Proxy to auth service - login"""
     body = await request.json()
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        backend_response = await client.post(
-            f"{settings.AUTH_SERVICE_URL}/login",
-            json=body
-        )
-        if backend_response.status_code != 200:
-            error_message = get_error_message(backend_response, "Login failed")
-            raise HTTPException(status_code=backend_response.status_code, detail=error_message)
+    client = get_http()
+    backend_response = await client.post(
+        f"{settings.AUTH_SERVICE_URL}/login",
+        json=body
+    )
+    if backend_response.status_code != 200:
+        error_message = get_error_message(backend_response, "Login failed")
+        raise HTTPException(status_code=backend_response.status_code, detail=error_message)
 
-        # Forward cookies from auth service to client
-        forward_response_cookies(backend_response, response)
+    # Forward cookies from auth service to client
+    forward_response_cookies(backend_response, response)
 
-        return backend_response.json()
+    return backend_response.json()
 
 
 @router.post("/auth/switch-project")
@@ -123,16 +173,16 @@ async def switch_project(
     if not project_id:
         raise HTTPException(status_code=400, detail="project_id is required")
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.AUTH_SERVICE_URL}/switch-project",
-            params={"project_id": project_id},
-            headers={"Authorization": f"Bearer {token}"}
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Failed to switch project')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.post(
+        f"{settings.AUTH_SERVICE_URL}/switch-project",
+        params={"project_id": project_id},
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Failed to switch project')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 @router.get("/auth/me")
@@ -142,15 +192,15 @@ async def get_current_user(request: Request, authorization: Optional[str] = Head
     if not token:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.AUTH_SERVICE_URL}/me",
-            headers={"Authorization": f"Bearer {token}"}
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Failed to get user info')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.get(
+        f"{settings.AUTH_SERVICE_URL}/me",
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Failed to get user info')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 @router.post("/auth/refresh")
@@ -159,20 +209,20 @@ async def refresh_token(request: Request, response: Response):
     # Forward cookies from request to backend
     cookies = request.cookies
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        backend_response = await client.post(
-            f"{settings.AUTH_SERVICE_URL}/refresh",
-            cookies=cookies
-        )
+    client = get_http()
+    backend_response = await client.post(
+        f"{settings.AUTH_SERVICE_URL}/refresh",
+        cookies=cookies
+    )
 
-        if backend_response.status_code != 200:
-            error_message = get_error_message(backend_response, 'Token refresh failed')
-            raise HTTPException(status_code=backend_response.status_code, detail=error_message)
+    if backend_response.status_code != 200:
+        error_message = get_error_message(backend_response, 'Token refresh failed')
+        raise HTTPException(status_code=backend_response.status_code, detail=error_message)
 
-        # Forward new cookies to client
-        forward_response_cookies(backend_response, response)
+    # Forward new cookies to client
+    forward_response_cookies(backend_response, response)
 
-        return backend_response.json()
+    return backend_response.json()
 
 
 @router.patch("/auth/profile")
@@ -184,17 +234,17 @@ async def update_profile(request: Request, authorization: Optional[str] = Header
     body = await request.json()
     cookies = request.cookies
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.patch(
-            f"{settings.AUTH_SERVICE_URL}/profile",
-            json=body,
-            headers={"Authorization": f"Bearer {token}"},
-            cookies=cookies,
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Failed to update profile')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.patch(
+        f"{settings.AUTH_SERVICE_URL}/profile",
+        json=body,
+        headers={"Authorization": f"Bearer {token}"},
+        cookies=cookies,
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Failed to update profile')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 @router.post("/auth/change-password")
@@ -206,29 +256,29 @@ async def change_password(request: Request, authorization: Optional[str] = Heade
     body = await request.json()
     cookies = request.cookies
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.AUTH_SERVICE_URL}/change-password",
-            json=body,
-            headers={"Authorization": f"Bearer {token}"},
-            cookies=cookies,
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Failed to change password')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.post(
+        f"{settings.AUTH_SERVICE_URL}/change-password",
+        json=body,
+        headers={"Authorization": f"Bearer {token}"},
+        cookies=cookies,
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Failed to change password')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 @router.post("/auth/logout")
 async def logout(response: Response):
     """Proxy to auth service - logout"""
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        backend_response = await client.post(f"{settings.AUTH_SERVICE_URL}/logout")
+    client = get_http()
+    backend_response = await client.post(f"{settings.AUTH_SERVICE_URL}/logout")
 
-        # Forward cookie clearing to client
-        forward_response_cookies(backend_response, response)
+    # Forward cookie clearing to client
+    forward_response_cookies(backend_response, response)
 
-        return backend_response.json()
+    return backend_response.json()
 
 
 @router.get("/auth/ws-token")
@@ -237,17 +287,17 @@ async def get_websocket_token(request: Request):
     # Forward cookies from request to backend
     cookies = request.cookies
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        backend_response = await client.get(
-            f"{settings.AUTH_SERVICE_URL}/ws-token",
-            cookies=cookies
-        )
+    client = get_http()
+    backend_response = await client.get(
+        f"{settings.AUTH_SERVICE_URL}/ws-token",
+        cookies=cookies
+    )
 
-        if backend_response.status_code != 200:
-            error_message = get_error_message(backend_response, 'Failed to get WebSocket token')
-            raise HTTPException(status_code=backend_response.status_code, detail=error_message)
+    if backend_response.status_code != 200:
+        error_message = get_error_message(backend_response, 'Failed to get WebSocket token')
+        raise HTTPException(status_code=backend_response.status_code, detail=error_message)
 
-        return backend_response.json()
+    return backend_response.json()
 
 
 # Helper function to get token from header or cookie
@@ -274,15 +324,15 @@ async def list_projects(
     if not token:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.AUTH_SERVICE_URL}/projects",
-            headers={"Authorization": f"Bearer {token}"}
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Request failed')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.get(
+        f"{settings.AUTH_SERVICE_URL}/projects",
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Request failed')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 @router.post("/projects")
@@ -297,16 +347,16 @@ async def create_project(
 
     body = await request.json()
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.AUTH_SERVICE_URL}/projects",
-            json=body,
-            headers={"Authorization": f"Bearer {token}"}
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Request failed')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.post(
+        f"{settings.AUTH_SERVICE_URL}/projects",
+        json=body,
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Request failed')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 @router.get("/projects/{project_id}")
@@ -320,15 +370,15 @@ async def get_project(
     if not token:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.AUTH_SERVICE_URL}/projects/{project_id}",
-            headers={"Authorization": f"Bearer {token}"}
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Request failed')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.get(
+        f"{settings.AUTH_SERVICE_URL}/projects/{project_id}",
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Request failed')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 @router.patch("/projects/{project_id}")
@@ -344,16 +394,16 @@ async def update_project(
 
     body = await request.json()
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.patch(
-            f"{settings.AUTH_SERVICE_URL}/projects/{project_id}",
-            json=body,
-            headers={"Authorization": f"Bearer {token}"}
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Request failed')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.patch(
+        f"{settings.AUTH_SERVICE_URL}/projects/{project_id}",
+        json=body,
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Request failed')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 @router.delete("/projects/{project_id}")
@@ -367,15 +417,15 @@ async def delete_project(
     if not token:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.delete(
-            f"{settings.AUTH_SERVICE_URL}/projects/{project_id}",
-            headers={"Authorization": f"Bearer {token}"}
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Request failed')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.delete(
+        f"{settings.AUTH_SERVICE_URL}/projects/{project_id}",
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Request failed')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 @router.get("/projects/{project_id}/members")
@@ -389,15 +439,15 @@ async def list_project_members(
     if not token:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/members",
-            headers={"Authorization": f"Bearer {token}"}
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Request failed')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.get(
+        f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/members",
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Request failed')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 @router.post("/projects/{project_id}/members")
@@ -413,16 +463,16 @@ async def add_project_member(
 
     body = await request.json()
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/members",
-            json=body,
-            headers={"Authorization": f"Bearer {token}"}
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Request failed')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.post(
+        f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/members",
+        json=body,
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Request failed')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 @router.patch("/projects/{project_id}/members/{user_id}")
@@ -439,16 +489,16 @@ async def update_member_role(
 
     body = await request.json()
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.patch(
-            f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/members/{user_id}",
-            json=body,
-            headers={"Authorization": f"Bearer {token}"}
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Request failed')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.patch(
+        f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/members/{user_id}",
+        json=body,
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Request failed')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 @router.delete("/projects/{project_id}/members/{user_id}")
@@ -463,15 +513,15 @@ async def remove_project_member(
     if not token:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.delete(
-            f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/members/{user_id}",
-            headers={"Authorization": f"Bearer {token}"}
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Request failed')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.delete(
+        f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/members/{user_id}",
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Request failed')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 # Incident endpoints
@@ -482,12 +532,9 @@ async def list_incidents(
     severity: Optional[str] = None,
     state: Optional[str] = None,
     search: Optional[str] = None,
-    user=Depends(get_current_user_from_token)
+    user=Depends(require_user)
 ):
     """Proxy to incident service - list incidents with pagination"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
     params = {
         "page": page,
         "limit": limit,
@@ -500,315 +547,258 @@ async def list_incidents(
     if search:
         params["search"] = search
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.INCIDENT_SERVICE_URL}/incidents",
-            params=params,
-            headers=get_internal_headers()
-        )
-        return response.json()
+    client = get_http()
+    response = await client.get(
+        f"{settings.INCIDENT_SERVICE_URL}/incidents",
+        params=params
+    )
+    return response.json()
 
 
 @router.get("/incidents-stats")
 async def get_incidents_stats(
-    user=Depends(get_current_user_from_token)
+    user=Depends(require_user)
 ):
     """Proxy to incident service - get incident statistics"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.INCIDENT_SERVICE_URL}/incidents-stats",
-            params={"project_id": user["project_id"]},
-            headers=get_internal_headers()
-        )
-        return response.json()
+    client = get_http()
+    response = await client.get(
+        f"{settings.INCIDENT_SERVICE_URL}/incidents-stats",
+        params={"project_id": user["project_id"]}
+    )
+    return response.json()
 
 
 @router.get("/incidents-timeline")
 async def get_incidents_timeline(
     days: int = 7,
-    user=Depends(get_current_user_from_token)
+    user=Depends(require_user)
 ):
     """Proxy to incident service - get incident timeline for charts"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.INCIDENT_SERVICE_URL}/incidents-timeline",
-            params={"project_id": user["project_id"], "days": days},
-            headers=get_internal_headers()
-        )
-        return response.json()
+    client = get_http()
+    response = await client.get(
+        f"{settings.INCIDENT_SERVICE_URL}/incidents-timeline",
+        params={"project_id": user["project_id"], "days": days}
+    )
+    return response.json()
 
 
 @router.post("/incidents")
 async def create_incident(
     request: Request,
-    user=Depends(get_current_user_from_token)
+    user=Depends(require_user)
 ):
     """Proxy to incident service - create incident"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
     body = await request.json()
     body["project_id"] = user["project_id"]
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.INCIDENT_SERVICE_URL}/incidents",
-            json=body,
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Request failed')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.post(
+        f"{settings.INCIDENT_SERVICE_URL}/incidents",
+        json=body
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Request failed')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 @router.get("/incidents/{incident_id}")
 async def get_incident(
     incident_id: str,
-    user=Depends(get_current_user_from_token)
+    user=Depends(require_user)
 ):
     """Proxy to incident service - get incident"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.INCIDENT_SERVICE_URL}/incidents/{incident_id}",
-            params={"project_id": user["project_id"]},
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Request failed')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.get(
+        f"{settings.INCIDENT_SERVICE_URL}/incidents/{incident_id}",
+        params={"project_id": user["project_id"]}
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Request failed')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 @router.get("/incidents/{incident_id}/hypotheses")
 async def get_hypotheses(
     incident_id: str,
-    user=Depends(get_current_user_from_token)
+    user=Depends(require_user)
 ):
     """Proxy to incident service - get hypotheses"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.INCIDENT_SERVICE_URL}/incidents/{incident_id}/hypotheses",
-            params={"project_id": user["project_id"]},
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Request failed')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.get(
+        f"{settings.INCIDENT_SERVICE_URL}/incidents/{incident_id}/hypotheses",
+        params={"project_id": user["project_id"]}
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Request failed')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 @router.patch("/incidents/{incident_id}/state")
 async def update_incident_state(
     incident_id: str,
     request: Request,
-    user=Depends(get_current_user_from_token)
+    user=Depends(require_user)
 ):
     """Proxy to incident service - update incident state"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
     body = await request.json()
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.patch(
-            f"{settings.INCIDENT_SERVICE_URL}/incidents/{incident_id}/state",
-            params={"project_id": user["project_id"]},
-            json=body,
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Request failed')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.patch(
+        f"{settings.INCIDENT_SERVICE_URL}/incidents/{incident_id}/state",
+        params={"project_id": user["project_id"]},
+        json=body
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Request failed')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 @router.patch("/incidents/{incident_id}/severity")
 async def update_incident_severity(
     incident_id: str,
     request: Request,
-    user=Depends(get_current_user_from_token)
+    user=Depends(require_user)
 ):
     """Proxy to incident service - update incident severity"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
     body = await request.json()
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.patch(
-            f"{settings.INCIDENT_SERVICE_URL}/incidents/{incident_id}/severity",
-            params={"project_id": user["project_id"]},
-            json=body,
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Request failed')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.patch(
+        f"{settings.INCIDENT_SERVICE_URL}/incidents/{incident_id}/severity",
+        params={"project_id": user["project_id"]},
+        json=body
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Request failed')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 @router.post("/incidents/{incident_id}/comments")
 async def add_incident_comment(
     incident_id: str,
     request: Request,
-    user=Depends(get_current_user_from_token)
+    user=Depends(require_user)
 ):
     """Proxy to incident service - add comment"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
     body = await request.json()
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.INCIDENT_SERVICE_URL}/incidents/{incident_id}/comments",
-            params={"project_id": user["project_id"]},
-            json=body,
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Request failed')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.post(
+        f"{settings.INCIDENT_SERVICE_URL}/incidents/{incident_id}/comments",
+        params={"project_id": user["project_id"]},
+        json=body
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Request failed')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 @router.get("/incidents/{incident_id}/activities")
 async def get_incident_activities(
     incident_id: str,
-    user=Depends(get_current_user_from_token)
+    user=Depends(require_user)
 ):
     """Proxy to incident service - get activities"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.INCIDENT_SERVICE_URL}/incidents/{incident_id}/activities",
-            params={"project_id": user["project_id"]},
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Request failed')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.get(
+        f"{settings.INCIDENT_SERVICE_URL}/incidents/{incident_id}/activities",
+        params={"project_id": user["project_id"]}
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Request failed')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 @router.get("/incidents/{incident_id}/workflow")
 async def get_incident_workflow(
     incident_id: str,
-    user=Depends(get_current_user_from_token)
+    user=Depends(require_user)
 ):
     """Proxy to incident service - get workflow"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.INCIDENT_SERVICE_URL}/incidents/{incident_id}/workflow",
-            params={"project_id": user["project_id"]},
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Request failed')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.get(
+        f"{settings.INCIDENT_SERVICE_URL}/incidents/{incident_id}/workflow",
+        params={"project_id": user["project_id"]}
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Request failed')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 @router.get("/incidents/{incident_id}/metrics")
 async def get_incident_metrics(
     incident_id: str,
-    user=Depends(get_current_user_from_token)
+    user=Depends(require_user)
 ):
     """Proxy to incident service - get metrics"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.INCIDENT_SERVICE_URL}/incidents/{incident_id}/metrics",
-            params={"project_id": user["project_id"]},
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Request failed')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.get(
+        f"{settings.INCIDENT_SERVICE_URL}/incidents/{incident_id}/metrics",
+        params={"project_id": user["project_id"]}
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Request failed')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 # Analytics endpoints
 @router.get("/analytics/token-usage")
 async def get_analytics_token_usage(
-    user=Depends(get_current_user_from_token)
+    user=Depends(require_user)
 ):
     """Proxy to AI service - get token usage analytics"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.AI_SERVICE_URL}/analytics/token-usage",
-            params={"project_id": user["project_id"]},
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Request failed')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.get(
+        f"{settings.AI_SERVICE_URL}/analytics/token-usage",
+        params={"project_id": user["project_id"]}
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Request failed')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 @router.get("/analytics/cost-summary")
 async def get_analytics_cost_summary(
     days: int = 7,
-    user=Depends(get_current_user_from_token)
+    user=Depends(require_user)
 ):
     """Proxy to AI service - get cost summary analytics"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.AI_SERVICE_URL}/analytics/cost-summary",
-            params={"days": days, "project_id": user["project_id"]},
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Request failed')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.get(
+        f"{settings.AI_SERVICE_URL}/analytics/cost-summary",
+        params={"days": days, "project_id": user["project_id"]}
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Request failed')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 @router.get("/analytics/incident-metrics/{incident_id}")
 async def get_analytics_incident_metrics(
     incident_id: str,
-    user=Depends(get_current_user_from_token)
+    user=Depends(require_user)
 ):
     """Proxy to AI service - get incident-specific analytics"""
-    if not user:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.AI_SERVICE_URL}/analytics/incident-metrics/{incident_id}",
-            params={"project_id": user["project_id"]},
-            headers=get_internal_headers()
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Request failed')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.get(
+        f"{settings.AI_SERVICE_URL}/analytics/incident-metrics/{incident_id}",
+        params={"project_id": user["project_id"]}
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Request failed')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 # Monitoring Integration endpoints
@@ -832,16 +822,16 @@ async def list_monitoring_integrations(
     if not token:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/monitoring/integrations",
-            headers={"Authorization": f"Bearer {token}"},
-            cookies=request.cookies
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Failed to list integrations')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.get(
+        f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/monitoring/integrations",
+        headers={"Authorization": f"Bearer {token}"},
+        cookies=request.cookies
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Failed to list integrations')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 @router.post("/projects/{project_id}/monitoring/integrations")
@@ -866,17 +856,17 @@ async def create_monitoring_integration(
 
     body = await request.json()
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/monitoring/integrations",
-            json=body,
-            headers={"Authorization": f"Bearer {token}"},
-            cookies=request.cookies
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Failed to create integration')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.post(
+        f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/monitoring/integrations",
+        json=body,
+        headers={"Authorization": f"Bearer {token}"},
+        cookies=request.cookies
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Failed to create integration')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 @router.get("/projects/{project_id}/monitoring/integrations/{integration_id}")
@@ -900,16 +890,16 @@ async def get_monitoring_integration(
     if not token:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/monitoring/integrations/{integration_id}",
-            headers={"Authorization": f"Bearer {token}"},
-            cookies=request.cookies
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Failed to get integration')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.get(
+        f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/monitoring/integrations/{integration_id}",
+        headers={"Authorization": f"Bearer {token}"},
+        cookies=request.cookies
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Failed to get integration')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 @router.patch("/projects/{project_id}/monitoring/integrations/{integration_id}")
@@ -935,17 +925,17 @@ async def update_monitoring_integration(
 
     body = await request.json()
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.patch(
-            f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/monitoring/integrations/{integration_id}",
-            json=body,
-            headers={"Authorization": f"Bearer {token}"},
-            cookies=request.cookies
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Failed to update integration')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.patch(
+        f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/monitoring/integrations/{integration_id}",
+        json=body,
+        headers={"Authorization": f"Bearer {token}"},
+        cookies=request.cookies
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Failed to update integration')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 @router.delete("/projects/{project_id}/monitoring/integrations/{integration_id}")
@@ -969,16 +959,16 @@ async def delete_monitoring_integration(
     if not token:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.delete(
-            f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/monitoring/integrations/{integration_id}",
-            headers={"Authorization": f"Bearer {token}"},
-            cookies=request.cookies
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Failed to delete integration')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.delete(
+        f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/monitoring/integrations/{integration_id}",
+        headers={"Authorization": f"Bearer {token}"},
+        cookies=request.cookies
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Failed to delete integration')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 @router.post("/projects/{project_id}/monitoring/integrations/test-connection")
@@ -1003,17 +993,17 @@ async def test_monitoring_connection(
 
     body = await request.json()
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/monitoring/integrations/test-connection",
-            json=body,
-            headers={"Authorization": f"Bearer {token}"},
-            cookies=request.cookies
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Connection test failed')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.post(
+        f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/monitoring/integrations/test-connection",
+        json=body,
+        headers={"Authorization": f"Bearer {token}"},
+        cookies=request.cookies
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Connection test failed')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 @router.post("/projects/{project_id}/monitoring/integrations/{integration_id}/test")
@@ -1037,16 +1027,16 @@ async def test_existing_monitoring_integration(
     if not token:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.post(
-            f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/monitoring/integrations/{integration_id}/test",
-            headers={"Authorization": f"Bearer {token}"},
-            cookies=request.cookies
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Connection test failed')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.post(
+        f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/monitoring/integrations/{integration_id}/test",
+        headers={"Authorization": f"Bearer {token}"},
+        cookies=request.cookies
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Connection test failed')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
 
 
 @router.get("/projects/{project_id}/monitoring/alerts")
@@ -1069,13 +1059,13 @@ async def list_monitoring_alerts(
     if not token:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
-    async with httpx.AsyncClient(timeout=settings.SERVICE_TIMEOUT) as client:
-        response = await client.get(
-            f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/monitoring/alerts",
-            headers={"Authorization": f"Bearer {token}"},
-            cookies=request.cookies
-        )
-        if response.status_code != 200:
-            error_message = get_error_message(response, 'Failed to list alerts')
-            raise HTTPException(status_code=response.status_code, detail=error_message)
-        return response.json()
+    client = get_http()
+    response = await client.get(
+        f"{settings.AUTH_SERVICE_URL}/projects/{project_id}/monitoring/alerts",
+        headers={"Authorization": f"Bearer {token}"},
+        cookies=request.cookies
+    )
+    if response.status_code != 200:
+        error_message = get_error_message(response, 'Failed to list alerts')
+        raise HTTPException(status_code=response.status_code, detail=error_message)
+    return response.json()
@@ -48,6 +48,10 @@ class Settings(BaseSettings):
     # Timeouts
     SERVICE_TIMEOUT: int = 30
 
+    # Seconds a verified JWT is trusted before auth-service is asked again
+    # (never past the token's own expiry); 0 disables the cache
+    TOKEN_CACHE_TTL_SECONDS: int = 60
+
     # Internal service auth (shared secret for gateway-to-backend requests)
     INTERNAL_SERVICE_KEY: str = ""
 
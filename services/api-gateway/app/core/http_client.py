@@ -0,0 +1,64 @@
+"""
+Shared HTTP client for gateway-to-backend requests
+"""
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Dict, Mapping, Optional
+
+import httpx
+
+from app.core.config import settings
+
+# One pooled client per process so keep-alive connections to the backend
+# services are reused instead of re-dialed on every proxied request.
+_http: Optional[httpx.AsyncClient] = None
+
+# Incoming headers relayed to backends so traces and request ids stitch
+# across the gateway hop. An explicit allowlist keeps clients from
+# overriding the internal service headers.
+TRACE_HEADERS = ("traceparent", "tracestate", "x-request-id")
+
+
+def get_internal_headers() -> dict:
+    """Get headers for internal service-to-service requests"""
+    headers = {}
+    if settings.INTERNAL_SERVICE_KEY:
+        headers["X-Internal-Service-Key"] = settings.INTERNAL_SERVICE_KEY
+    return headers
+
+
+def trace_headers(request_headers: Mapping[str, str]) -> Dict[str, str]:
+    """Pick the allowlisted trace/correlation headers out of an incoming request"""
+    return {name: value for name in TRACE_HEADERS if (value := request_headers.get(name)) is not None}
+
+
+def get_http() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client, creating it on first use.
+
+    The internal service headers are set once as client defaults, so calls
+    made through it only pass per-request headers.
+    """
+    global _http
+    if _http is None:
+        _http = httpx.AsyncClient(
+            headers=get_internal_headers(),
+            # The client is shared by every user's requests, so it must never
+            # keep cookies a backend sets (e.g. the auth-service login tokens)
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+            timeout=settings.SERVICE_TIMEOUT,
+            # Connection-level retries: only failed connects are retried, so
+            # this is safe for non-idempotent requests too
+            transport=httpx.AsyncHTTPTransport(
+                retries=2,
+                limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+            ),
+        )
+    return _http
+
+
+async def close_http():
+    """Close the shared HTTP client"""
+    global _http
+    if _http is not None:
+        await _http.aclose()
+        _http = None
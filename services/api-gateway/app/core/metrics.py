@@ -0,0 +1,32 @@
+"""
+Gateway-specific Prometheus metrics
+
+Registered on the default prometheus_client registry, so they are served by
+the Instrumentator's /metrics endpoint alongside the HTTP metrics. When
+prometheus is not installed every metric is None and callers skip recording.
+"""
+try:
+    from prometheus_client import Counter, Histogram
+except ImportError:  # prometheus not installed
+    Counter = Histogram = None
+
+RESPONSE_CACHE_HITS = Counter(
+    "gateway_response_cache_hits_total",
+    "Proxied GET requests served from the gateway response cache",
+    ["route"],
+) if Counter else None
+
+RESPONSE_CACHE_MISSES = Counter(
+    "gateway_response_cache_misses_total",
+    "Cacheable proxied GET requests that went upstream",
+    ["route"],
+) if Counter else None
+
+# Labelled by upstream settings attribute and gateway route template, so slow
+# backends and slow routes can be told apart from gateway overhead
+UPSTREAM_LATENCY = Histogram(
+    "gateway_upstream_seconds",
+    "Time spent waiting on backend services for proxied requests",
+    ["upstream", "route", "method", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2, 5),
+) if Histogram else None
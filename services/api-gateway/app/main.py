@@ -7,7 +7,7 @@ import sys
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 import httpx
 
 logger = logging.getLogger(__name__)
@@ -21,6 +21,7 @@ setup_django()
 
 from app.api import health, proxy, observability_proxy, ingest_proxy, settings_api, grafana_proxy
 from app.core.config import settings
+from app.core.http_client import close_http
 from app.middleware.encryption_middleware import EncryptionMiddleware, RateLimitMiddleware
 from shared.utils.responses import install_validation_handler
 
@@ -28,7 +29,8 @@ from shared.utils.responses import install_validation_handler
 app = FastAPI(
     title="SRE Copilot API Gateway",
     description="Main API Gateway for SRE Copilot microservices",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add rate limiting middleware
@@ -197,6 +199,7 @@ async def startup_event():
 async def shutdown_event():
     """Shutdown event"""
     logger.info("API Gateway shutting down")
+    await close_http()
 
 
 @app.get("/")
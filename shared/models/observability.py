@@ -27,6 +27,7 @@ class MetricDataPoint(models.Model):
         db_table = 'obs_metric_data_points'
         indexes = [
             models.Index(fields=['project', 'service_name', 'metric_name', 'timestamp']),
+            models.Index(fields=['project', 'metric_name', 'timestamp']),
             models.Index(fields=['project', 'timestamp']),
         ]
         ordering = ['-timestamp']
@@ -331,6 +332,7 @@ class AlertCondition(models.Model):
         db_table = 'obs_alert_conditions'
         indexes = [
             models.Index(fields=['project', 'is_enabled']),
+            models.Index(fields=['project', 'service_name']),
         ]
         ordering = ['-created_at']
 
@@ -396,6 +398,14 @@ class ActiveAlert(models.Model):
         indexes = [
             models.Index(fields=['project', 'status']),
         ]
+        constraints = [
+            # At most one firing alert per condition, even with several evaluators
+            models.UniqueConstraint(
+                fields=['condition'],
+                condition=models.Q(status='firing'),
+                name='uniq_firing_alert_per_condition',
+            ),
+        ]
         ordering = ['-fired_at']
 
 
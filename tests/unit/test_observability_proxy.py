@@ -0,0 +1,283 @@
+"""
+Unit tests for the API gateway observability proxy
+"""
+import asyncio
+
+import pytest
+import httpx
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Import gateway modules
+import sys
+sys.path.insert(0, ".")
+sys.path.insert(0, "services/api-gateway")
+from app.core import http_client
+from app.core.config import settings
+from app.api import observability_proxy, proxy
+
+PROJECT_ID = "11111111-1111-1111-1111-111111111111"
+
+# Sample value for every path param used in PROXY_ROUTES
+PATH_PARAM_VALUES = {
+    "service_name": "checkout",
+    "trace_id": "abc123",
+    "fingerprint": "fp-1",
+    "hostname": "host-1",
+    "deployment_id": "dep-1",
+    "slo_id": "slo-1",
+    "monitor_id": "mon-1",
+    "vuln_id": "vuln-1",
+    "dashboard_id": "dash-1",
+    "connection_id": "conn-1",
+}
+
+# Upstream query params per route query mode for a client query of
+# ?limit=5&project_id=other-project
+EXPECTED_QUERY = {
+    observability_proxy._QUERY: [("limit", "5"), ("project_id", PROJECT_ID)],
+    observability_proxy._PROJECT: [("project_id", PROJECT_ID)],
+    observability_proxy._PASSTHROUGH: [("limit", "5"), ("project_id", "other-project")],
+    None: [],
+}
+
+
+class MockUpstream:
+    """Backend stand-in that records requests and answers with a fixed status"""
+
+    def __init__(self):
+        self.requests = []
+        self.status = 200
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(self.status, json={"ok": True})
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Mock upstream installed as the gateway's shared HTTP client"""
+    mock = MockUpstream()
+    monkeypatch.setattr(http_client, "_http", httpx.AsyncClient(transport=httpx.MockTransport(mock.handle)))
+    observability_proxy._response_cache.clear()
+    observability_proxy._response_fetches.clear()
+    return mock
+
+
+@pytest.fixture
+def upstream_requests(upstream):
+    """Requests the gateway sent upstream"""
+    return upstream.requests
+
+
+@pytest.fixture
+def app(upstream):
+    """Observability router app with an authenticated user"""
+    app = FastAPI()
+    app.include_router(observability_proxy.router, prefix="/api/v1")
+
+    async def fake_user():
+        return {"user_id": "user-1", "project_id": PROJECT_ID}
+
+    app.dependency_overrides[proxy.get_current_user_from_token] = fake_user
+    return app
+
+
+@pytest.fixture
+def client(app):
+    """Test client for the observability router"""
+    return TestClient(app)
+
+
+def _route_case(row):
+    """pytest param for one PROXY_ROUTES row, with "METHOD /path" as its id"""
+    return pytest.param(row, id=f"{row[0]} {row[1]}")
+
+
+class TestProxyRoutes:
+    """Test every PROXY_ROUTES row against a mock upstream"""
+
+    @pytest.mark.parametrize("row", [_route_case(row) for row in observability_proxy.PROXY_ROUTES])
+    def test_should_forward_route_to_upstream(self, client, upstream, row):
+        """Method, URL, query params and body reach the upstream; its status and body are relayed"""
+        method, path, upstream_attr, upstream_path, query, forward_body, ok_statuses = row
+        upstream.status = ok_statuses[-1]
+        body = b'{"name": "x"}'
+
+        response = client.request(
+            method,
+            "/api/v1" + path.format_map(PATH_PARAM_VALUES),
+            params=[("limit", "5"), ("project_id", "other-project")],
+            content=body,
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == ok_statuses[-1]
+        assert response.json() == {"ok": True}
+        sent = upstream.requests[0]
+        assert sent.method == method
+        assert str(sent.url.copy_with(query=None)) == (
+            getattr(settings, upstream_attr) + upstream_path.format_map(PATH_PARAM_VALUES)
+        )
+        assert sent.url.params.multi_items() == EXPECTED_QUERY[query]
+        assert sent.content == (body if forward_body else b"")
+
+    @pytest.mark.parametrize("row", [_route_case(row) for row in observability_proxy.PROXY_ROUTES])
+    def test_should_relay_upstream_errors(self, client, upstream, row):
+        """Statuses outside the route's accepted ones are relayed with the upstream JSON body"""
+        method, path = row[0], row[1]
+        upstream.status = 409
+
+        response = client.request(method, "/api/v1" + path.format_map(PATH_PARAM_VALUES), json={})
+
+        assert response.status_code == 409
+        assert response.json() == {"ok": True}
+
+
+class TestPathParams:
+    """Test path param substitution into upstream URLs"""
+
+    @pytest.mark.parametrize("service_name", ["checkout%20api", "orders%40v2", "svc%3A8080"])
+    def test_should_forward_percent_encoded_path_params(self, client, upstream_requests, service_name):
+        """Names encoded with encodeURIComponent reach the upstream re-encoded as one segment"""
+        response = client.get(f"/api/v1/metrics/services/{service_name}/overview")
+
+        assert response.status_code == 200
+        assert upstream_requests[0].url.raw_path.decode().split("?")[0] == f"/metrics/services/{service_name}/overview"
+
+    def test_should_encode_reserved_characters_in_path_params(self, client, upstream_requests):
+        """A decoded ? or # in a path param cannot add query params or a fragment upstream"""
+        response = client.get("/api/v1/slos/abc%3Fproject_id%3Dother%23x")
+
+        assert response.status_code == 200
+        assert upstream_requests[0].url.path == "/slos/abc?project_id=other#x"
+        assert upstream_requests[0].url.params.get_list("project_id") == [PROJECT_ID]
+
+    @pytest.mark.parametrize("method, path", [
+        ("GET", "/api/v1/cicd/connections/%2E%2E/runs"),
+        ("GET", "/api/v1/cicd/connections/.%2E/runs"),
+        ("DELETE", "/api/v1/dashboards/%2E%2E"),
+        ("DELETE", "/api/v1/dashboards/%2E"),
+    ])
+    def test_should_reject_dot_segment_path_params(self, client, upstream_requests, method, path):
+        """. and .. are never sent upstream, where they would be resolved as relative segments"""
+        response = client.request(method, path)
+
+        assert response.status_code == 404
+        assert upstream_requests == []
+
+    def test_should_forward_encoded_batch_path_params(self, client, upstream_requests):
+        """Batch entry paths are decoded once and re-encoded for the upstream URL"""
+        response = client.post("/api/v1/observability/batch", json={"requests": [
+            {"id": "a", "path": "/metrics/services/checkout%20api/overview"},
+        ]})
+
+        assert response.status_code == 200
+        assert response.json()["responses"][0]["status"] == 200
+        assert upstream_requests[0].url.raw_path.decode().split("?")[0] == "/metrics/services/checkout%20api/overview"
+
+    @pytest.mark.parametrize("path", ["/cicd/connections/../runs", "/cicd/connections/%2E%2E/runs"])
+    def test_should_reject_dot_segment_batch_path_params(self, client, upstream_requests, path):
+        """A batch entry cannot use .. to reach a different upstream route"""
+        response = client.post("/api/v1/observability/batch", json={"requests": [{"id": "a", "path": path}]})
+
+        assert response.json()["responses"][0]["status"] == 404
+        assert upstream_requests == []
+
+
+class TestResponseCache:
+    """Test the short-lived response cache for slowly-changing GET routes"""
+
+    @pytest.mark.asyncio
+    async def test_should_not_cache_reads_in_flight_during_a_write(self, app, monkeypatch):
+        """A GET that started before a write neither caches its body nor serves later reads"""
+        slos = ["old"]
+        first_read_started, release_first_read = asyncio.Event(), asyncio.Event()
+
+        async def handle(request: httpx.Request) -> httpx.Response:
+            if request.method == "POST":
+                slos.append("new")
+                return httpx.Response(201, json={"ok": True})
+            body = list(slos)
+            if not first_read_started.is_set():
+                first_read_started.set()
+                await release_first_read.wait()
+            return httpx.Response(200, json=body)
+
+        monkeypatch.setattr(http_client, "_http", httpx.AsyncClient(transport=httpx.MockTransport(handle)))
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://gateway") as gateway:
+            first_read = asyncio.ensure_future(gateway.get("/api/v1/slos"))
+            await first_read_started.wait()
+            assert (await gateway.post("/api/v1/slos", json={"name": "new"})).status_code == 201
+
+            second_read = asyncio.ensure_future(gateway.get("/api/v1/slos"))
+            await asyncio.sleep(0.01)
+            release_first_read.set()
+
+            assert (await first_read).json() == ["old"]
+            assert (await second_read).json() == ["old", "new"]
+            assert (await gateway.get("/api/v1/slos")).json() == ["old", "new"]
+
+    def test_should_serve_repeated_reads_from_cache(self, client, upstream_requests):
+        """A cacheable route is fetched upstream once within its TTL"""
+        client.get("/api/v1/slos")
+        client.get("/api/v1/slos")
+
+        assert len(upstream_requests) == 1
+
+    def test_should_not_cache_services_registry(self, client, upstream_requests):
+        """Onboarding polls the registry for new services, which arrive through ingest"""
+        client.get("/api/v1/services/registry")
+        client.get("/api/v1/services/registry")
+
+        assert len(upstream_requests) == 2
+
+    def test_should_invalidate_cache_after_a_write(self, client, upstream_requests):
+        """A successful write through the route table drops the project's cached reads"""
+        client.get("/api/v1/slos")
+        client.post("/api/v1/slos", json={"name": "new"})
+        client.get("/api/v1/slos")
+
+        assert [request.method for request in upstream_requests] == ["GET", "POST", "GET"]
+
+
+class TestBatch:
+    """Test the batch proxy endpoint"""
+
+    def test_should_serve_batch_entries_from_response_cache(self, client, upstream_requests):
+        """A cacheable route fetched directly is not fetched again by a batch entry"""
+        client.get("/api/v1/slos")
+        response = client.post("/api/v1/observability/batch", json={"requests": [{"id": "a", "path": "/slos"}]})
+
+        assert response.json()["responses"] == [{"id": "a", "status": 200, "body": {"ok": True}}]
+        assert len(upstream_requests) == 1
+
+    def test_should_coalesce_identical_batch_entries(self, client, upstream_requests):
+        """Concurrent entries for the same cacheable route share one upstream call"""
+        response = client.post("/api/v1/observability/batch", json={"requests": [
+            {"id": "a", "path": "/slos"},
+            {"id": "b", "path": "/slos"},
+        ]})
+
+        assert [entry["status"] for entry in response.json()["responses"]] == [200, 200]
+        assert len(upstream_requests) == 1
+
+    def test_should_refresh_cached_batch_entries_on_no_cache(self, client, upstream_requests):
+        """Cache-Control: no-cache on the batch request bypasses cached bodies"""
+        client.get("/api/v1/slos")
+        client.post(
+            "/api/v1/observability/batch",
+            json={"requests": [{"id": "a", "path": "/slos"}]},
+            headers={"Cache-Control": "no-cache"},
+        )
+
+        assert len(upstream_requests) == 2
+
+    def test_should_reject_oversized_batches(self, client, upstream_requests):
+        """Batches are capped since one batch costs a single rate-limit token"""
+        entries = [{"id": str(i), "path": "/slos"} for i in range(observability_proxy.BATCH_MAX_REQUESTS + 1)]
+        response = client.post("/api/v1/observability/batch", json={"requests": entries})
+
+        assert response.status_code == 422
+        assert upstream_requests == []
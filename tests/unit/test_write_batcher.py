@@ -0,0 +1,124 @@
+"""
+Unit tests for the alerting-service WriteBatcher
+"""
+import asyncio
+
+import pytest
+
+# Import write batcher
+import sys
+sys.path.insert(0, "services/alerting-service")
+from app.services.write_batcher import DEFAULT_MAX_BATCH_SIZE, WriteBatcher
+
+
+class FakeManager:
+    """Stand-in for ``Model.objects`` recording each bulk insert"""
+
+    def __init__(self):
+        self.bulk_calls = []
+        self.fail_bulk = False
+
+    async def abulk_create(self, objs):
+        self.bulk_calls.append(list(objs))
+        if self.fail_bulk:
+            raise ValueError("bulk insert failed")
+        return objs
+
+
+class FakeRow:
+    """Unsaved model instance; rows marked bad fail their own insert"""
+
+    def __init__(self, name, bad=False):
+        self.name = name
+        self.bad = bad
+        self.saved = False
+
+    async def asave(self, force_insert=False):
+        if self.bad:
+            raise ValueError(f"bad row {self.name}")
+        self.saved = True
+
+
+@pytest.fixture
+def model():
+    """Fresh fake model class with its own manager"""
+    return type("FakeModel", (), {"objects": FakeManager()})
+
+
+class TestWriteBatcher:
+    """Test WriteBatcher batching and failure handling"""
+
+    @pytest.mark.asyncio
+    async def test_should_collapse_concurrent_submits_into_one_bulk_create(self, model):
+        """Rows submitted together are written with a single abulk_create"""
+        batcher = WriteBatcher(model)
+        rows = [FakeRow(i) for i in range(10)]
+
+        results = await asyncio.gather(*[batcher.submit(row) for row in rows])
+
+        assert results == rows
+        assert model.objects.bulk_calls == [rows]
+
+    @pytest.mark.asyncio
+    async def test_should_split_batches_at_max_batch_size(self, model):
+        """A burst larger than max_batch_size is flushed in 64-row batches"""
+        batcher = WriteBatcher(model, max_wait_seconds=0.05)
+        rows = [FakeRow(i) for i in range(2 * DEFAULT_MAX_BATCH_SIZE + 2)]
+
+        await asyncio.gather(*[batcher.submit(row) for row in rows])
+
+        assert DEFAULT_MAX_BATCH_SIZE == 64
+        assert [len(call) for call in model.objects.bulk_calls] == [64, 64, 2]
+
+    @pytest.mark.asyncio
+    async def test_should_flush_after_max_wait(self, model):
+        """A lone row is written after the 5ms wait instead of waiting for a full batch"""
+        batcher = WriteBatcher(model)
+
+        first = await asyncio.wait_for(batcher.submit(FakeRow("a")), timeout=1)
+        await asyncio.sleep(0.05)
+        second = await asyncio.wait_for(batcher.submit(FakeRow("b")), timeout=1)
+
+        assert batcher.max_wait_seconds == 0.005
+        assert [[row.name for row in call] for call in model.objects.bulk_calls] == [["a"], ["b"]]
+        assert (first.name, second.name) == ("a", "b")
+
+    @pytest.mark.asyncio
+    async def test_should_fall_back_to_row_inserts_when_bulk_fails(self, model):
+        """Only the bad row's submit raises; the rest of its batch is still saved"""
+        model.objects.fail_bulk = True
+        batcher = WriteBatcher(model)
+        good, bad, other = FakeRow("good"), FakeRow("bad", bad=True), FakeRow("other")
+
+        results = await asyncio.gather(
+            batcher.submit(good), batcher.submit(bad), batcher.submit(other), return_exceptions=True,
+        )
+
+        assert results[0] is good and results[2] is other
+        assert isinstance(results[1], ValueError)
+        assert good.saved and other.saved and not bad.saved
+        assert len(model.objects.bulk_calls) == 1
+
+    def test_should_restart_drain_task_on_new_event_loop(self, model):
+        """A batcher shared across event loops starts a new drain task on each"""
+        batcher = WriteBatcher(model)
+
+        asyncio.run(batcher.submit(FakeRow("a")))
+        first_task = batcher._task
+        asyncio.run(batcher.submit(FakeRow("b")))
+
+        assert batcher._task is not first_task
+        assert len(model.objects.bulk_calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_should_restart_drain_task_after_it_stops(self, model):
+        """Submits after the drain task was cancelled still get written"""
+        batcher = WriteBatcher(model)
+        await batcher.submit(FakeRow("a"))
+        batcher._task.cancel()
+        await asyncio.sleep(0)
+
+        row = await asyncio.wait_for(batcher.submit(FakeRow("b")), timeout=1)
+
+        assert row.name == "b"
+        assert len(model.objects.bulk_calls) == 2